@@ -1,14 +1,23 @@
+import time
+import json
+import asyncio
+import hashlib
 import logging
-from typing import List, Any, Dict, Coroutine, Optional, AsyncIterable
+from contextlib import nullcontext
+from typing import List, Any, Dict, Coroutine, Optional, AsyncIterable, Tuple
 from app.domain.repository.item_sql_repository import IItemSqlRepository
+from app.domain.repository.cache_repository import ICacheRepository
 
 from app.domain.repository.content_safety_repository import IContentSafetyRepository
 from app.domain.repository.ai_project_repository import IAiProjectRepository
 from app.domain.agent_core.service import IAgentCore, IBaseAgentFactory
+from app.application.services.conversation_coordinator import ConversationLockRegistry, RequestCoalescer
+from app.application.services.semantic_cache_manager import SemanticCacheManager
 
-from app.domain.contants import DecisionAction
+from app.domain.contants import DecisionAction, GuardMode
 from app.domain.exceptions import ThreadNotFound, GuardialError
-from app.domain.utils import get_metadata_from_uri
+from app.domain.parsing import parse_key_values
+from app.domain.utils import get_metadata_from_uri, normalize_text, generate_uuid
 
 from agent_framework import (
     ChatAgent, AgentRunResponse, AgentRunResponseUpdate,
@@ -16,6 +25,7 @@ from agent_framework import (
     )
 
 from app.config import get_settings
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +36,30 @@ class AgentManager:
     def __init__(
                 self,
                 agent_core: IAiProjectRepository,
-                content_safety_repository: IContentSafetyRepository
+                content_safety_repository: IContentSafetyRepository,
+                verdict_cache: Optional[ICacheRepository] = None,
+                conversation_locks: Optional[ConversationLockRegistry] = None,
+                request_coalescer: Optional[RequestCoalescer] = None,
+                semantic_cache: Optional[SemanticCacheManager] = None,
+                metrics_repository: Optional[IMetricsRepository] = None
                 ) -> None:
         settings = get_settings()
 
         self.content_safety_repository = content_safety_repository
+        self.verdict_cache = verdict_cache
+        self.conversation_locks = conversation_locks
+        self.request_coalescer = request_coalescer
+        self.semantic_cache = semantic_cache
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
         self.agent_core =  agent_core
         self.agent_name = "simple-knownledge-base-agent"
         self.agent_version = ""
         self.agent_information = (self.agent_name, self.agent_version)
+        self.reject_thresholds = parse_key_values(settings.content_safety_reject_thresholds, int)
+        self.blocklist_names = [
+            blocklist_name.strip() for blocklist_name in (settings.content_safety_blocklists or "").split(",")
+            if blocklist_name.strip()
+        ]
 
     def prepare_content(
                     self, message: str, additional_files: Optional[List[str]] = []
@@ -42,24 +67,224 @@ class AgentManager:
         
         return self.agent_core.format_user_input(message, additional_files)
 
-    async def generate_stream_content(self, message: str, additional_files: Optional[List[str]] = [], 
-                                      conversation_id: str = "") -> AsyncIterable[AgentRunResponseUpdate]:
+    def hold_conversation(self, conversation_id: str) -> Any:
+        if self.conversation_locks is None or not conversation_id:
+            return nullcontext()
+        return self.conversation_locks.hold(conversation_id)
+
+    async def request_stream_content(self, message: str, additional_files: Optional[List[str]] = [],
+                                     conversation_id: str = "") -> AsyncIterable[AgentRunResponseUpdate]:
         content = self.prepare_content(message, additional_files)
-        stream_response = self.agent_core.stream_chat(conversation_id, content, self.agent_information)
-        async for event in stream_response:
-            yield event
-    
-    async def generate_content(self, message: str, additional_files: Optional[List[str]] = [], conversation_id: str = "") -> Any:
+        async with self.hold_conversation(conversation_id):
+            stream_response = self.agent_core.stream_chat(conversation_id, content, self.agent_information)
+            try:
+                async for event in stream_response:
+                    yield event
+            finally:
+                await stream_response.aclose()
+
+    def generate_stream_content(self, message: str, additional_files: Optional[List[str]] = [],
+                                conversation_id: str = "", idempotency_key: Optional[str] = None
+                                ) -> AsyncIterable[AgentRunResponseUpdate]:
+        if self.request_coalescer is None:
+            return self.request_stream_content(message, additional_files, conversation_id)
+
+        return self.request_coalescer.stream(
+            self.request_coalescer.build_key(conversation_id, message, additional_files, idempotency_key),
+            lambda: self.request_stream_content(message, additional_files, conversation_id)
+        )
+
+    async def request_content(self, message: str, additional_files: Optional[List[str]] = [], conversation_id: str = "") -> Any:
         content = self.prepare_content(message, additional_files)
-        agent_response = await self.agent_core.chat(conversation_id, content, self.agent_information)
-        return agent_response
+        async with self.hold_conversation(conversation_id):
+            return await self.agent_core.chat(conversation_id, content, self.agent_information)
+
+    async def generate_content(self, message: str, additional_files: Optional[List[str]] = [], conversation_id: str = "",
+                               idempotency_key: Optional[str] = None) -> Any:
+        if self.semantic_cache is None or additional_files or await self.has_conversation_context(conversation_id):
+            return await self.generate_coalesced_content(message, additional_files, conversation_id, idempotency_key)
+
+        return await self.semantic_cache.get_or_generate(
+            message,
+            lambda: self.generate_coalesced_content(message, additional_files, conversation_id, idempotency_key),
+            lambda cached_response: self.replay_cached_content(message, conversation_id, cached_response)
+        )
+
+    async def has_conversation_context(self, conversation_id: str) -> bool:
+        if not conversation_id:
+            return False
+
+        try:
+            has_context = await self.agent_core.has_conversation_items(conversation_id)
+        except Exception as e:
+            logger.warning("Conversation %s history unavailable, bypassing semantic cache: %s", conversation_id, e)
+            return True
+
+        if has_context:
+            self.metrics_repository.increment("semantic_cache_context_bypasses")
+        return has_context
+
+    async def replay_cached_content(self, message: str, conversation_id: str, cached_response: Any) -> Any:
+        message_id = str(generate_uuid())
+        if conversation_id:
+            async with self.hold_conversation(conversation_id):
+                created_items = await self.agent_core.append_conversation_turn(
+                    conversation_id, self.prepare_content(message), cached_response.output[-1].content[-1].text
+                )
+            message_id = created_items[-1].id
+
+        update = {"id": message_id}
+        if cached_response.usage is not None:
+            update["usage"] = cached_response.usage.model_copy(update={"input_tokens": 0, "output_tokens": 0, "total_tokens": 0})
+        return cached_response.model_copy(update=update)
+
+    async def generate_coalesced_content(self, message: str, additional_files: Optional[List[str]] = [],
+                                         conversation_id: str = "", idempotency_key: Optional[str] = None) -> Any:
+        if self.request_coalescer is None:
+            return await self.request_content(message, additional_files, conversation_id)
+
+        return await self.request_coalescer.run(
+            self.request_coalescer.build_key(conversation_id, message, additional_files, idempotency_key),
+            lambda: self.request_content(message, additional_files, conversation_id)
+        )
     
-    async def apply_guardial(self, message: str, reject_thresholds: Dict[str, Any], blocklist_names: Optional[List[str]] = []) -> None:
-        analysis_result = await self.content_safety_repository.analyze_text(message, blocklist_names)
+    @staticmethod
+    def get_category_name(category: Any) -> str:
+        return str(getattr(category, "value", category))
+
+    @classmethod
+    def normalize_thresholds_results(cls, thresholds_results: Dict[Any, Any]) -> Dict[str, Any]:
+        return {cls.get_category_name(category): action for category, action in thresholds_results.items()}
+
+    @classmethod
+    def build_verdict_key(cls, message: str, reject_thresholds: Dict[str, Any], blocklist_names: Optional[List[str]] = []) -> str:
+        verdict_input = json.dumps(
+            {
+                "text": normalize_text(message),
+                "blocklists": sorted(blocklist_names or []),
+                "thresholds": sorted(cls.normalize_thresholds_results(reject_thresholds).items())
+            },
+            ensure_ascii=False
+        )
+        return hashlib.sha256(verdict_input.encode("utf-8")).hexdigest()
+
+    async def get_verdict(self, message: str, reject_thresholds: Dict[str, Any], blocklist_names: Optional[List[str]] = []) -> Tuple[DecisionAction, Dict[str, Any]]:
+        verdict_key = None
+        if self.verdict_cache is not None:
+            verdict_key = self.build_verdict_key(message, reject_thresholds, blocklist_names)
+            cached_verdict = await self.verdict_cache.get(verdict_key)
+            if cached_verdict is not None:
+                self.metrics_repository.increment("content_safety_saved_latency_ms", self.metrics_repository.average("content_safety_latency_ms"))
+                return DecisionAction(cached_verdict["decision"]), self.normalize_thresholds_results(cached_verdict["thresholds_results"])
+
+        start_time = time.perf_counter()
+        analysis_result = await self.content_safety_repository.analyze_text(message, blocklist_names, reject_thresholds)
         decision, thresholds_results = self.content_safety_repository.make_decision(analysis_result, reject_thresholds)
+        thresholds_results = self.normalize_thresholds_results(thresholds_results)
+        self.metrics_repository.record("content_safety_latency_ms", (time.perf_counter() - start_time) * 1000)
+
+        if verdict_key is not None:
+            await self.verdict_cache.set(
+                verdict_key, {"decision": decision.value, "thresholds_results": thresholds_results}
+            )
 
-        print(f"Content Safety Analysis -> Decicion: {decision} results: {thresholds_results}")
+        return decision, thresholds_results
+
+    async def apply_guardial(self, message: str, reject_thresholds: Dict[str, Any], blocklist_names: Optional[List[str]] = []) -> None:
+        decision, thresholds_results = await self.get_verdict(message, reject_thresholds, blocklist_names)
+
+        logger.info("Content safety analysis -> decision: %s results: %s", decision, thresholds_results)
 
         if decision == DecisionAction.REJECT:
+            self.metrics_repository.increment("content_safety_rejections")
             raise GuardialError(message, thresholds_results)
+
+    def start_guardial(self, message: str) -> asyncio.Task:
+        return asyncio.create_task(self.apply_guardial(message, self.reject_thresholds, self.blocklist_names))
+
+    async def generate_guarded_content(
+        self, message: str, additional_files: Optional[List[str]] = [], conversation_id: str = "",
+        guard_mode: Optional[GuardMode] = GuardMode.OFF, idempotency_key: Optional[str] = None
+    ) -> Any:
+        if guard_mode == GuardMode.OFF:
+            return await self.generate_content(message, additional_files, conversation_id, idempotency_key)
+
+        if guard_mode == GuardMode.SEQUENTIAL:
+            await self.apply_guardial(message, self.reject_thresholds, self.blocklist_names)
+            return await self.generate_content(message, additional_files, conversation_id, idempotency_key)
+
+        guardial = self.start_guardial(message)
+        generation = asyncio.create_task(self.generate_content(message, additional_files, conversation_id, idempotency_key))
+        try:
+            await guardial
+        except BaseException:
+            generation.cancel()
+            await asyncio.gather(generation, return_exceptions=True)
+            raise
+
+        return await generation
+
+    async def generate_guarded_stream_content(
+        self, message: str, additional_files: Optional[List[str]] = [], conversation_id: str = "",
+        guard_mode: Optional[GuardMode] = GuardMode.OFF, idempotency_key: Optional[str] = None
+    ) -> AsyncIterable[str]:
+        if guard_mode == GuardMode.SEQUENTIAL:
+            await self.apply_guardial(message, self.reject_thresholds, self.blocklist_names)
+
+        stream_response = self.generate_stream_content(message, additional_files, conversation_id, idempotency_key)
+        if guard_mode != GuardMode.OVERLAPPED:
+            try:
+                async for delta in stream_response:
+                    yield delta
+            finally:
+                await stream_response.aclose()
+            return
+
+        guardial = self.start_guardial(message)
+        held_deltas: List[str] = []
+        next_delta: Optional[asyncio.Future] = None
+        exhausted = False
+
+        try:
+            while not guardial.done():
+                if next_delta is None:
+                    next_delta = asyncio.ensure_future(stream_response.__anext__())
+
+                await asyncio.wait({guardial, next_delta}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_delta.done():
+                    continue
+
+                try:
+                    held_deltas.append(next_delta.result())
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                finally:
+                    next_delta = None
+
+            await guardial
+            self.metrics_repository.increment("content_safety_held_deltas", len(held_deltas))
+
+            for delta in held_deltas:
+                yield delta
+
+            if exhausted:
+                return
+
+            if next_delta is not None:
+                pending_delta, next_delta = next_delta, None
+                try:
+                    yield await pending_delta
+                except StopAsyncIteration:
+                    return
+
+            async for delta in stream_response:
+                yield delta
+
+        finally:
+            for task in (guardial, next_delta):
+                if task is not None and not task.done():
+                    task.cancel()
+            await asyncio.gather(*(task for task in (guardial, next_delta) if task is not None), return_exceptions=True)
+            await stream_response.aclose()
         
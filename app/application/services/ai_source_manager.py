@@ -1,28 +1,196 @@
-from typing import List, Any
+import asyncio
+import logging
+from typing import AsyncGenerator, List, Any, Optional, Tuple, Union
 from app.domain.repository.document_repository import IDocumentRepository
-from app.domain.repository.storage_repository import IStorageRepository
 from app.domain.repository.ai_project_repository import IAiProjectRepository
+from app.domain.repository.document_manifest_repository import IDocumentManifestRepository
+from app.domain.repository.vector_store_mirror_repository import IVectorStoreMirrorRepository
+from app.domain.document import StoredDocument, VectorStoreFileRecord, VectorStoreFilePage
+from app.domain.utils import get_current_datetime
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 class AiSourceManager:
     def __init__(
                 self,
                 document_repository: IDocumentRepository,
-                ai_repository: IAiProjectRepository                
+                ai_repository: IAiProjectRepository,
+                manifest_repository: Optional[IDocumentManifestRepository] = None,
+                mirror_repository: Optional[IVectorStoreMirrorRepository] = None,
+                metrics_repository: Optional[IMetricsRepository] = None
                 ) -> None:
         self.document_repository = document_repository
         self.ai_repository = ai_repository
+        self.manifest_repository = manifest_repository
+        self.mirror_repository = mirror_repository
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
         self.settigs = get_settings()
         pass
 
-    async def save_document_locally(self, file):
+    @property
+    def vector_store_id(self) -> str:
+        return self.settigs.vector_store_id
+
+    async def save_document_locally(self, file) -> StoredDocument:
         return await self.document_repository.save_document_locally(file)
 
+    async def remove_document_locally(self, file_path: str) -> None:
+        try:
+            await self.document_repository.remove_document_locally(file_path)
+        except OSError as e:
+            logger.warning("Local file %s could not be deleted: %s", file_path, e)
+
+    async def get_vector_store_file_id(self, content_hash: str) -> Optional[str]:
+        if self.manifest_repository is None:
+            return None
+
+        manifest = await self.manifest_repository.get_manifest(content_hash)
+        file_id = manifest.vector_store_file_ids.get(self.settigs.vector_store_id) if manifest is not None else None
+        self.metrics_repository.increment("vector_store_manifest_hits" if file_id else "vector_store_manifest_misses")
+        return file_id
+
+    async def save_vector_store_file_id(self, content_hash: str, file_name: str, file_id: str) -> None:
+        if self.manifest_repository is not None:
+            await self.manifest_repository.save_vector_store_file(content_hash, file_name, self.settigs.vector_store_id, file_id)
+
     async def upload_to_vector_store(self, file_path: str) -> str:
         return await self.ai_repository.upload_to_vector_store(self.settigs.vector_store_id, file_path)
 
+    async def upload_file(self, file_path: str) -> str:
+        return await self.ai_repository.upload_file(file_path)
+
+    async def add_file_to_vector_store(self, file_id: str, file_name: str) -> Any:
+        return await self.ai_repository.add_file_to_vector_store(
+            self.settigs.vector_store_id, file_id, {"file_name": file_name}
+        )
+
+    async def get_vector_store_file(self, file_id: str) -> Any:
+        return await self.ai_repository.get_vector_store_file(self.settigs.vector_store_id, file_id)
+
+    async def create_file_batch(self, files: List[Tuple[str, str]]) -> Any:
+        return await self.ai_repository.create_vector_store_file_batch(
+            self.settigs.vector_store_id,
+            [{"file_id": file_id, "attributes": {"file_name": file_name}} for file_id, file_name in files]
+        )
+
+    async def get_file_batch(self, batch_id: str) -> Any:
+        return await self.ai_repository.get_vector_store_file_batch(self.settigs.vector_store_id, batch_id)
+
+    async def get_file_batch_files(self, batch_id: str) -> List[Any]:
+        return await self.ai_repository.get_vector_store_file_batch_files(self.settigs.vector_store_id, batch_id)
+
+    async def get_vector_store_version(self) -> str:
+        vector_store = await self.ai_repository.get_vector_store(self.settigs.vector_store_id)
+        file_counts = vector_store.file_counts
+        return f"{vector_store.id}:{file_counts.completed}:{file_counts.total}:{vector_store.usage_bytes}"
+
     async def get_files_from_vector_store(self) -> List[Any]:
         return await self.ai_repository.get_files_from_vector_store(self.settigs.vector_store_id)
 
+    def to_file_record(self, vector_store_file: Any, file_name: Optional[str] = None) -> VectorStoreFileRecord:
+        return VectorStoreFileRecord(
+            vector_store_id=self.settigs.vector_store_id,
+            vector_store_file_id=vector_store_file.id,
+            file_name=(getattr(vector_store_file, "attributes", None) or {}).get("file_name", file_name),
+            status=getattr(vector_store_file, "status", None),
+            created_at=vector_store_file.created_at,
+            usage_bytes=getattr(vector_store_file, "usage_bytes", None)
+        )
+
+    async def list_files(self, after: Optional[str] = None, limit: Optional[int] = 20,
+                         file_name: Optional[str] = None) -> VectorStoreFilePage:
+        if self.mirror_repository is not None:
+            records = await self.mirror_repository.list_files(self.settigs.vector_store_id, after, limit + 1, file_name)
+            has_more = len(records) > limit
+            records = records[:limit]
+            return VectorStoreFilePage(
+                data=records, has_more=has_more, next_after=records[-1].vector_store_file_id if has_more else None
+            )
+
+        if file_name:
+            return await self.list_remote_files_by_name(after, limit, file_name)
+
+        files, has_more = await self.ai_repository.list_vector_store_files(self.settigs.vector_store_id, after, limit)
+        return VectorStoreFilePage(
+            data=[self.to_file_record(file) for file in files],
+            has_more=has_more,
+            next_after=files[-1].id if has_more and files else None
+        )
+
+    async def list_remote_files_by_name(self, after: Optional[str], limit: int, file_name: str,
+                                        page_size: Optional[int] = 100) -> VectorStoreFilePage:
+        records, cursor = [], after
+        while len(records) <= limit:
+            files, has_more = await self.ai_repository.list_vector_store_files(self.settigs.vector_store_id, cursor, page_size)
+            records.extend(record for record in map(self.to_file_record, files) if record.file_name == file_name)
+            if not has_more or not files:
+                break
+            cursor = files[-1].id
+
+        has_more = len(records) > limit
+        records = records[:limit]
+        return VectorStoreFilePage(
+            data=records, has_more=has_more, next_after=records[-1].vector_store_file_id if has_more else None
+        )
+
+    async def iter_remote_files(self, page_size: Optional[int] = 100) -> AsyncGenerator[VectorStoreFileRecord, None]:
+        async for file in self.ai_repository.iter_vector_store_files(self.settigs.vector_store_id, page_size):
+            yield self.to_file_record(file)
+
+    async def iter_files(self, file_name: Optional[str] = None, page_size: Optional[int] = 100) -> AsyncGenerator[VectorStoreFileRecord, None]:
+        if self.mirror_repository is None:
+            async for record in self.iter_remote_files(page_size):
+                if not file_name or record.file_name == file_name:
+                    yield record
+            return
+
+        page = await self.list_files(None, page_size, file_name)
+        while True:
+            for record in page.data:
+                yield record
+            if not page.has_more:
+                return
+            page = await self.list_files(page.next_after, page_size, file_name)
+
+    async def mirror_file(self, vector_store_file: Any, file_name: Optional[str] = None) -> None:
+        if self.mirror_repository is not None:
+            await self.mirror_repository.upsert_files([self.to_file_record(vector_store_file, file_name)], get_current_datetime())
+
     async def delete_file_from_vector_store(self, document_id: str) -> List[Any]:
-        return await self.ai_repository.delete_file_from_vector_store(self.settigs.vector_store_id, document_id)
+        deleted_file = await self.ai_repository.delete_file_from_vector_store(self.settigs.vector_store_id, document_id)
+        if self.manifest_repository is not None:
+            await self.manifest_repository.remove_vector_store_file(self.settigs.vector_store_id, document_id)
+        if self.mirror_repository is not None:
+            await self.mirror_repository.remove_files(self.settigs.vector_store_id, [document_id])
+        return deleted_file
+
+    async def discard_file(self, file_id: str) -> None:
+        try:
+            await self.delete_file_from_vector_store(file_id)
+        except Exception as e:
+            logger.debug("File %s was not in the vector store: %s", file_id, e)
+        await self.ai_repository.delete_file(file_id)
+
+    async def delete_files_from_vector_store(
+            self, document_ids: List[str], max_concurrent: Optional[int] = 8
+        ) -> List[Tuple[str, Union[Any, Exception]]]:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def delete(document_id: str) -> Any:
+            async with semaphore:
+                return await self.ai_repository.delete_file_from_vector_store(self.settigs.vector_store_id, document_id)
+
+        results = await asyncio.gather(*(delete(document_id) for document_id in document_ids), return_exceptions=True)
+        deleted_ids = [document_id for document_id, result in zip(document_ids, results) if not isinstance(result, Exception)]
+
+        if self.manifest_repository is not None:
+            await asyncio.gather(*(
+                self.manifest_repository.remove_vector_store_file(self.settigs.vector_store_id, document_id)
+                for document_id in deleted_ids
+            ))
+        if self.mirror_repository is not None and deleted_ids:
+            await self.mirror_repository.remove_files(self.settigs.vector_store_id, deleted_ids)
+
+        return list(zip(document_ids, results))
@@ -0,0 +1,165 @@
+import time
+import json
+import asyncio
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from app.domain.exceptions import ConversationBusy
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+
+logger = logging.getLogger(__name__)
+
+class ConversationLock:
+    __slots__ = ("lock", "holders")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.holders = 0
+
+class ConversationLockRegistry:
+    def __init__(self, max_pending: Optional[int] = 16, acquire_timeout_seconds: Optional[float] = 120.0,
+                 metrics_repository: Optional[IMetricsRepository] = None) -> None:
+        self.max_pending = max_pending
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self._locks: Dict[str, ConversationLock] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, conversation_id: str) -> AsyncIterator[None]:
+        conversation_lock = self._locks.get(conversation_id)
+        if conversation_lock is None:
+            conversation_lock = self._locks[conversation_id] = ConversationLock()
+
+        if self.max_pending and conversation_lock.holders >= self.max_pending:
+            self.metrics_repository.increment("conversation_lock_rejections")
+            raise ConversationBusy(conversation_id)
+
+        conversation_lock.holders += 1
+        try:
+            if conversation_lock.lock.locked():
+                self.metrics_repository.increment("conversation_lock_contended")
+
+            start_time = time.perf_counter()
+            try:
+                await asyncio.wait_for(conversation_lock.lock.acquire(), self.acquire_timeout_seconds)
+            except asyncio.TimeoutError:
+                self.metrics_repository.increment("conversation_lock_timeouts")
+                raise ConversationBusy(conversation_id)
+            self.metrics_repository.record("conversation_lock_wait_ms", (time.perf_counter() - start_time) * 1000)
+
+            try:
+                yield
+            finally:
+                conversation_lock.lock.release()
+        finally:
+            conversation_lock.holders -= 1
+            if conversation_lock.holders == 0:
+                self._locks.pop(conversation_id, None)
+
+class InFlightRequest:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+class SharedStream:
+    def __init__(self, source: AsyncIterator[Any]) -> None:
+        self.frames: List[Any] = []
+        self.finished = False
+        self.error: Optional[Exception] = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+        self.task = asyncio.create_task(self.pump(source))
+
+    def notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def pump(self, source: AsyncIterator[Any]) -> None:
+        try:
+            async for frame in source:
+                self.frames.append(frame)
+                self.notify()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
+            self.notify()
+            await source.aclose()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        index = 0
+        while True:
+            while index < len(self.frames):
+                yield self.frames[index]
+                index += 1
+
+            if self.finished:
+                if self.error is not None:
+                    raise self.error
+                return
+
+            await self._changed.wait()
+
+class RequestCoalescer:
+    def __init__(self, metrics_repository: Optional[IMetricsRepository] = None) -> None:
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self._requests: Dict[str, InFlightRequest] = {}
+        self._streams: Dict[str, SharedStream] = {}
+
+    @staticmethod
+    def build_key(
+        conversation_id: str, message: str, additional_files: Optional[List[str]] = [],
+        idempotency_key: Optional[str] = None
+    ) -> str:
+        if idempotency_key:
+            return f"{conversation_id}:{idempotency_key}"
+
+        request_input = json.dumps(
+            {"conversation_id": conversation_id, "message": message, "additional_files": additional_files or []},
+            ensure_ascii=False
+        )
+        return hashlib.sha256(request_input.encode("utf-8")).hexdigest()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        request = self._requests.get(key)
+        if request is None:
+            request = self._requests[key] = InFlightRequest(asyncio.create_task(factory()))
+            request.task.add_done_callback(lambda _: self._discard(self._requests, key, request))
+        else:
+            self.metrics_repository.increment("conversation_coalesced_requests")
+
+        request.waiters += 1
+        try:
+            return await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+            if request.waiters == 0 and not request.task.done():
+                request.task.cancel()
+
+    async def stream(self, key: str, factory: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        shared_stream = self._streams.get(key)
+        if shared_stream is None:
+            shared_stream = self._streams[key] = SharedStream(factory())
+            shared_stream.task.add_done_callback(lambda _: self._discard(self._streams, key, shared_stream))
+        else:
+            self.metrics_repository.increment("conversation_coalesced_streams")
+
+        shared_stream.subscribers += 1
+        frames = shared_stream.subscribe()
+        try:
+            async for frame in frames:
+                yield frame
+        finally:
+            await frames.aclose()
+            shared_stream.subscribers -= 1
+            if shared_stream.subscribers == 0 and not shared_stream.task.done():
+                shared_stream.task.cancel()
+
+    @staticmethod
+    def _discard(in_flight: Dict[str, Any], key: str, value: Any) -> None:
+        if in_flight.get(key) is value:
+            del in_flight[key]
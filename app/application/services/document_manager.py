@@ -1,27 +1,131 @@
 import shutil
-from typing import List
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, AsyncIterator, List, Optional, Tuple, Union
+from app.domain.document import RenderedPage, StoredDocument
 from app.domain.repository.document_repository import IDocumentRepository
 from app.domain.repository.storage_repository import IStorageRepository
+from app.domain.repository.document_manifest_repository import IDocumentManifestRepository
+from app.domain.utils import release_rendered_page
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_CONTAINER_NAME = "ctnreu2aiasd02"
+ORIGINAL_RENDER_PROFILE = "original"
 
 class DocumentManager:
     def __init__(
                 self,
                 document_repository: IDocumentRepository,
-                storage_repository: IStorageRepository                
+                storage_repository: IStorageRepository,
+                manifest_repository: Optional[IDocumentManifestRepository] = None,
+                metrics_repository: Optional[IMetricsRepository] = None
                 ) -> None:
         self.document_repository = document_repository
         self.storage_repository = storage_repository
+        self.manifest_repository = manifest_repository
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
         pass
 
-    async def save_document_locally(self, file):
+    async def save_document_locally(self, file) -> StoredDocument:
         return await self.document_repository.save_document_locally(file)
 
+    async def remove_document_locally(self, file_path: str) -> None:
+        try:
+            await self.document_repository.remove_document_locally(file_path)
+        except OSError as e:
+            logger.warning("Local file %s could not be deleted: %s", file_path, e)
+
     def process_document(self, file_path: str) -> List[str]:
         processed_documents =  self.document_repository.process_document(file_path)
-        print("Generated images files {processed_documents}")
+        logger.debug("Generated image files %s", processed_documents)
         return processed_documents
 
+    def stream_document(self, file_path: str, blob_prefix: Optional[str] = None) -> AsyncGenerator[RenderedPage, None]:
+        return self.document_repository.stream_document(file_path, blob_prefix)
+
+    @staticmethod
+    def get_render_profile() -> str:
+        settings = get_settings()
+        return f"{settings.pdf_render_format}_{settings.pdf_render_dpi}_{settings.pdf_render_quality}_{settings.pdf_render_colorspace}"
+
+    async def get_uploaded_pages(self, content_hash: str, render_profile: str) -> Optional[List[str]]:
+        if self.manifest_repository is None:
+            return None
+
+        manifest = await self.manifest_repository.get_manifest(content_hash)
+        blob_names = manifest.pages.get(render_profile) if manifest is not None else None
+        if not blob_names:
+            self.metrics_repository.increment("document_manifest_misses")
+            return None
+
+        self.metrics_repository.increment("document_manifest_hits")
+        return await self.storage_repository.generate_signed_urls(DOCUMENTS_CONTAINER_NAME, blob_names)
+
+    async def save_uploaded_pages(self, content_hash: str, file_name: str, render_profile: str, blob_names: List[str]) -> None:
+        if self.manifest_repository is not None:
+            await self.manifest_repository.save_pages(content_hash, file_name, render_profile, blob_names)
+
     async def upload_to_bucket(self, list_files: str) -> List[str]:
-        container_name = "ctnreu2aiasd02"
-        files_urls = await self.storage_repository.upload_many_files(container_name, list_files)
-        return files_urls
\ No newline at end of file
+        files_urls = await self.storage_repository.upload_many_files(DOCUMENTS_CONTAINER_NAME, list_files)
+        return files_urls
+
+    async def upload_page(self, rendered_page: RenderedPage, semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        try:
+            if rendered_page.content is not None:
+                return await self.storage_repository.upload_content(
+                    DOCUMENTS_CONTAINER_NAME, rendered_page.blob_name, rendered_page.content, semaphore=semaphore
+                )
+
+            return await self.storage_repository.upload_file(
+                DOCUMENTS_CONTAINER_NAME, rendered_page.file_path, semaphore=semaphore, blob_name=rendered_page.blob_name
+            )
+        finally:
+            release_rendered_page(rendered_page)
+
+    async def upload_as_ready(
+            self, pages: AsyncIterator[RenderedPage], max_concurrent: Optional[int] = None
+        ) -> AsyncGenerator[Tuple[int, str, Union[str, Exception]], None]:
+        semaphore = asyncio.Semaphore(max_concurrent or get_settings().pdf_upload_concurrency)
+        uploaded_pages: asyncio.Queue = asyncio.Queue()
+        end_of_pages = object()
+
+        async def upload(rendered_page: RenderedPage) -> None:
+            try:
+                file_url = await self.upload_page(rendered_page, semaphore)
+                await uploaded_pages.put((rendered_page.page_number, rendered_page.blob_name, file_url))
+            except Exception as e:
+                logger.warning("Page %s failed to upload: %s", rendered_page.page_number, e)
+                await uploaded_pages.put((rendered_page.page_number, rendered_page.blob_name, e))
+
+        async def produce() -> None:
+            received_pages: List[RenderedPage] = []
+            upload_tasks = []
+            try:
+                async for rendered_page in pages:
+                    received_pages.append(rendered_page)
+                    upload_tasks.append(asyncio.create_task(upload(rendered_page)))
+                await asyncio.gather(*upload_tasks)
+            except Exception as e:
+                await uploaded_pages.put(e)
+            finally:
+                for upload_task in upload_tasks:
+                    upload_task.cancel()
+                await asyncio.gather(*upload_tasks, return_exceptions=True)
+                for rendered_page in received_pages:
+                    release_rendered_page(rendered_page)
+                if hasattr(pages, "aclose"):
+                    await pages.aclose()
+                await uploaded_pages.put(end_of_pages)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (uploaded_page := await uploaded_pages.get()) is not end_of_pages:
+                if isinstance(uploaded_page, Exception):
+                    raise uploaded_page
+                yield uploaded_page
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
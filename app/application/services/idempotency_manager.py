@@ -0,0 +1,78 @@
+import json
+import hashlib
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from app.application.services.conversation_coordinator import RequestCoalescer
+from app.domain.exceptions import IdempotencyKeyMismatch
+from app.domain.repository.cache_repository import ICacheRepository
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+
+logger = logging.getLogger(__name__)
+
+class IdempotencyManager:
+    def __init__(self, store: ICacheRepository, ttl_seconds: Optional[float] = 86400.0,
+                 metrics_repository: Optional[IMetricsRepository] = None) -> None:
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self.coalescer = RequestCoalescer(self.metrics_repository)
+
+    @staticmethod
+    def build_key(scope: str, conversation_id: str, idempotency_key: str) -> str:
+        return f"{scope}:{conversation_id}:{idempotency_key}"
+
+    @staticmethod
+    def build_fingerprint(message: str, additional_files: Optional[List[str]] = []) -> str:
+        request_input = json.dumps({"message": message, "additional_files": additional_files or []}, ensure_ascii=False)
+        return hashlib.sha256(request_input.encode("utf-8")).hexdigest()
+
+    async def get_record(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        record = await self.store.get(key)
+        if record is None:
+            self.metrics_repository.increment("idempotency_misses")
+            return None
+
+        if record["fingerprint"] != fingerprint:
+            self.metrics_repository.increment("idempotency_mismatches")
+            raise IdempotencyKeyMismatch(key.rsplit(":", 1)[-1])
+
+        self.metrics_repository.increment("idempotency_hits")
+        return record
+
+    async def run(self, key: str, fingerprint: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        record = await self.get_record(key, fingerprint)
+        if record is not None:
+            return record["response"]
+
+        return await self.coalescer.run(key, lambda: self.record_response(key, fingerprint, factory))
+
+    async def record_response(self, key: str, fingerprint: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        response = await factory()
+        await self.store.set(key, {"fingerprint": fingerprint, "response": response}, self.ttl_seconds)
+        return response
+
+    async def stream(self, key: str, fingerprint: str, factory: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        record = await self.get_record(key, fingerprint)
+        if record is not None:
+            for frame in record["frames"]:
+                yield frame
+            return
+
+        frames = self.coalescer.stream(key, lambda: self.record_frames(key, fingerprint, factory()))
+        try:
+            async for frame in frames:
+                yield frame
+        finally:
+            await frames.aclose()
+
+    async def record_frames(self, key: str, fingerprint: str, source: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        frames: List[Any] = []
+        try:
+            async for frame in source:
+                frames.append(frame)
+                yield frame
+        finally:
+            await source.aclose()
+
+        await self.store.set(key, {"fingerprint": fingerprint, "frames": frames}, self.ttl_seconds)
+        logger.debug("Recorded %s frames for idempotency key %s", len(frames), key)
@@ -0,0 +1,249 @@
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, List, Optional, Set
+from app.application.services.ai_source_manager import AiSourceManager
+from app.domain.contants import IngestionJobStatus
+from app.domain.document import IngestionJob, IngestionJobFile, StoredDocument
+from app.domain.repository.ingestion_job_repository import IIngestionJobRepository
+from app.domain.utils import generate_uuid, get_current_datetime
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS_STATUS = "in_progress"
+COMPLETED_STATUS = "completed"
+ACTIVE_JOB_STATUSES = [IngestionJobStatus.PENDING, IngestionJobStatus.UPLOADING, IngestionJobStatus.INDEXING]
+
+class IngestionJobManager:
+    def __init__(
+                self,
+                ai_source_manager: AiSourceManager,
+                job_repository: IIngestionJobRepository,
+                upload_concurrency: Optional[int] = 8,
+                poll_initial_seconds: Optional[float] = 0.5,
+                poll_max_seconds: Optional[float] = 10.0,
+                poll_backoff: Optional[float] = 2.0,
+                poll_timeout_seconds: Optional[float] = 1800.0,
+                job_timeout_seconds: Optional[float] = 3600.0,
+                stale_job_seconds: Optional[float] = 7200.0,
+                metrics_repository: Optional[IMetricsRepository] = None
+                ) -> None:
+        self.ai_source_manager = ai_source_manager
+        self.job_repository = job_repository
+        self.upload_concurrency = upload_concurrency
+        self.poll_initial_seconds = poll_initial_seconds
+        self.poll_max_seconds = poll_max_seconds
+        self.poll_backoff = poll_backoff
+        self.poll_timeout_seconds = poll_timeout_seconds
+        self.job_timeout_seconds = job_timeout_seconds
+        self.stale_job_seconds = stale_job_seconds
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def save_job(self, job: IngestionJob, status: Optional[IngestionJobStatus] = None) -> None:
+        if status is not None:
+            job.status = status
+        job.updated_at = get_current_datetime()
+        await self.job_repository.save_job(job)
+
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        job = await self.job_repository.get_job(job_id)
+        if job is not None and job.status in ACTIVE_JOB_STATUSES and job.updated_at < self.get_stale_before():
+            await self.expire_job(job)
+        return job
+
+    def get_stale_before(self) -> str:
+        return (datetime.now() - timedelta(seconds=self.stale_job_seconds)).isoformat()
+
+    async def expire_job(self, job: IngestionJob) -> None:
+        logger.warning("Ingestion job %s left in %s since %s, marking it as failed", job.job_id, job.status.value, job.updated_at)
+        job.status, job.error = IngestionJobStatus.FAILED, "Ingestion job interrupted before finishing"
+        await self.discard_uploaded_files(job)
+        await self.remove_local_files(job)
+        self.metrics_repository.increment("vector_store_ingestion_expired")
+        await self.save_job(job)
+
+    async def recover_jobs(self) -> int:
+        stale_jobs = await self.job_repository.get_stale_jobs(ACTIVE_JOB_STATUSES, self.get_stale_before())
+        for job in stale_jobs:
+            await self.expire_job(job)
+        return len(stale_jobs)
+
+    async def recover_in_background(self) -> None:
+        try:
+            await self.recover_jobs()
+        except Exception as e:
+            logger.warning("Ingestion job recovery failed: %s", e)
+
+    def start(self) -> None:
+        task = asyncio.create_task(self.recover_in_background())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def submit(self, stored_documents: List[StoredDocument]) -> IngestionJob:
+        job = IngestionJob(
+            job_id=str(generate_uuid()),
+            vector_store_id=self.ai_source_manager.vector_store_id,
+            files=[
+                IngestionJobFile(
+                    file_name=os.path.basename(stored_document.file_path),
+                    content_hash=stored_document.content_hash,
+                    file_path=stored_document.file_path
+                )
+                for stored_document in stored_documents
+            ]
+        )
+
+        try:
+            await self.start_job(job)
+        except Exception:
+            await self.remove_local_files(job)
+            raise
+        return job
+
+    async def start_job(self, job: IngestionJob) -> None:
+        for job_file in job.files:
+            vector_store_file_id = await self.ai_source_manager.get_vector_store_file_id(job_file.content_hash)
+            if vector_store_file_id is not None:
+                job_file.vector_store_file_id = vector_store_file_id
+                job_file.status = IngestionJobStatus.COMPLETED
+                job_file.deduplicated = True
+
+        if all(job_file.status == IngestionJobStatus.COMPLETED for job_file in job.files):
+            await self.remove_local_files(job)
+            await self.save_job(job, IngestionJobStatus.COMPLETED)
+            return
+
+        await self.save_job(job)
+        task = asyncio.create_task(self.run_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run_job(self, job: IngestionJob) -> None:
+        start_time = time.perf_counter()
+        try:
+            await self.save_job(job, IngestionJobStatus.UPLOADING)
+            await asyncio.wait_for(self.process_job(job), self.job_timeout_seconds)
+
+            failed_files = [job_file for job_file in job.files if job_file.status != IngestionJobStatus.COMPLETED]
+            job.status = IngestionJobStatus.FAILED if failed_files else IngestionJobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status, job.error = IngestionJobStatus.FAILED, "Ingestion job cancelled"
+            await self.discard_uploaded_files(job)
+            await self.remove_local_files(job)
+            await self.save_job(job)
+            raise
+        except asyncio.TimeoutError as e:
+            job.status, job.error = IngestionJobStatus.FAILED, str(e) or f"Ingestion job exceeded {self.job_timeout_seconds} seconds"
+            logger.warning("Ingestion job %s timed out: %s", job.job_id, job.error)
+        except Exception as e:
+            logger.exception("Ingestion job %s failed: %s", job.job_id, e)
+            job.status, job.error = IngestionJobStatus.FAILED, str(e)
+
+        await self.discard_uploaded_files(job)
+        await self.remove_local_files(job)
+        self.metrics_repository.record("vector_store_ingestion_ms", (time.perf_counter() - start_time) * 1000)
+        self.metrics_repository.increment(f"vector_store_ingestion_{job.status.value}")
+        await self.save_job(job)
+
+    async def process_job(self, job: IngestionJob) -> None:
+        pending_files = [job_file for job_file in job.files if job_file.status == IngestionJobStatus.PENDING]
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+        await asyncio.gather(*(self.upload_file(job_file, semaphore) for job_file in pending_files))
+
+        uploaded_files = [job_file for job_file in pending_files if job_file.status != IngestionJobStatus.FAILED]
+        if uploaded_files:
+            await self.save_job(job, IngestionJobStatus.INDEXING)
+            if len(uploaded_files) == 1:
+                await self.index_file(uploaded_files[0])
+            else:
+                await self.index_batch(job, uploaded_files)
+
+    async def discard_uploaded_files(self, job: IngestionJob) -> None:
+        for job_file in job.files:
+            if job_file.status == IngestionJobStatus.COMPLETED:
+                continue
+
+            job_file.status = IngestionJobStatus.FAILED
+            job_file.error = job_file.error or job.error
+            if not job_file.vector_store_file_id:
+                continue
+
+            try:
+                await self.ai_source_manager.discard_file(job_file.vector_store_file_id)
+                job_file.vector_store_file_id = None
+                self.metrics_repository.increment("vector_store_discarded_files")
+            except Exception as e:
+                logger.warning("Uploaded file %s of job %s could not be deleted: %s", job_file.vector_store_file_id, job.job_id, e)
+
+    async def remove_local_files(self, job: IngestionJob) -> None:
+        for job_file in job.files:
+            if job_file.file_path:
+                await self.ai_source_manager.remove_document_locally(job_file.file_path)
+                job_file.file_path = None
+
+    async def upload_file(self, job_file: IngestionJobFile, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                job_file.vector_store_file_id = await self.ai_source_manager.upload_file(job_file.file_path)
+        except Exception as e:
+            logger.warning("File %s failed to upload: %s", job_file.file_name, e)
+            job_file.status, job_file.error = IngestionJobStatus.FAILED, str(e)
+
+    async def index_file(self, job_file: IngestionJobFile) -> None:
+        vector_store_file = await self.poll(
+            await self.ai_source_manager.add_file_to_vector_store(job_file.vector_store_file_id, job_file.file_name),
+            lambda: self.ai_source_manager.get_vector_store_file(job_file.vector_store_file_id)
+        )
+        await self.complete_file(job_file, vector_store_file)
+
+    async def index_batch(self, job: IngestionJob, job_files: List[IngestionJobFile]) -> None:
+        file_batch = await self.ai_source_manager.create_file_batch(
+            [(job_file.vector_store_file_id, job_file.file_name) for job_file in job_files]
+        )
+        job.batch_id = file_batch.id
+        await self.save_job(job)
+
+        await self.poll(file_batch, lambda: self.ai_source_manager.get_file_batch(file_batch.id))
+        batch_files = {
+            batch_file.id: batch_file for batch_file in await self.ai_source_manager.get_file_batch_files(file_batch.id)
+        }
+        for job_file in job_files:
+            await self.complete_file(job_file, batch_files.get(job_file.vector_store_file_id))
+
+    async def complete_file(self, job_file: IngestionJobFile, vector_store_file: Any) -> None:
+        if vector_store_file is not None:
+            await self.ai_source_manager.mirror_file(vector_store_file, job_file.file_name)
+
+        if vector_store_file is None or vector_store_file.status != COMPLETED_STATUS:
+            last_error = getattr(vector_store_file, "last_error", None)
+            job_file.status = IngestionJobStatus.FAILED
+            job_file.error = getattr(last_error, "message", None) or f"Indexing ended as {getattr(vector_store_file, 'status', 'missing')}"
+            return
+
+        job_file.status = IngestionJobStatus.COMPLETED
+        await self.ai_source_manager.save_vector_store_file_id(
+            job_file.content_hash, job_file.file_name, job_file.vector_store_file_id
+        )
+
+    async def poll(self, current: Any, retrieve: Callable[[], Awaitable[Any]]) -> Any:
+        interval = self.poll_initial_seconds
+        deadline = time.monotonic() + self.poll_timeout_seconds
+
+        while current.status == IN_PROGRESS_STATUS:
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(f"Vector store indexing exceeded {self.poll_timeout_seconds} seconds")
+
+            await asyncio.sleep(interval)
+            interval = min(interval * self.poll_backoff, self.poll_max_seconds)
+            current = await retrieve()
+
+        return current
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,103 @@
+import time
+import asyncio
+import logging
+from typing import List, Optional
+from app.application.services.ai_source_manager import AiSourceManager
+from app.domain.document import VectorStoreFileRecord
+from app.domain.repository.vector_store_mirror_repository import IVectorStoreMirrorRepository
+from app.domain.utils import get_current_datetime
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS_STATUS = "in_progress"
+
+class KnownledgeMirrorManager:
+    def __init__(
+                self,
+                ai_source_manager: AiSourceManager,
+                mirror_repository: IVectorStoreMirrorRepository,
+                refresh_seconds: Optional[float] = 60.0,
+                full_refresh_seconds: Optional[float] = 3600.0,
+                page_size: Optional[int] = 100,
+                metrics_repository: Optional[IMetricsRepository] = None
+                ) -> None:
+        self.ai_source_manager = ai_source_manager
+        self.mirror_repository = mirror_repository
+        self.refresh_seconds = refresh_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self.page_size = page_size
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, full: Optional[bool] = False) -> int:
+        vector_store_id = self.ai_source_manager.vector_store_id
+        synced_at = get_current_datetime()
+        watermark = None if full else await self.mirror_repository.get_latest_created_at(vector_store_id)
+
+        start_time = time.perf_counter()
+        synced_files = 0
+        records: List[VectorStoreFileRecord] = []
+        async for record in self.ai_source_manager.iter_remote_files(self.page_size):
+            if watermark is not None and record.created_at < watermark:
+                break
+
+            records.append(record)
+            if len(records) >= self.page_size:
+                await self.mirror_repository.upsert_files(records, synced_at)
+                synced_files += len(records)
+                records = []
+
+        await self.mirror_repository.upsert_files(records, synced_at)
+        synced_files += len(records)
+
+        if full:
+            await self.mirror_repository.remove_stale_files(vector_store_id, synced_at)
+        else:
+            synced_files += await self.refresh_in_progress(vector_store_id)
+
+        self.metrics_repository.record("knownledge_mirror_refresh_ms", (time.perf_counter() - start_time) * 1000)
+        logger.info("Knowledge mirror %s refresh synced %s files", "full" if full else "incremental", synced_files)
+        return synced_files
+
+    async def refresh_in_progress(self, vector_store_id: str) -> int:
+        records = await self.mirror_repository.list_files_by_status(vector_store_id, IN_PROGRESS_STATUS, self.page_size)
+        updated_records: List[VectorStoreFileRecord] = []
+        for record in records:
+            try:
+                vector_store_file = await self.ai_source_manager.get_vector_store_file(record.vector_store_file_id)
+            except Exception as e:
+                logger.warning("Mirrored file %s could not be refreshed: %s", record.vector_store_file_id, e)
+                continue
+
+            if vector_store_file.status != record.status:
+                updated_records.append(self.ai_source_manager.to_file_record(vector_store_file, record.file_name))
+
+        await self.mirror_repository.upsert_files(updated_records, get_current_datetime())
+        return len(updated_records)
+
+    async def run(self) -> None:
+        await self.mirror_repository.create_indexes()
+        last_full_refresh = None
+
+        while True:
+            full = last_full_refresh is None or time.monotonic() - last_full_refresh >= self.full_refresh_seconds
+            try:
+                await self.refresh(full)
+                if full:
+                    last_full_refresh = time.monotonic()
+            except Exception as e:
+                logger.warning("Knowledge mirror refresh failed: %s", e)
+                self.metrics_repository.increment("knownledge_mirror_refresh_errors")
+
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
@@ -0,0 +1,118 @@
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+from app.domain.contants import DEFAULT_K_NEAREST_NEIGHBORS, DEFAULT_TOP_ITEMS
+from app.domain.repository.embedding_repository import IEmbeddingRepository
+from app.domain.repository.vector_index_repository import IVectorIndexRepository
+from app.domain.utils import generate_uuid, normalize_text
+from app.domain.repository.metrics_repository import IMetricsRepository, NullMetricsRepository
+
+logger = logging.getLogger(__name__)
+
+class SemanticCacheManager:
+    def __init__(
+                self,
+                embedder: IEmbeddingRepository,
+                index: IVectorIndexRepository,
+                version_provider: Callable[[], Awaitable[str]],
+                similarity_threshold: Optional[float] = 0.92,
+                k_nearest_neighbors: Optional[int] = DEFAULT_K_NEAREST_NEIGHBORS,
+                top_items: Optional[int] = DEFAULT_TOP_ITEMS,
+                ttl_seconds: Optional[float] = 3600.0,
+                version_refresh_seconds: Optional[float] = 30.0,
+                metrics_repository: Optional[IMetricsRepository] = None
+                ) -> None:
+        self.embedder = embedder
+        self.index = index
+        self.version_provider = version_provider
+        self.similarity_threshold = similarity_threshold
+        self.k_nearest_neighbors = k_nearest_neighbors
+        self.top_items = top_items
+        self.ttl_seconds = ttl_seconds
+        self.version_refresh_seconds = version_refresh_seconds
+        self.metrics_repository = metrics_repository or NullMetricsRepository()
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._version_lock = asyncio.Lock()
+
+    def is_version_fresh(self) -> bool:
+        return self._version is not None and time.monotonic() - self._version_checked_at < self.version_refresh_seconds
+
+    async def get_version(self) -> Optional[str]:
+        if self.is_version_fresh():
+            return self._version
+
+        async with self._version_lock:
+            if self.is_version_fresh():
+                return self._version
+
+            try:
+                version = await self.version_provider()
+            except Exception as e:
+                logger.warning("Vector store version unavailable, bypassing semantic cache: %s", e)
+                self.metrics_repository.increment("semantic_cache_errors")
+                return None
+
+            if self._version is not None and version != self._version:
+                await self.index.clear()
+                self.metrics_repository.increment("semantic_cache_invalidations")
+                logger.info("Vector store changed from %s to %s, semantic cache cleared", self._version, version)
+
+            self._version, self._version_checked_at = version, time.monotonic()
+            return version
+
+    async def lookup(self, vector: List[float], version: str) -> Optional[Any]:
+        now = time.monotonic()
+        matches = await self.index.search(vector, self.k_nearest_neighbors)
+
+        stale_ids = [
+            item_id for item_id, _, entry in matches
+            if entry["version"] != version or entry["expires_at"] <= now
+        ]
+        if stale_ids:
+            await self.index.remove(stale_ids)
+
+        candidates = [
+            (score, entry) for item_id, score, entry in matches
+            if score >= self.similarity_threshold and item_id not in stale_ids
+        ][:self.top_items]
+        if not candidates:
+            return None
+
+        score, entry = max(candidates, key=lambda candidate: (candidate[0], candidate[1]["created_at"]))
+        self.metrics_repository.record("semantic_cache_similarity", score)
+        logger.debug("Semantic cache hit (%.3f) for question %r", score, entry["question"])
+        return entry["answer"]
+
+    async def get_or_generate(
+        self, message: str, factory: Callable[[], Awaitable[Any]], replay: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        version = await self.get_version()
+        if version is None:
+            return await factory()
+
+        try:
+            vector = (await self.embedder.embed([normalize_text(message)]))[0]
+        except Exception as e:
+            logger.warning("Question embedding failed, bypassing semantic cache: %s", e)
+            self.metrics_repository.increment("semantic_cache_errors")
+            return await factory()
+
+        cached_answer = await self.lookup(vector, version)
+        if cached_answer is not None:
+            self.metrics_repository.increment("semantic_cache_hits")
+            return await replay(cached_answer)
+
+        self.metrics_repository.increment("semantic_cache_misses")
+        answer = await factory()
+        created_at = time.monotonic()
+        await self.index.add(
+            str(generate_uuid()),
+            vector,
+            {
+                "question": message, "answer": answer, "version": version,
+                "created_at": created_at, "expires_at": created_at + self.ttl_seconds
+            }
+        )
+        return answer
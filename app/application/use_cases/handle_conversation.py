@@ -8,12 +8,14 @@ from app.domain.agent.agent import ConversationResponse
 
 from app.application.services.agent_manager import AgentManager
 from app.application.services.thread_manager import ThreadManager
+from app.application.services.idempotency_manager import IdempotencyManager
 
 from app.domain.conversation.conversation import (
     StartStreamingResponse, DataStreamingResponse, EndStreamingResponse,
     TypeStreamingResponseEnum  
 ) 
 
+from app.domain.contants import GuardMode
 from app.domain.utils import generate_uuid, get_current_datetime
 
 class MessageUseCase:
@@ -30,9 +32,13 @@ class MessageUseCase:
 class HandleMessageUseCase(MessageUseCase):
     def __init__(
         self,
-        agent_manager: AgentManager
+        agent_manager: AgentManager,
+        guard_mode: Optional[GuardMode] = GuardMode.OFF,
+        idempotency_manager: Optional[IdempotencyManager] = None
     ):
         super().__init__(agent_manager)
+        self.guard_mode = guard_mode
+        self.idempotency_manager = idempotency_manager
 
     async def execute(
         self,
@@ -41,13 +47,38 @@ class HandleMessageUseCase(MessageUseCase):
         additional_files: Optional[List[str]] = [],
         decision: Optional[str] = None,
         additional_information: Optional[Dict[str, Any]] = dict(),
-        trace: Optional[Dict[str, Any]] = None
+        trace: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> AgentResponse:
+
+        if idempotency_key is None or self.idempotency_manager is None:
+            return await self.generate_response(conversation_id, message, additional_files, idempotency_key)
+
+        async def generate_payload() -> Dict[str, Any]:
+            agent_response = await self.generate_response(conversation_id, message, additional_files, idempotency_key)
+            return agent_response.model_dump(mode="json")
+
+        payload = await self.idempotency_manager.run(
+            self.idempotency_manager.build_key("chat", conversation_id, idempotency_key),
+            self.idempotency_manager.build_fingerprint(message, additional_files),
+            generate_payload
+        )
+        return AgentResponse(**payload)
+
+    async def generate_response(
+        self,
+        conversation_id: str,
+        message: str,
+        additional_files: Optional[List[str]] = [],
+        idempotency_key: Optional[str] = None
     ) -> AgentResponse:
 
-        agent_response = await self.agent_manager.generate_content(
+        agent_response = await self.agent_manager.generate_guarded_content(
             message=message,
             additional_files=additional_files,
-            conversation_id=conversation_id
+            conversation_id=conversation_id,
+            guard_mode=self.guard_mode,
+            idempotency_key=idempotency_key
             )
 
         return AgentResponse(
@@ -64,30 +95,98 @@ class HandleMessageUseCase(MessageUseCase):
 class HandleMessageStreamUseCase(MessageUseCase):
     def __init__(
         self,
-        agent_manager: AgentManager
+        agent_manager: AgentManager,
+        guard_mode: Optional[GuardMode] = GuardMode.OFF,
+        idempotency_manager: Optional[IdempotencyManager] = None
     ):
         super().__init__(agent_manager)
+        self.guard_mode = guard_mode
+        self.idempotency_manager = idempotency_manager
+
+    def replay(
+        self, scope: str, conversation_id: str, message: str, additional_files: Optional[List[str]],
+        idempotency_key: Optional[str], factory: Any
+    ) -> AsyncGenerator[Any, None]:
+        if idempotency_key is None or self.idempotency_manager is None:
+            return factory()
+
+        return self.idempotency_manager.stream(
+            self.idempotency_manager.build_key(scope, conversation_id, idempotency_key),
+            self.idempotency_manager.build_fingerprint(message, additional_files),
+            factory
+        )
 
-    async def execute(
+    def execute(
         self,
         conversation_id: str,
         message: str,
         additional_files: Optional[List[str]] = [],
         decision: Optional[str] = None,
         additional_information: Optional[Dict[str, Any]] = dict(),
-        trace: Optional[Dict[str, Any]] = None
+        trace: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> AsyncGenerator[dict[str, Any], None]:
+        return self.replay(
+            "stream", conversation_id, message, additional_files, idempotency_key,
+            lambda: self.generate_events(conversation_id, message, additional_files, idempotency_key)
+        )
 
-        yield StartStreamingResponse(agent=self.agent_manager.agent_name).model_dump()
+    async def generate_events(
+        self,
+        conversation_id: str,
+        message: str,
+        additional_files: Optional[List[str]] = [],
+        idempotency_key: Optional[str] = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
 
-        async for chunk in self.agent_manager.generate_stream_content(
+        started = False
+        async for chunk in self.stream_deltas(
             message=message,
             additional_files=additional_files,
-            conversation_id=conversation_id
+            conversation_id=conversation_id,
+            idempotency_key=idempotency_key
         ):
+            if not started:
+                started = True
+                yield self.start_event()
             yield DataStreamingResponse(type=TypeStreamingResponseEnum.DATA.value, text=chunk).model_dump()
 
-        yield EndStreamingResponse(type=TypeStreamingResponseEnum.END.value).model_dump()
+        if not started:
+            yield self.start_event()
+        yield self.end_event()
+
+    def start_event(self) -> dict[str, Any]:
+        return StartStreamingResponse(agent=self.agent_manager.agent_name).model_dump()
+
+    def end_event(self) -> dict[str, Any]:
+        return EndStreamingResponse(type=TypeStreamingResponseEnum.END.value).model_dump()
+
+    def generate_deltas(
+        self,
+        conversation_id: str,
+        message: str,
+        additional_files: Optional[List[str]] = [],
+        idempotency_key: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        return self.replay(
+            "stream_deltas", conversation_id, message, additional_files, idempotency_key,
+            lambda: self.stream_deltas(conversation_id, message, additional_files, idempotency_key)
+        )
+
+    def stream_deltas(
+        self,
+        conversation_id: str,
+        message: str,
+        additional_files: Optional[List[str]] = [],
+        idempotency_key: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        return self.agent_manager.generate_guarded_stream_content(
+            message=message,
+            additional_files=additional_files,
+            conversation_id=conversation_id,
+            guard_mode=self.guard_mode,
+            idempotency_key=idempotency_key
+        )
 
 class HandleThreadsUseCase():
     def __init__(
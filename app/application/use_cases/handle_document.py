@@ -1,23 +1,117 @@
-from typing import List
-from app.domain.utils import parrallel_pdf_to_img
-from app.application.services.document_manager import DocumentManager
+import os
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from app.domain.document import RenderedPage, StoredDocument
+from app.application.services.document_manager import DocumentManager, ORIGINAL_RENDER_PROFILE
 from fastapi import UploadFile
 
 class HandleDocumentsUseCase:
     def __init__(self, document_manager: DocumentManager):
         self.document_manager = document_manager
         pass
-    
+
+    @staticmethod
+    def is_pdf(file: UploadFile) -> bool:
+        return file.content_type in ["application/pdf"]
+
+    def get_render_profile(self, file: UploadFile) -> str:
+        return self.document_manager.get_render_profile() if self.is_pdf(file) else ORIGINAL_RENDER_PROFILE
+
     def process_file_by_content_type(self, file: UploadFile, local_file_path: str) -> List[str]:
-        if file.content_type in ["application/pdf"]:
+        if self.is_pdf(file):
             return self.document_manager.process_document(local_file_path)
         return [local_file_path]
 
+    async def stream_file_by_content_type(
+        self, file: UploadFile, local_file_path: str, content_hash: Optional[str] = None
+    ) -> AsyncGenerator[RenderedPage, None]:
+        if self.is_pdf(file):
+            blob_prefix = f"{content_hash}/{self.get_render_profile(file)}" if content_hash else None
+            async for rendered_page in self.document_manager.stream_document(local_file_path, blob_prefix):
+                yield rendered_page
+            return
+
+        file_name = os.path.basename(local_file_path)
+        yield RenderedPage(
+            page_number=0, blob_name=f"{content_hash}/{file_name}" if content_hash else file_name, file_path=local_file_path
+        )
+
     async def upload_document(self, file: UploadFile) -> List[str]:
-        local_file_path = await self.document_manager.save_document_locally(file)
-        
-        processed_files = self.process_file_by_content_type(file, local_file_path)
-        return await self.document_manager.upload_to_bucket(processed_files)
+        stored_document = await self.document_manager.save_document_locally(file)
+        try:
+            return await self.upload_stored_document(file, stored_document)
+        finally:
+            await self.document_manager.remove_document_locally(stored_document.file_path)
+
+    async def upload_stored_document(self, file: UploadFile, stored_document: StoredDocument) -> List[str]:
+        content_hash = stored_document.content_hash
+        render_profile = self.get_render_profile(file)
+
+        cached_urls = await self.document_manager.get_uploaded_pages(content_hash, render_profile)
+        if cached_urls is not None:
+            return cached_urls
+
+        uploaded_pages = []
+        failed_files = 0
+        async for page_number, blob_name, result in self.document_manager.upload_as_ready(
+            self.stream_file_by_content_type(file, stored_document.file_path, content_hash)
+        ):
+            if isinstance(result, Exception):
+                failed_files += 1
+                continue
+            uploaded_pages.append((page_number, blob_name, result))
+
+        uploaded_pages.sort()
+        if uploaded_pages and not failed_files:
+            await self.document_manager.save_uploaded_pages(
+                content_hash, file.filename, render_profile, [blob_name for _, blob_name, _ in uploaded_pages]
+            )
+        return [file_url for _, _, file_url in uploaded_pages]
+
+    async def stream_upload_document(self, file: UploadFile) -> AsyncGenerator[Dict[str, Any], None]:
+        stored_document = await self.document_manager.save_document_locally(file)
+        return self.stream_and_remove_uploaded_pages(file, stored_document)
+
+    async def stream_and_remove_uploaded_pages(self, file: UploadFile, stored_document: StoredDocument) -> AsyncGenerator[Dict[str, Any], None]:
+        try:
+            async for document_event in self.stream_uploaded_pages(file, stored_document):
+                yield document_event
+        finally:
+            await self.document_manager.remove_document_locally(stored_document.file_path)
+
+    async def stream_uploaded_pages(self, file: UploadFile, stored_document: StoredDocument) -> AsyncGenerator[Dict[str, Any], None]:
+        content_hash = stored_document.content_hash
+        render_profile = self.get_render_profile(file)
+
+        cached_urls = await self.document_manager.get_uploaded_pages(content_hash, render_profile)
+        if cached_urls is not None:
+            for page_number, file_url in enumerate(cached_urls):
+                yield {"type": "page", "page": page_number, "url": file_url}
+            yield {
+                "type": "end", "file_name": file.filename, "uploaded_files": len(cached_urls),
+                "failed_files": 0, "deduplicated": True
+            }
+            return
+
+        uploaded_pages = []
+        failed_files = 0
+
+        async for page_number, blob_name, result in self.document_manager.upload_as_ready(
+            self.stream_file_by_content_type(file, stored_document.file_path, content_hash)
+        ):
+            if isinstance(result, Exception):
+                failed_files += 1
+                yield {"type": "error", "page": page_number, "message": str(result)}
+                continue
+
+            uploaded_pages.append((page_number, blob_name))
+            yield {"type": "page", "page": page_number, "url": result}
 
+        if uploaded_pages and not failed_files:
+            await self.document_manager.save_uploaded_pages(
+                content_hash, file.filename, render_profile, [blob_name for _, blob_name in sorted(uploaded_pages)]
+            )
 
-        
\ No newline at end of file
+        yield {
+            "type": "end", "file_name": file.filename, "uploaded_files": len(uploaded_pages),
+            "failed_files": failed_files, "deduplicated": False
+        }
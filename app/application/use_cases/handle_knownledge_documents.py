@@ -1,23 +1,55 @@
-from typing import List, Any
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 from app.application.services.ai_source_manager import AiSourceManager
+from app.application.services.ingestion_job_manager import IngestionJobManager
+from app.domain.document import IngestionJob, IngestionJobFile, VectorStoreFilePage
+from app.domain.exceptions import IngestionJobNotFound
 from fastapi import UploadFile
 
 class HandleKnownledgeDocumentsUseCase:
-    def __init__(self, ai_source_manager: AiSourceManager):
+    def __init__(self, ai_source_manager: AiSourceManager, ingestion_job_manager: IngestionJobManager,
+                 batch_concurrency: Optional[int] = 8):
         self.ai_source_manager = ai_source_manager
+        self.ingestion_job_manager = ingestion_job_manager
+        self.batch_concurrency = batch_concurrency
         pass
     
-    async def upload_document(self, file: UploadFile) -> str:
-        local_file_path = await self.ai_source_manager.save_document_locally(file)
-        return await self.ai_source_manager.upload_to_vector_store(local_file_path)
+    async def upload_document(self, file: UploadFile) -> IngestionJob:
+        stored_document = await self.ai_source_manager.save_document_locally(file)
+        return await self.ingestion_job_manager.submit([stored_document])
 
-    async def get_documents(self) -> List[Any]:
-        documents = await self.ai_source_manager.get_files_from_vector_store()
-        return [ {"vector_store_file_id": doc.id, "created_at": doc.created_at} for doc in documents]
+    async def upload_documents(
+            self, files: List[UploadFile]
+        ) -> Tuple[Optional[IngestionJob], List[Union[IngestionJobFile, Exception]]]:
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
 
-    async def delete_document(self, file_id: str):
-        await self.ai_source_manager.delete_file_from_vector_store(file_id)
+        async def save(file: UploadFile) -> Any:
+            async with semaphore:
+                return await self.ai_source_manager.save_document_locally(file)
+
+        saved_documents = await asyncio.gather(*(save(file) for file in files), return_exceptions=True)
+        stored_documents = [document for document in saved_documents if not isinstance(document, Exception)]
+
+        job = await self.ingestion_job_manager.submit(stored_documents) if stored_documents else None
+        job_files = iter(job.files if job is not None else [])
+        return job, [document if isinstance(document, Exception) else next(job_files) for document in saved_documents]
 
+    async def get_ingestion_job(self, job_id: str) -> IngestionJob:
+        job = await self.ingestion_job_manager.get_job(job_id)
+        if job is None:
+            raise IngestionJobNotFound(job_id)
+        return job
 
+    async def get_documents(self, after: Optional[str] = None, limit: Optional[int] = 20,
+                            file_name: Optional[str] = None) -> VectorStoreFilePage:
+        return await self.ai_source_manager.list_files(after, limit, file_name)
+
+    async def stream_documents(self, file_name: Optional[str] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        async for record in self.ai_source_manager.iter_files(file_name):
+            yield record.model_dump(exclude={"vector_store_id"})
+
+    async def delete_document(self, file_id: str):
+        await self.ai_source_manager.delete_file_from_vector_store(file_id)
 
-        
\ No newline at end of file
+    async def delete_documents(self, file_ids: List[str]) -> List[Tuple[str, Union[Any, Exception]]]:
+        return await self.ai_source_manager.delete_files_from_vector_store(list(dict.fromkeys(file_ids)), self.batch_concurrency)
@@ -28,6 +28,11 @@ class Settings(BaseSettings):
         "AZURE_OPENAI_API_VERSION", "2024-08-01-preview"
     )
 
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_json: bool = os.getenv("LOG_JSON", "true").lower() == "true"
+    log_sample_rates: Optional[str] = os.getenv("LOG_SAMPLE_RATES")
+    log_rate_limits: Optional[str] = os.getenv("LOG_RATE_LIMITS")
+
     remote_agent_timeout: float = float(os.getenv("REMOTE_AGENT_TIMEOUT", "30.0"))
     ssl_cert_file: Optional[str] = os.getenv("SSL_CERT_FILE")
     requests_ca_bundle: Optional[str] = os.getenv("REQUESTS_CA_BUNDLE")
@@ -37,6 +42,13 @@ class Settings(BaseSettings):
     otel_exporter_otlp_endpoint: Optional[str] = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
     applicationinsights_connection_string: Optional[str] = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
 
+    streaming_fast_path: bool = os.getenv("STREAMING_FAST_PATH", "true").lower() == "true"
+    streaming_coalesce_ms: float = float(os.getenv("STREAMING_COALESCE_MS", "20"))
+    streaming_coalesce_bytes: int = int(os.getenv("STREAMING_COALESCE_BYTES", "256"))
+
+    streaming_buffer_size: int = int(os.getenv("STREAMING_BUFFER_SIZE", "64"))
+    streaming_disconnect_poll_ms: float = float(os.getenv("STREAMING_DISCONNECT_POLL_MS", "250"))
+
     cors_origins: list[str] = [
         "http://localhost:3000",
         "http://localhost:3001",
@@ -55,15 +67,100 @@ class Settings(BaseSettings):
     mongo_db_connection_string: Optional[str] = os.getenv("MONGO_DB_CONNECTION_STRING")
     mongo_db_name: Optional[str] = os.getenv("MONGO_DB_NAME")
 
+    mongo_index_mode: str = os.getenv("MONGO_INDEX_MODE", "create")
+    mongo_conversation_ttl_seconds: Optional[int] = int(os.getenv("MONGO_CONVERSATION_TTL_SECONDS")) if os.getenv("MONGO_CONVERSATION_TTL_SECONDS") else None
+
+    mongo_history_trim_strategy: str = os.getenv("MONGO_HISTORY_TRIM_STRATEGY", "bulk_write")
+
+    history_cache_enabled: bool = os.getenv("HISTORY_CACHE_ENABLED", "true").lower() == "true"
+    history_cache_max_size: int = int(os.getenv("HISTORY_CACHE_MAX_SIZE", "1024"))
+    history_cache_ttl_seconds: float = float(os.getenv("HISTORY_CACHE_TTL_SECONDS", "300"))
+
+    cosmos_db_chat_storage_url: Optional[str] = os.getenv("COSMOS_DB_CHAT_STORAGE_URL")
+    cosmos_db_chat_storage_db: Optional[str] = os.getenv("COSMOS_DB_CHAT_STORAGE_DB")
+
     content_safety_endpoint: Optional[str] = os.getenv("CONTENT_SAFETY_ENDPOINT")
     content_safety_api_key: Optional[str] = os.getenv("CONTENT_SAFETY_API_KEY")
+    content_safety_reject_thresholds: str = os.getenv(
+        "CONTENT_SAFETY_REJECT_THRESHOLDS", "Hate=4,SelfHarm=4,Sexual=4,Violence=4"
+    )
+    content_safety_blocklists: Optional[str] = os.getenv("CONTENT_SAFETY_BLOCKLISTS")
+    content_safety_max_chunk_length: int = int(os.getenv("CONTENT_SAFETY_MAX_CHUNK_LENGTH", "10000"))
+    content_safety_max_concurrency: int = int(os.getenv("CONTENT_SAFETY_MAX_CONCURRENCY", "4"))
+
+    content_safety_cache_enabled: bool = os.getenv("CONTENT_SAFETY_CACHE_ENABLED", "true").lower() == "true"
+    content_safety_cache_max_size: int = int(os.getenv("CONTENT_SAFETY_CACHE_MAX_SIZE", "4096"))
+    content_safety_cache_ttl_seconds: float = float(os.getenv("CONTENT_SAFETY_CACHE_TTL_SECONDS", "600"))
+    content_safety_cache_redis_url: Optional[str] = os.getenv("CONTENT_SAFETY_CACHE_REDIS_URL")
+
+    conversation_lock_enabled: bool = os.getenv("CONVERSATION_LOCK_ENABLED", "true").lower() == "true"
+    conversation_lock_max_pending: int = int(os.getenv("CONVERSATION_LOCK_MAX_PENDING", "16"))
+    conversation_lock_timeout_seconds: float = float(os.getenv("CONVERSATION_LOCK_TIMEOUT_SECONDS", "120"))
+    conversation_coalescing_enabled: bool = os.getenv("CONVERSATION_COALESCING_ENABLED", "false").lower() == "true"
+
+    idempotency_enabled: bool = os.getenv("IDEMPOTENCY_ENABLED", "true").lower() == "true"
+    idempotency_backend: str = os.getenv("IDEMPOTENCY_BACKEND", "memory")
+    idempotency_ttl_seconds: float = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    idempotency_max_size: int = int(os.getenv("IDEMPOTENCY_MAX_SIZE", "2048"))
+    idempotency_redis_url: Optional[str] = os.getenv("IDEMPOTENCY_REDIS_URL", os.getenv("CONTENT_SAFETY_CACHE_REDIS_URL"))
+
+    semantic_cache_enabled: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    semantic_cache_embedder: str = os.getenv("SEMANTIC_CACHE_EMBEDDER", "openai")
+    semantic_cache_embedding_model: str = os.getenv("SEMANTIC_CACHE_EMBEDDING_MODEL", "text-embedding-3-small")
+    semantic_cache_embedding_dimensions: int = int(os.getenv("SEMANTIC_CACHE_EMBEDDING_DIMENSIONS", "256"))
+    semantic_cache_similarity_threshold: float = float(os.getenv("SEMANTIC_CACHE_SIMILARITY_THRESHOLD", "0.92"))
+    semantic_cache_max_size: int = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "4096"))
+    semantic_cache_ttl_seconds: float = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600"))
+    semantic_cache_version_refresh_seconds: float = float(os.getenv("SEMANTIC_CACHE_VERSION_REFRESH_SECONDS", "30"))
+
+    chat_guard_mode: str = os.getenv("CHAT_GUARD_MODE", "off")
+    stream_guard_mode: str = os.getenv("STREAM_GUARD_MODE", "off")
+
+    pdf_render_workers: Optional[int] = int(os.getenv("PDF_RENDER_WORKERS")) if os.getenv("PDF_RENDER_WORKERS") else None
+    pdf_render_dpi: int = int(os.getenv("PDF_RENDER_DPI", "150"))
+    pdf_render_format: str = os.getenv("PDF_RENDER_FORMAT", "jpg")
+    pdf_render_quality: int = int(os.getenv("PDF_RENDER_QUALITY", "95"))
+    pdf_render_colorspace: str = os.getenv("PDF_RENDER_COLORSPACE", "rgb")
+    pdf_stream_range_pages: int = int(os.getenv("PDF_STREAM_RANGE_PAGES", "4"))
+    pdf_upload_concurrency: int = int(os.getenv("PDF_UPLOAD_CONCURRENCY", "20"))
+    pdf_upload_mode: str = os.getenv("PDF_UPLOAD_MODE", "memory")
+    pdf_memory_max_page_bytes: int = int(os.getenv("PDF_MEMORY_MAX_PAGE_BYTES", str(8 * 1024 * 1024)))
+    pdf_spill_directory: Optional[str] = os.getenv("PDF_SPILL_DIRECTORY")
+
+    upload_chunk_bytes: int = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+    upload_max_bytes: int = int(os.getenv("UPLOAD_MAX_BYTES", str(200 * 1024 * 1024)))
+
+    document_dedup_enabled: bool = os.getenv("DOCUMENT_DEDUP_ENABLED", "true").lower() == "true"
 
     storage_account_url: str = os.getenv("STORAGE_ACCOUNT_URL")
     storage_account_name: str = os.getenv("STORAGE_ACCOUNT_NAME")
+    storage_delegation_key_lifetime_minutes: int = int(os.getenv("STORAGE_DELEGATION_KEY_LIFETIME_MINUTES", "120"))
+    storage_delegation_key_refresh_minutes: int = int(os.getenv("STORAGE_DELEGATION_KEY_REFRESH_MINUTES", "45"))
+    storage_sas_lifetime_minutes: int = int(os.getenv("STORAGE_SAS_LIFETIME_MINUTES", "40"))
 
     vector_store_id: Optional[str] = os.getenv("VECTOR_STORE_ID")
+    vector_store_upload_concurrency: int = int(os.getenv("VECTOR_STORE_UPLOAD_CONCURRENCY", "8"))
+    vector_store_poll_initial_seconds: float = float(os.getenv("VECTOR_STORE_POLL_INITIAL_SECONDS", "0.5"))
+    vector_store_poll_max_seconds: float = float(os.getenv("VECTOR_STORE_POLL_MAX_SECONDS", "10"))
+    vector_store_poll_backoff: float = float(os.getenv("VECTOR_STORE_POLL_BACKOFF", "2"))
+    vector_store_poll_timeout_seconds: float = float(os.getenv("VECTOR_STORE_POLL_TIMEOUT_SECONDS", "1800"))
+    vector_store_job_timeout_seconds: float = float(os.getenv("VECTOR_STORE_JOB_TIMEOUT_SECONDS", "3600"))
+    vector_store_stale_job_seconds: float = float(os.getenv("VECTOR_STORE_STALE_JOB_SECONDS", "7200"))
+
+    knownledge_batch_concurrency: int = int(os.getenv("KNOWNLEDGE_BATCH_CONCURRENCY", "8"))
+
+    knownledge_mirror_enabled: bool = os.getenv("KNOWNLEDGE_MIRROR_ENABLED", "false").lower() == "true"
+    knownledge_mirror_refresh_seconds: float = float(os.getenv("KNOWNLEDGE_MIRROR_REFRESH_SECONDS", "60"))
+    knownledge_mirror_full_refresh_seconds: float = float(os.getenv("KNOWNLEDGE_MIRROR_FULL_REFRESH_SECONDS", "3600"))
+    knownledge_mirror_page_size: int = int(os.getenv("KNOWNLEDGE_MIRROR_PAGE_SIZE", "100"))
     azure_ai_project_endpoint: str = os.getenv("AZURE_AI_PROJECT_ENDPOINT")
 
+    openai_pool_max_connections: int = int(os.getenv("OPENAI_POOL_MAX_CONNECTIONS", "100"))
+    openai_pool_max_keepalive: int = int(os.getenv("OPENAI_POOL_MAX_KEEPALIVE", "20"))
+    openai_pool_keepalive_expiry: float = float(os.getenv("OPENAI_POOL_KEEPALIVE_EXPIRY", "30.0"))
+    openai_pool_http2: bool = os.getenv("OPENAI_POOL_HTTP2", "true").lower() == "true"
+    openai_pool_timeout: float = float(os.getenv("OPENAI_POOL_TIMEOUT", "60.0"))
+
     azure_tenant_id: Optional[str] = os.getenv("AZURE_TENANT_ID")
     azure_client_id: Optional[str] = os.getenv("AZURE_CLIENT_ID")
     azure_client_secret: Optional[str] = os.getenv("AZURE_CLIENT_SECRET")
@@ -25,6 +25,18 @@ class DecisionAction(Enum):
     ACCEPT = "Accept"
     REJECT = "Reject"
 
+class GuardMode(Enum):
+    OFF = "off"
+    SEQUENTIAL = "sequential"
+    OVERLAPPED = "overlapped"
+
+class IngestionJobStatus(Enum):
+    PENDING = "pending"
+    UPLOADING = "uploading"
+    INDEXING = "indexing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 MEDIA_FILE_MAPPER = {
     'pdf': 'application/pdf',
     'jpg': 'image/jpeg',
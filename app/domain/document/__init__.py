@@ -0,0 +1,10 @@
+from app.domain.document.rendered_page import RenderedPage
+from app.domain.document.document_manifest import DocumentManifest
+from app.domain.document.stored_document import StoredDocument
+from app.domain.document.ingestion_job import IngestionJob, IngestionJobFile
+from app.domain.document.vector_store_file import VectorStoreFileRecord, VectorStoreFilePage
+
+__all__ = [
+    "RenderedPage", "DocumentManifest", "StoredDocument", "IngestionJob", "IngestionJobFile",
+    "VectorStoreFileRecord", "VectorStoreFilePage"
+]
@@ -0,0 +1,8 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class DocumentManifest(BaseModel):
+    content_hash: str = Field(description="SHA-256 of the uploaded source file")
+    file_name: Optional[str] = Field(default=None, description="File name of the latest upload")
+    pages: Dict[str, List[str]] = Field(default_factory=dict, description="Ordered page blob names by render profile")
+    vector_store_file_ids: Dict[str, str] = Field(default_factory=dict, description="Vector store file id by vector store id")
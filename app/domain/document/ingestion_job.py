@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.domain.contants import IngestionJobStatus
+
+class IngestionJobFile(BaseModel):
+    file_name: str = Field(description="Uploaded file name")
+    content_hash: str = Field(description="SHA-256 of the uploaded file")
+    file_path: Optional[str] = Field(default=None, exclude=True, description="Local copy uploaded by the job")
+    vector_store_file_id: Optional[str] = Field(default=None, description="File id in vector store")
+    status: IngestionJobStatus = Field(default=IngestionJobStatus.PENDING, description="File ingestion state")
+    deduplicated: bool = Field(default=False, description="Whether the file was already indexed")
+    error: Optional[str] = Field(default=None, description="Failure reason")
+
+class IngestionJob(BaseModel):
+    job_id: str = Field(description="Ingestion job id")
+    vector_store_id: str = Field(description="Target vector store")
+    status: IngestionJobStatus = Field(default=IngestionJobStatus.PENDING, description="Job state")
+    files: List[IngestionJobFile] = Field(default_factory=list, description="Files ingested by the job")
+    batch_id: Optional[str] = Field(default=None, description="Vector store file batch id")
+    error: Optional[str] = Field(default=None, description="Failure reason")
+    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    updated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
@@ -0,0 +1,14 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class RenderedPage(BaseModel):
+    page_number: int = Field(description="Zero based page index")
+    blob_name: str = Field(description="Blob name used when uploading the page")
+    content: Optional[bytes] = Field(default=None, description="Encoded page kept in memory")
+    file_path: Optional[str] = Field(default=None, description="Local file holding the encoded page")
+    temporary: bool = Field(default=False, description="Whether file_path must be removed after upload")
+    output_directory: Optional[str] = Field(default=None, description="Render output directory removed once empty")
+
+    @property
+    def size(self) -> int:
+        return len(self.content) if self.content is not None else 0
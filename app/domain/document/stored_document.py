@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+class StoredDocument(BaseModel):
+    file_path: str = Field(description="Local path of the ingested upload")
+    content_hash: str = Field(description="SHA-256 of the upload computed while it was written")
+    size: int = Field(description="Number of bytes written")
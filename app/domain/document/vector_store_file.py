@@ -0,0 +1,15 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+class VectorStoreFileRecord(BaseModel):
+    vector_store_id: str = Field(description="Vector store holding the file")
+    vector_store_file_id: str = Field(description="File id in vector store")
+    file_name: Optional[str] = Field(default=None, description="file_name attribute set on upload")
+    status: Optional[str] = Field(default=None, description="Indexing status reported by the vector store")
+    created_at: int = Field(description="Unix timestamp of the file creation")
+    usage_bytes: Optional[int] = Field(default=None, description="Storage used by the indexed file")
+
+class VectorStoreFilePage(BaseModel):
+    data: List[VectorStoreFileRecord] = Field(default_factory=list, description="Files in the page, newest first")
+    has_more: bool = Field(default=False, description="Whether more files follow this page")
+    next_after: Optional[str] = Field(default=None, description="Cursor to request the next page")
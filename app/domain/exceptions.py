@@ -6,6 +6,11 @@ class DomainExceptionCode(Enum):
     THREAD_NOT_FOUND = "THREAD_NOT_FOUND"
     GUARDIAL_POLICIES_VIOLATED = "GUARDIAL POLICIES VIOLATED"
     SAVE_LOCALLY_ERROR = "SAVE_LOCALLY_ERROR"
+    DOCUMENT_TOO_LARGE = "DOCUMENT_TOO_LARGE"
+    INGESTION_JOB_NOT_FOUND = "INGESTION_JOB_NOT_FOUND"
+    CONVERSATION_BUSY = "CONVERSATION_BUSY"
+    IDEMPOTENCY_KEY_MISMATCH = "IDEMPOTENCY_KEY_MISMATCH"
+    INVALID_PAGE_CURSOR = "INVALID_PAGE_CURSOR"
 
 class DomainException(Exception):
     def __init__(self, message: str, error_code: Optional[DomainExceptionCode] = ""):
@@ -60,4 +65,56 @@ class UploadDocumentError(DomainException):
         return {
             "file_name": self.file_name
         }
-    
\ No newline at end of file
+
+class DocumentTooLarge(DomainException):
+    def __init__(self, file_name: str, max_bytes: int):
+        super().__init__(f"El archivo {file_name} supera el tamaño maximo permitido de {max_bytes} bytes",\
+                        DomainExceptionCode.DOCUMENT_TOO_LARGE)
+        self.file_name = file_name
+        self.max_bytes = max_bytes
+
+    def format_respone(self) -> Dict[str, Any]:
+        return {
+            "file_name": self.file_name,
+            "max_bytes": self.max_bytes
+        }
+
+class IngestionJobNotFound(DomainException):
+    def __init__(self, job_id: str):
+        super().__init__(f"No existe el trabajo de indexacion {job_id}", DomainExceptionCode.INGESTION_JOB_NOT_FOUND)
+        self.job_id = job_id
+
+    def format_respone(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id
+        }
+
+class InvalidPageCursor(DomainException):
+    def __init__(self, after: str):
+        super().__init__(f"El cursor de paginacion {after} no existe", DomainExceptionCode.INVALID_PAGE_CURSOR)
+        self.after = after
+
+    def format_respone(self) -> Dict[str, Any]:
+        return {
+            "after": self.after
+        }
+
+class IdempotencyKeyMismatch(DomainException):
+    def __init__(self, idempotency_key: str):
+        super().__init__(f"La clave de idempotencia {idempotency_key} ya fue usada con una solicitud distinta", DomainExceptionCode.IDEMPOTENCY_KEY_MISMATCH)
+        self.idempotency_key = idempotency_key
+
+    def format_respone(self) -> Dict[str, Any]:
+        return {
+            "idempotency_key": self.idempotency_key
+        }
+
+class ConversationBusy(DomainException):
+    def __init__(self, conversation_id: str):
+        super().__init__(f"La conversacion {conversation_id} tiene demasiadas solicitudes en curso", DomainExceptionCode.CONVERSATION_BUSY)
+        self.conversation_id = conversation_id
+
+    def format_respone(self) -> Dict[str, Any]:
+        return {
+            "conversation_id": self.conversation_id
+        }
@@ -0,0 +1,10 @@
+from typing import Any, Dict, Optional
+
+def parse_key_values(raw_value: Optional[str], cast: Any = str) -> Dict[str, Any]:
+    values = {}
+    for raw_item in (raw_value or "").split(","):
+        if "=" not in raw_item:
+            continue
+        key, value = raw_item.split("=", 1)
+        values[key.strip()] = cast(value.strip())
+    return values
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Tuple, Optional
+from typing import AsyncIterator, Dict, List, Any, Tuple, Optional
 
 JsonType = Dict[str, Any]
 JsonArrayType = List[JsonType]
@@ -38,14 +38,51 @@ class IAiProjectRepository(ABC):
     async def upload_to_vector_store(self, vector_store_id: str, file_full_path: str) -> str:
         pass
 
+    @abstractmethod
+    async def upload_file(self, file_full_path: str) -> str:
+        pass
+
+    @abstractmethod
+    async def add_file_to_vector_store(self, vector_store_id: str, file_id: str, attributes: Optional[JsonType] = None) -> Any:
+        pass
+
+    @abstractmethod
+    async def get_vector_store_file(self, vector_store_id: str, file_id: str) -> Any:
+        pass
+
+    @abstractmethod
+    async def create_vector_store_file_batch(self, vector_store_id: str, files: JsonArrayType) -> Any:
+        pass
+
+    @abstractmethod
+    async def get_vector_store_file_batch(self, vector_store_id: str, batch_id: str) -> Any:
+        pass
+
+    @abstractmethod
+    async def get_vector_store_file_batch_files(self, vector_store_id: str, batch_id: str) -> List[Any]:
+        pass
+
     @abstractmethod
     async def delete_file_from_vector_store(self, vector_store_id: str, vector_store_file_id: str):
         pass
 
+    @abstractmethod
+    async def delete_file(self, file_id: str) -> Any:
+        pass
+
     @abstractmethod
     async def get_files_from_vector_store(self, vector_store_id: str) -> List[Any]:
         pass
 
+    @abstractmethod
+    async def list_vector_store_files(self, vector_store_id: str, after: Optional[str] = None,
+                                      limit: Optional[int] = 20) -> Tuple[List[Any], bool]:
+        pass
+
+    @abstractmethod
+    def iter_vector_store_files(self, vector_store_id: str, page_size: Optional[int] = 100) -> AsyncIterator[Any]:
+        pass
+
     @abstractmethod
     async def chat(
                 self, conversation_id: str, 
@@ -55,6 +92,18 @@ class IAiProjectRepository(ABC):
     @abstractmethod
     async def create_vector_store(self, name: str) -> None:
         pass
+
+    @abstractmethod
+    async def get_vector_store(self, vector_store_id: str) -> Any:
+        pass
+
+    @abstractmethod
+    async def has_conversation_items(self, conversation_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def append_conversation_turn(self, conversation_id: str, formated_input: JsonArrayType, answer: str) -> List[Any]:
+        pass
     
     @abstractmethod
     async def stream_chat(
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+class ICacheRepository(ABC):
+
+    @abstractmethod
+    async def get(self, key: str, track: Optional[bool] = True) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
@@ -3,7 +3,8 @@ from azure.ai.contentsafety.models import TextCategory, AnalyzeTextResult
 from app.domain.contants import DecisionAction
 
 class IContentSafetyRepository:
-    async def analyze_text(self, text: str, blocklist_names: Optional[List[str]] = [] ) -> None:
+    async def analyze_text(self, text: str, blocklist_names: Optional[List[str]] = [],
+                           reject_thresholds: Optional[Dict[Any, int]] = None) -> None:
         pass
 
     def valide_categories(self, response: AnalyzeTextResult, reject_thresholds: Dict[Any, int]) -> Tuple[bool, List[TextCategory]]:
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.document import DocumentManifest
+
+class IDocumentManifestRepository(ABC):
+
+    @abstractmethod
+    async def get_manifest(self, content_hash: str) -> Optional[DocumentManifest]:
+        pass
+
+    @abstractmethod
+    async def save_pages(self, content_hash: str, file_name: str, render_profile: str, blob_names: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def save_vector_store_file(self, content_hash: str, file_name: str, vector_store_id: str, file_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_vector_store_file(self, vector_store_id: str, file_id: str) -> None:
+        pass
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncGenerator, List, Optional
+from app.domain.document import RenderedPage, StoredDocument
 
 class IDocumentRepository(ABC):
 
     @abstractmethod
-    async def save_document_locally(self, file: Any) -> str:
+    async def save_document_locally(self, file: Any) -> StoredDocument:
+        pass
+
+    @abstractmethod
+    async def remove_document_locally(self, local_file_path: str) -> None:
         pass
 
     @abstractmethod
     async def process_document(self, local_file_path: str) -> List[str]:
+        pass
+
+    @abstractmethod
+    def stream_document(self, local_file_path: str, blob_prefix: Optional[str] = None) -> AsyncGenerator[RenderedPage, None]:
         pass
\ No newline at end of file
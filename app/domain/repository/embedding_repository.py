@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+class IEmbeddingRepository(ABC):
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        pass
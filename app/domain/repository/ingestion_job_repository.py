@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.contants import IngestionJobStatus
+from app.domain.document import IngestionJob
+
+class IIngestionJobRepository(ABC):
+
+    @abstractmethod
+    async def save_job(self, job: IngestionJob) -> None:
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        pass
+
+    @abstractmethod
+    async def get_stale_jobs(self, statuses: List[IngestionJobStatus], updated_before: str) -> List[IngestionJob]:
+        pass
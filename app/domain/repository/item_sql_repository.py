@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict, List, Coroutine
+from typing import Optional, Any, Dict, List, Coroutine, Tuple
 
 JsonType = Dict[str, Any]
 JsonArrayType = List[JsonType]
@@ -15,6 +15,12 @@ class IItemSqlRepository(ABC):
                                   collection_name: Optional[str] = None, length: Optional[int] = None) -> Coroutine[Any, Any, List[JsonType]]:
         pass
 
+    @abstractmethod
+    async def get_sorted_items(self, filter: Dict[str, Any], sort: List[Tuple[str, int]],
+                               projection: Optional[Dict[str, Any]] = None, skip: Optional[int] = 0,
+                               length: Optional[int] = None, collection_name: Optional[str] = None) -> List[JsonType]:
+        pass
+
     @abstractmethod
     async def insert_item(self, raw_data: JsonType, collection_name: Optional[str] = None) -> None:
         pass
@@ -31,6 +37,10 @@ class IItemSqlRepository(ABC):
     async def batch_insert(self, items: List[JsonType], collection_name: Optional[str] = None):
         pass
 
+    @abstractmethod
+    async def bulk_write(self, operations: List[Any], ordered: Optional[bool] = True, collection_name: Optional[str] = None) -> Any:
+        pass
+
     @abstractmethod
     async def delete_item(self, item_id: str, collection_name: Optional[str] = None) -> None:
         pass
@@ -40,5 +50,14 @@ class IItemSqlRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_by_filter(self, filter: Dict[str, Any], updated_value: Dict[str, Any], collection_name: Optional[str] = None) -> None:
+    async def update_by_filter(self, filter: Dict[str, Any], updated_value: Dict[str, Any], collection_name: Optional[str] = None,
+                               upsert: Optional[bool] = False) -> None:
+        pass
+
+    @abstractmethod
+    async def create_index(self, keys: List[Tuple[str, int]], collection_name: Optional[str] = None, **kwargs: Any) -> str:
+        pass
+
+    @abstractmethod
+    async def explain_aggregate(self, pipeline: JsonArrayType, collection_name: Optional[str] = None) -> JsonType:
         pass
\ No newline at end of file
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+class IMetricsRepository(ABC):
+
+    @abstractmethod
+    def increment(self, name: str, value: Optional[float] = 1, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    @abstractmethod
+    def record(self, name: str, value: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    @abstractmethod
+    def average(self, name: str) -> float:
+        pass
+
+class NullMetricsRepository(IMetricsRepository):
+
+    def increment(self, name: str, value: Optional[float] = 1, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record(self, name: str, value: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def average(self, name: str) -> float:
+        return 0.0
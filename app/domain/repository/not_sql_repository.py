@@ -11,22 +11,32 @@ class INotSqlRepository:
     def _create_container(self, container_name: str):
         pass
 
-    def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
+    async def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
         pass
 
-    def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
+    async def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
         pass
 
-    def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
-                    enable_cross_partition_query: Optional[bool] = None,
-                    container: Optional[str] = None):
+    async def batch_insert(self, items: List[JsonType], partition_key: str, container: Optional[str] = None):
         pass
 
-    def delete_item(self):
+    async def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
+                          partition_key: Optional[str] = None,
+                          container: Optional[str] = None) -> JsonArrayType:
         pass
 
-    def upsert_item(self, body: Dict[str, Any], container: Optional[str] = None) -> None:
+    async def count_items(self, query: str, parameters: Optional[JsonArrayType] = None,
+                          partition_key: Optional[str] = None, container: Optional[str] = None) -> int:
         pass
 
-    def update_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
+    async def delete_item(self, item_id: str, partition_key: str, container: Optional[str] = None) -> None:
+        pass
+
+    async def batch_delete(self, item_ids: List[str], partition_key: str, container: Optional[str] = None) -> None:
+        pass
+
+    async def upsert_item(self, body: Dict[str, Any], container: Optional[str] = None) -> None:
+        pass
+
+    async def update_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
         pass
\ No newline at end of file
@@ -1,12 +1,24 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 
 class IStorageRepository(ABC):
 
+    @abstractmethod
+    async def generate_tokens(self, container_name: str, blob_names: List[str]) -> Dict[str, str]:
+        pass
+
+    @abstractmethod
+    async def generate_signed_urls(self, container_name: str, blob_names: List[str]) -> List[str]:
+        pass
+
     @abstractmethod
     async def upload_file(self, container_name: str, local_file_path: str, blob_name: Optional[str]) -> str:
         pass
 
+    @abstractmethod
+    async def upload_content(self, container_name: str, blob_name: str, content: bytes) -> str:
+        pass
+
     @abstractmethod
     async def upload_many_files(self, container_name: str, files_list: List[str], max_concurrent: Optional[str] = 20 ) -> List[str]:
         pass
\ No newline at end of file
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+class IVectorIndexRepository(ABC):
+
+    @abstractmethod
+    async def add(self, item_id: str, vector: List[float], payload: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def search(self, vector: List[float], k: int) -> List[Tuple[str, float, Any]]:
+        pass
+
+    @abstractmethod
+    async def remove(self, item_ids: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.document import VectorStoreFileRecord
+
+class IVectorStoreMirrorRepository(ABC):
+
+    @abstractmethod
+    async def create_indexes(self) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def upsert_files(self, records: List[VectorStoreFileRecord], synced_at: str) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_files(self, vector_store_id: str, file_ids: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_stale_files(self, vector_store_id: str, synced_before: str) -> None:
+        pass
+
+    @abstractmethod
+    async def list_files(self, vector_store_id: str, after: Optional[str] = None, limit: Optional[int] = 20,
+                         file_name: Optional[str] = None) -> List[VectorStoreFileRecord]:
+        pass
+
+    @abstractmethod
+    async def list_files_by_status(self, vector_store_id: str, status: str,
+                                   limit: Optional[int] = 100) -> List[VectorStoreFileRecord]:
+        pass
+
+    @abstractmethod
+    async def get_latest_created_at(self, vector_store_id: str) -> Optional[int]:
+        pass
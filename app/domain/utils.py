@@ -2,13 +2,17 @@ import os
 import logging
 import fitz
 from PIL import Image
+import re
 import io
+import tempfile
+import unicodedata
 from typing import Any, Dict, List, Optional, Union, Tuple
 from uuid import uuid4, UUID
 from datetime import datetime
 from urllib.parse import urlparse
 from app.domain.contants import MEDIA_FILE_MAPPER
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from app.domain.document import RenderedPage
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from tqdm import tqdm 
 from agent_framework import DataContent
 
@@ -37,94 +41,199 @@ def get_or_create_uuid(session_id: Optional[Union[UUID, str]] =  None) -> UUID:
     except (ValueError, AttributeError):
         return generate_uuid()
     
+def normalize_text(text: str) -> str:
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
 def get_current_datetime() -> str:
     return datetime.now().isoformat()
 
-def secuential_pdf_to_img(img_folder: str, source_pdf: str, dpi: Optional[int] = 150, format: Optional[str] = 'jpg'):
+def copy_hashed_chunk(source: Any, buffer: Any, digest: Any, chunk_size: int) -> int:
+    chunk = source.read(chunk_size)
+    buffer.write(chunk)
+    digest.update(chunk)
+    return len(chunk)
+
+PIXMAP_COLORSPACES = {
+    "rgb": fitz.csRGB,
+    "gray": fitz.csGRAY,
+}
+
+PIL_IMAGE_FORMATS = {
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "webp": "WEBP",
+}
+
+def render_pixmap(page: Any, dpi: Optional[int] = 150, colorspace: Optional[str] = "rgb") -> Any:
+    zoom = dpi / 72
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=PIXMAP_COLORSPACES[colorspace], alpha=False)
+
+def encode_pixmap(pixmap: Any, output_file_path: str, format: Optional[str] = 'jpg', quality: Optional[int] = 95) -> str:
+    format = format.lower()
+
+    if format == "png":
+        pixmap.save(output_file_path, output="png")
+    elif format in PIL_IMAGE_FORMATS:
+        mode = "L" if pixmap.n == 1 else "RGB"
+        img = Image.frombytes(mode, (pixmap.width, pixmap.height), pixmap.samples_mv, "raw", mode, pixmap.stride)
+        img.save(output_file_path, PIL_IMAGE_FORMATS[format], quality=quality)
+    else:
+        raise ValueError(f"Unsupported image format {format}")
+
+    return output_file_path
+
+def encode_pixmap_bytes(pixmap: Any, format: Optional[str] = 'jpg', quality: Optional[int] = 95) -> bytes:
+    format = format.lower()
+
+    if format == "png":
+        return pixmap.tobytes("png")
+
+    if format not in PIL_IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format {format}")
+
+    mode = "L" if pixmap.n == 1 else "RGB"
+    img = Image.frombytes(mode, (pixmap.width, pixmap.height), pixmap.samples_mv, "raw", mode, pixmap.stride)
+    buffer = io.BytesIO()
+    img.save(buffer, PIL_IMAGE_FORMATS[format], quality=quality)
+    return buffer.getvalue()
+
+def remove_pdf_output(output_directory: str) -> None:
+    for directory in (output_directory, os.path.dirname(output_directory)):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            return
+
+def release_rendered_page(rendered_page: RenderedPage) -> None:
+    if rendered_page.temporary and rendered_page.file_path:
+        try:
+            os.remove(rendered_page.file_path)
+        except FileNotFoundError:
+            pass
+    if rendered_page.output_directory:
+        remove_pdf_output(rendered_page.output_directory)
+
+def secuential_pdf_to_img(img_folder: str, source_pdf: str, dpi: Optional[int] = 150, format: Optional[str] = 'jpg',
+                          quality: Optional[int] = 95, colorspace: Optional[str] = "rgb"):
 
     os.makedirs(img_folder, exist_ok=True)
 
-    pdf = fitz.open(source_pdf)
-    
-    for page_number in range(len(pdf)):
-        pagina = pdf[page_number]
-        
-        zoom = dpi / 72
-        matriz = fitz.Matrix(zoom, zoom)
-        pixmap = pagina.get_pixmap(matrix=matriz)
-        
-        img_data = pixmap.tobytes("ppm")
-        img = Image.open(io.BytesIO(img_data))
-        
-        file_name = f"page_{page_number + 1:03d}.{format}"
-        ruta_completa = os.path.join(img_folder, file_name)
-        
-        if format.lower() in ["jpg", "jpeg"]:
-            if img.mode in ("RGBA", "LA", "P"):
-                img = img.convert("RGB")
-            img.save(ruta_completa, "JPEG", quality=95)
-        else:
-            img.save(ruta_completa, "PNG")
-        
-    pdf.close()
+    with fitz.open(source_pdf) as pdf:
+        for page_number in range(len(pdf)):
+            pixmap = render_pixmap(pdf[page_number], dpi, colorspace)
+            file_name = f"page_{page_number + 1:03d}.{format}"
+            encode_pixmap(pixmap, os.path.join(img_folder, file_name), format, quality)
 
 def page_pdf_to_img(
                 source_pdf: str, page_number: str, output_directory: str,
-                output_file_path: str, format: Optional[str] = 'jpg', dpi: Optional[int] = 150 
+                output_file_path: str, format: Optional[str] = 'jpg', dpi: Optional[int] = 150,
+                quality: Optional[int] = 95, colorspace: Optional[str] = "rgb"
             ) -> Tuple[int, str]:
     os.makedirs(output_directory, exist_ok=True)
-    pdf = fitz.open(source_pdf)
-    pagina = pdf[page_number]
-        
-    zoom = dpi / 72
-    matriz = fitz.Matrix(zoom, zoom)
-    pixmap = pagina.get_pixmap(matrix=matriz)
-    
-    img_data = pixmap.tobytes("ppm")
-    img = Image.open(io.BytesIO(img_data))
-    
-    if format.lower() in ["jpg", "jpeg"]:
-        if img.mode in ("RGBA", "LA", "P"):
-            img = img.convert("RGB")
-        img.save(output_file_path, "JPEG", quality=95)
-    else:
-        img.save(output_file_path, "PNG")
-    
-    pdf.close()
+
+    with fitz.open(source_pdf) as pdf:
+        pixmap = render_pixmap(pdf[page_number], dpi, colorspace)
+        encode_pixmap(pixmap, output_file_path, format, quality)
+
     return page_number, output_file_path
 
+def page_range_pdf_to_img(
+                source_pdf: str, start_page: int, end_page: int, output_directory: str,
+                format: Optional[str] = 'jpg', dpi: Optional[int] = 150,
+                quality: Optional[int] = 95, colorspace: Optional[str] = "rgb"
+            ) -> List[Tuple[int, str]]:
+    os.makedirs(output_directory, exist_ok=True)
+    results = []
+
+    with fitz.open(source_pdf) as pdf:
+        for page_number in range(start_page, end_page):
+            pixmap = render_pixmap(pdf[page_number], dpi, colorspace)
+            output_file_path = encode_pixmap(
+                pixmap, f"{output_directory}/page_{page_number}.{format}", format, quality
+            )
+            results.append((page_number, output_file_path))
 
-def parrallel_pdf_to_img(source_pdf: str, dpi: Optional[int] = 150, 
-                         image_format: Optional[str] = 'jpg', max_workers:  Optional[int] = 40) -> List[str]:
-    print(f"Source Pdf {source_pdf}")
-    source_pdf_file = fitz.open(source_pdf)
-    total_pages = len(source_pdf_file)
-    file_name = source_pdf_file.name
-    source_pdf_file.close()
+    return results
 
-    output_directory_name = f"images/{generate_uuid()}/{file_name}"
+def page_range_pdf_to_pages(
+                source_pdf: str, start_page: int, end_page: int,
+                format: Optional[str] = 'jpg', dpi: Optional[int] = 150,
+                quality: Optional[int] = 95, colorspace: Optional[str] = "rgb",
+                output_directory: Optional[str] = None, max_memory_bytes: Optional[int] = None,
+                spill_directory: Optional[str] = None, blob_prefix: Optional[str] = None
+            ) -> List[RenderedPage]:
+    if output_directory:
+        os.makedirs(output_directory, exist_ok=True)
+    results = []
 
-    result_process = []
+    with fitz.open(source_pdf) as pdf:
+        for page_number in range(start_page, end_page):
+            pixmap = render_pixmap(pdf[page_number], dpi, colorspace)
+            file_name = f"page_{page_number}.{format}"
+            blob_name = f"{blob_prefix}/{file_name}" if blob_prefix else file_name
 
-    args_list = [
-        (
-            source_pdf, index, output_directory_name, 
-            f"{output_directory_name}/page_{index}.{image_format}", image_format, dpi
-        ) 
-        for index in range(total_pages)
+            if output_directory:
+                file_path = encode_pixmap(pixmap, f"{output_directory}/{file_name}", format, quality)
+                results.append(RenderedPage(page_number=page_number, blob_name=blob_name, file_path=file_path, temporary=True))
+                continue
+
+            content = encode_pixmap_bytes(pixmap, format, quality)
+            if max_memory_bytes and len(content) > max_memory_bytes:
+                with tempfile.NamedTemporaryFile(suffix=f".{format}", dir=spill_directory, delete=False) as spill_file:
+                    spill_file.write(content)
+                results.append(RenderedPage(page_number=page_number, blob_name=blob_name, file_path=spill_file.name, temporary=True))
+            else:
+                results.append(RenderedPage(page_number=page_number, blob_name=blob_name, content=content))
+
+    return results
+
+def split_page_ranges(total_pages: int, max_workers: int, first_range_pages: Optional[int] = 0,
+                      max_range_pages: Optional[int] = None) -> List[Tuple[int, int]]:
+    first_range = [(0, min(first_range_pages, total_pages))] if first_range_pages > 0 and total_pages else []
+    start = first_range[0][1] if first_range else 0
+
+    pages_per_range = max(1, -(-(total_pages - start) // max(1, max_workers)))
+    if max_range_pages:
+        pages_per_range = min(pages_per_range, max_range_pages)
+    return first_range + [
+        (start_page, min(start_page + pages_per_range, total_pages))
+        for start_page in range(start, total_pages, pages_per_range)
     ]
-    
-    
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+def prepare_pdf_output(source_pdf: str) -> Tuple[int, str]:
+    with fitz.open(source_pdf) as source_pdf_file:
+        total_pages = len(source_pdf_file)
+        file_name = source_pdf_file.name
+
+    return total_pages, f"images/{generate_uuid()}/{file_name}"
+
+def parrallel_pdf_to_img(source_pdf: str, dpi: Optional[int] = 150, 
+                         image_format: Optional[str] = 'jpg', max_workers:  Optional[int] = None,
+                         executor: Optional[Executor] = None, quality: Optional[int] = 95,
+                         colorspace: Optional[str] = "rgb") -> List[str]:
+    logger.debug("Source pdf %s", source_pdf)
+    total_pages, output_directory_name = prepare_pdf_output(source_pdf)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    result_process = []
+    owned_executor = executor is None
+    executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+
+    try:
         futures = [
-                    executor.submit(page_pdf_to_img, *args) 
-                    for args in args_list
+                    executor.submit(page_range_pdf_to_img, source_pdf, start_page, end_page,
+                                    output_directory_name, image_format, dpi, quality, colorspace)
+                    for start_page, end_page in split_page_ranges(total_pages, max_workers)
                 ]
-        
+
         with tqdm(total=total_pages, desc="Converting pdf to images", unit="pag") as pbar:
             for future in as_completed(futures):
-                result_process.append(future.result())
-                pbar.update(1)
+                rendered_pages = future.result()
+                result_process.extend(rendered_pages)
+                pbar.update(len(rendered_pages))
+    finally:
+        if owned_executor:
+            executor.shutdown()
 
     result_process = [ result for _, result in sorted(result_process, key=lambda x: x[0]) ]
 
@@ -153,7 +262,7 @@ def get_class_name(current_class: Any):
 def url_to_data_content(url: str, media_type: str) -> Any:
     import requests
     import base64
-    print(f"La url {url}")
+    logger.debug("Downloading data content from %s", url)
     response = requests.get(url)
     response.raise_for_status()
     
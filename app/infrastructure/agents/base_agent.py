@@ -14,6 +14,7 @@ from app.infrastructure.repository.mongo_db import MongoDbRepository
 from app.infrastructure.repository.mongo_message_store import MongoChatMessageStore
 from app.infrastructure.agents.plugins.monitored_agent import MonitoredChatAgent
 from app.infrastructure.agents.clients.external_client import ExternalClient
+from app.infrastructure.contants import CONVERSATIONS_DATABASE, CONVERSATIONS_COLLECTION
     
 class BaseAgentFactory(ABC):
     @abstractmethod
@@ -119,8 +120,8 @@ class BaseAgentFactory(ABC):
     
         chat_message_store_factory = MongoChatMessageStore( 
                                 db_repository=MongoDbRepository(
-                                    database_name="agent_manager",
-                                    collection_name="conversations",
+                                    database_name=CONVERSATIONS_DATABASE,
+                                    collection_name=CONVERSATIONS_COLLECTION,
                                     client=db_client
                                 ),
                                 thread_id=thread_id
@@ -5,11 +5,14 @@ from agent_framework import (
     TextContent
 ) 
 import asyncio
+import logging
 from app.infrastructure.repository.http import HttpRepository
 from app.domain.agent.agent import ExternalAgentResponse
 from app.domain.utils import replace_path_param
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 MessageAgentType = str | ChatMessage | list[str] | list[ChatMessage]
 
 class ExternalClient(ChatClientProtocol):
@@ -51,7 +54,7 @@ class ExternalClient(ChatClientProtocol):
 
     def mapper_instance_value(self, value: MessageAgentType) -> dict[str, Any]:
         type_value = type(value)
-        print(f"Message type {type_value} -> value: {value}")
+        logger.debug("Message type %s -> value: %s", type_value, value)
         MAPPER_INSTANCE = {
             str: self.format_string,
             ChatMessage: self.format_chat_message,
@@ -79,7 +82,7 @@ class ExternalClient(ChatClientProtocol):
 
         try:
             request_external_agent = self.mapper_instance_value(messages)
-            print("RequestExternalAgent:", request_external_agent)
+            logger.debug("Request external agent: %s", request_external_agent)
             context_information = self.get_context_information()
 
             agent_response = await self.http_client.post(self.chat_endpoint, { **request_external_agent, **context_information})
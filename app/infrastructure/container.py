@@ -1,11 +1,17 @@
-from typing import Any
+from typing import Any, Optional
+from datetime import timedelta
 from functools import lru_cache
 from app.config import get_settings
 
 from app.application.services.agent_manager import AgentManager
+from app.application.services.conversation_coordinator import ConversationLockRegistry, RequestCoalescer
+from app.application.services.idempotency_manager import IdempotencyManager
+from app.application.services.semantic_cache_manager import SemanticCacheManager
 from app.application.services.thread_manager import ThreadManager
 from app.application.services.document_manager import DocumentManager
 from app.application.services.ai_source_manager import AiSourceManager
+from app.application.services.ingestion_job_manager import IngestionJobManager
+from app.application.services.knownledge_mirror_manager import KnownledgeMirrorManager
 
 from app.application.use_cases.handle_conversation import (
     HandleMessageUseCase, HandleMessageStreamUseCase, 
@@ -31,12 +37,33 @@ from app.infrastructure.repository.content_safety import ContentSafetyGuardilRep
 
 from app.infrastructure.repository.document_manager import DocumentManagerRepository
 from app.infrastructure.repository.storage_account import StorageAccountRepository
+from app.infrastructure.repository.document_manifest import DocumentManifestRepository
+from app.infrastructure.repository.ingestion_job import IngestionJobRepository
+from app.infrastructure.repository.vector_store_mirror import VectorStoreMirrorRepository
 from app.infrastructure.repository.azure_foundry_repository import AzureFoundryRepository
 from app.infrastructure.repository.azure_credential_repository import AzureCredentialRepository, CredentialType
 
 
 from pymongo import AsyncMongoClient
 from app.infrastructure.managers.http_manager import HttpRepositoryManager
+from app.infrastructure.managers.openai_client_manager import OpenAiClientManager
+from app.infrastructure.managers.cosmos_client_manager import CosmosClientManager
+from app.infrastructure.managers.mongo_index_manager import MongoIndexManager
+from app.infrastructure.managers.render_pool_manager import RenderPoolManager
+from app.infrastructure.contants import CONVERSATIONS_DATABASE, CONVERSATIONS_COLLECTION, DOCUMENT_MANIFEST_COLLECTION, INGESTION_JOBS_COLLECTION, VECTOR_STORE_FILES_COLLECTION, IDEMPOTENCY_RECORDS_COLLECTION, MongoIndexMode
+from app.domain.contants import GuardMode
+from app.domain.repository.cache_repository import ICacheRepository
+from app.domain.repository.document_manifest_repository import IDocumentManifestRepository
+from app.domain.repository.vector_store_mirror_repository import IVectorStoreMirrorRepository
+from app.infrastructure.repository.memory_cache import MemoryCacheRepository
+from app.infrastructure.repository.redis_cache import RedisCacheRepository
+from app.infrastructure.repository.mongo_cache import MongoCacheRepository
+from app.infrastructure.repository.openai_embedding import OpenAiEmbeddingRepository
+from app.infrastructure.repository.hashing_embedding import HashingEmbeddingRepository
+from app.infrastructure.repository.memory_vector_index import MemoryVectorIndexRepository
+from app.infrastructure.repository.metrics import MetricsRepository
+from app.domain.repository.embedding_repository import IEmbeddingRepository
+import redis.asyncio as redis
 from azure.ai.contentsafety.aio import ContentSafetyClient
 from azure.core.credentials import AzureKeyCredential
 
@@ -52,7 +79,9 @@ class DependencyContainer:
         self._db_client = None
         self._storage_client = None
         self._content_safety_client = None
+        self._redis_clients = {}
         self._ai_project_client = None
+        self._openai_client_manager = None
 
     def _ensure_initialized(self):
         if self._initialized:
@@ -61,23 +90,52 @@ class DependencyContainer:
         settings = get_settings()
         # Core infrastructure
         self._factories["chat_client"] = ChatClientFactory.create_client
+        self._factories["metrics_repository"] = lambda: MetricsRepository()
         
         self._factories["db_repository"] = lambda: MongoDbRepository(self._get_db_client(), settings.mongo_db_name)        
-        self._factories["azure_foundry_repository"] = lambda: AzureFoundryRepository(self._get_ai_project_client())
+        self._factories["azure_foundry_repository"] = lambda: AzureFoundryRepository(
+            self._get_ai_project_client(), self._get_openai_client_manager()
+        )
+
+        self._factories["mongo_index_manager"] = lambda: MongoIndexManager(
+            MongoDbRepository(self._get_db_client(), CONVERSATIONS_DATABASE, CONVERSATIONS_COLLECTION),
+            mode=MongoIndexMode(settings.mongo_index_mode),
+            conversation_ttl_seconds=settings.mongo_conversation_ttl_seconds
+        )
 
         self._factories["thread_manager_repository"] = lambda: ThreadManagerRepository(self.get("db_repository"))
 
-        self._factories["content_safety_repository"] = lambda: ContentSafetyGuardilRepository(self._get_content_safety_client())
+        self._factories["content_safety_repository"] = lambda: ContentSafetyGuardilRepository(
+            self._get_content_safety_client(),
+            max_chunk_length=settings.content_safety_max_chunk_length,
+            max_concurrency=settings.content_safety_max_concurrency
+        )
         
         #TODO: replace this part
         self._factories["document_repository"] = lambda: DocumentManagerRepository()
-        self._factories["storage_repository"] = lambda: StorageAccountRepository(self._get_storage_client(), settings.storage_account_name)
+        self._factories["storage_repository"] = lambda: StorageAccountRepository(
+            self._get_storage_client(),
+            settings.storage_account_name,
+            delegation_key_lifetime=timedelta(minutes=settings.storage_delegation_key_lifetime_minutes),
+            delegation_key_refresh_margin=timedelta(minutes=settings.storage_delegation_key_refresh_minutes),
+            sas_lifetime=timedelta(minutes=settings.storage_sas_lifetime_minutes)
+        )
         
         self._factories["agent_core"] = lambda: AgentCore(self._get_db_client(), self.get('storage_repository'))
 
         self._factories["agent_manager"] = lambda: AgentManager(
             self.get('azure_foundry_repository'),
             self.get('content_safety_repository'),
+            self._get_verdict_cache(),
+            self._get_conversation_locks(),
+            RequestCoalescer(self.get('metrics_repository')) if settings.conversation_coalescing_enabled else None,
+            self._get_semantic_cache(),
+            self.get('metrics_repository')
+        )
+        self._factories["idempotency_manager"] = lambda: IdempotencyManager(
+            self._get_idempotency_store(),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+            metrics_repository=self.get('metrics_repository')
         )
         self._factories["thread_manager"] = lambda: ThreadManager(
             self.get('azure_foundry_repository')
@@ -85,12 +143,41 @@ class DependencyContainer:
 
         self._factories["document_manager"] = lambda: DocumentManager(
                 self.get('document_repository'),
-                self.get('storage_repository')
+                self.get('storage_repository'),
+                self._get_document_manifest_repository(),
+                self.get('metrics_repository')
             )
 
         self._factories["ai_source_manager"] = lambda: AiSourceManager(
                 self.get('document_repository'),
-                self.get('azure_foundry_repository')
+                self.get('azure_foundry_repository'),
+                self._get_document_manifest_repository(),
+                self._get_vector_store_mirror_repository(),
+                self.get('metrics_repository')
+            )
+
+        self._factories["ingestion_job_manager"] = lambda: IngestionJobManager(
+                self.get('ai_source_manager'),
+                IngestionJobRepository(
+                    MongoDbRepository(self._get_db_client(), settings.mongo_db_name, INGESTION_JOBS_COLLECTION)
+                ),
+                upload_concurrency=settings.vector_store_upload_concurrency,
+                poll_initial_seconds=settings.vector_store_poll_initial_seconds,
+                poll_max_seconds=settings.vector_store_poll_max_seconds,
+                poll_backoff=settings.vector_store_poll_backoff,
+                poll_timeout_seconds=settings.vector_store_poll_timeout_seconds,
+                job_timeout_seconds=settings.vector_store_job_timeout_seconds,
+                stale_job_seconds=settings.vector_store_stale_job_seconds,
+                metrics_repository=self.get('metrics_repository')
+            )
+
+        self._factories["knownledge_mirror_manager"] = lambda: KnownledgeMirrorManager(
+                self.get('ai_source_manager'),
+                self._get_vector_store_mirror_repository(),
+                refresh_seconds=settings.knownledge_mirror_refresh_seconds,
+                full_refresh_seconds=settings.knownledge_mirror_full_refresh_seconds,
+                page_size=settings.knownledge_mirror_page_size,
+                metrics_repository=self.get('metrics_repository')
             )
 
         # Orchestrator (depends on chat_client and conversation_manager)
@@ -113,12 +200,16 @@ class DependencyContainer:
 
     def get_handle_message_use_case(self) -> HandleMessageUseCase:
         return HandleMessageUseCase(
-            agent_manager=self.get("agent_manager")
+            agent_manager=self.get("agent_manager"),
+            guard_mode=GuardMode(get_settings().chat_guard_mode),
+            idempotency_manager=self._get_idempotency_manager()
         )
 
     def get_handle_message_stream_use_case(self) -> HandleMessageStreamUseCase:
           return HandleMessageStreamUseCase(
-            agent_manager=self.get("agent_manager")
+            agent_manager=self.get("agent_manager"),
+            guard_mode=GuardMode(get_settings().stream_guard_mode),
+            idempotency_manager=self._get_idempotency_manager()
         )
 
     def get_handle_threads_use_case(self) -> HandleThreadsUseCase:
@@ -133,7 +224,9 @@ class DependencyContainer:
 
     def get_handle_knownledge_use_case(self) -> HandleKnownledgeDocumentsUseCase:
         return HandleKnownledgeDocumentsUseCase(
-            ai_source_manager=self.get('ai_source_manager')
+            ai_source_manager=self.get('ai_source_manager'),
+            ingestion_job_manager=self.get('ingestion_job_manager'),
+            batch_concurrency=get_settings().knownledge_batch_concurrency
         )
 
 
@@ -164,6 +257,121 @@ class DependencyContainer:
             
         return self._content_safety_client
 
+    def _get_redis_client(self, redis_url: Optional[str] = None) -> redis.Redis:
+        redis_url = redis_url or get_settings().content_safety_cache_redis_url
+        if redis_url not in self._redis_clients:
+            self._redis_clients[redis_url] = redis.Redis.from_url(redis_url)
+
+        return self._redis_clients[redis_url]
+
+    def _get_verdict_cache(self) -> Optional[ICacheRepository]:
+        settings = get_settings()
+        if not settings.content_safety_cache_enabled:
+            return None
+
+        local_cache = MemoryCacheRepository(
+            max_size=settings.content_safety_cache_max_size,
+            ttl_seconds=settings.content_safety_cache_ttl_seconds,
+            metrics_prefix="content_safety_verdict_cache"
+        )
+        if not settings.content_safety_cache_redis_url:
+            return local_cache
+
+        return RedisCacheRepository(
+            self._get_redis_client(),
+            key_prefix="content_safety_verdict",
+            ttl_seconds=settings.content_safety_cache_ttl_seconds,
+            local_cache=local_cache,
+            metrics_prefix="content_safety_verdict_shared_cache"
+        )
+
+    def _get_embedding_repository(self) -> IEmbeddingRepository:
+        settings = get_settings()
+        if settings.semantic_cache_embedder == "hashing":
+            return HashingEmbeddingRepository(settings.semantic_cache_embedding_dimensions)
+
+        return OpenAiEmbeddingRepository(
+            self._get_openai_client_manager(),
+            settings.semantic_cache_embedding_model,
+            settings.semantic_cache_embedding_dimensions
+        )
+
+    def _get_semantic_cache(self) -> Optional[SemanticCacheManager]:
+        settings = get_settings()
+        if not settings.semantic_cache_enabled:
+            return None
+
+        return SemanticCacheManager(
+            self._get_embedding_repository(),
+            MemoryVectorIndexRepository(settings.semantic_cache_max_size, metrics_prefix="semantic_cache"),
+            self.get('ai_source_manager').get_vector_store_version,
+            similarity_threshold=settings.semantic_cache_similarity_threshold,
+            ttl_seconds=settings.semantic_cache_ttl_seconds,
+            version_refresh_seconds=settings.semantic_cache_version_refresh_seconds,
+            metrics_repository=self.get('metrics_repository')
+        )
+
+    def _get_idempotency_store(self) -> ICacheRepository:
+        settings = get_settings()
+        local_cache = MemoryCacheRepository(
+            max_size=settings.idempotency_max_size,
+            ttl_seconds=settings.idempotency_ttl_seconds,
+            metrics_prefix="idempotency_cache"
+        )
+
+        if settings.idempotency_backend == "redis":
+            return RedisCacheRepository(
+                self._get_redis_client(settings.idempotency_redis_url),
+                key_prefix="idempotency",
+                ttl_seconds=settings.idempotency_ttl_seconds,
+                local_cache=local_cache,
+                metrics_prefix="idempotency_shared_cache"
+            )
+
+        if settings.idempotency_backend == "mongo":
+            return MongoCacheRepository(
+                MongoDbRepository(self._get_db_client(), settings.mongo_db_name, IDEMPOTENCY_RECORDS_COLLECTION),
+                ttl_seconds=settings.idempotency_ttl_seconds,
+                local_cache=local_cache,
+                metrics_prefix="idempotency_shared_cache"
+            )
+
+        return local_cache
+
+    def _get_idempotency_manager(self) -> Optional[IdempotencyManager]:
+        if not get_settings().idempotency_enabled:
+            return None
+        return self.get("idempotency_manager")
+
+    def _get_conversation_locks(self) -> Optional[ConversationLockRegistry]:
+        settings = get_settings()
+        if not settings.conversation_lock_enabled:
+            return None
+
+        return ConversationLockRegistry(
+            max_pending=settings.conversation_lock_max_pending,
+            acquire_timeout_seconds=settings.conversation_lock_timeout_seconds or None,
+            metrics_repository=self.get('metrics_repository')
+        )
+
+    def _get_document_manifest_repository(self) -> Optional[IDocumentManifestRepository]:
+        settings = get_settings()
+        if not settings.document_dedup_enabled:
+            return None
+
+        return DocumentManifestRepository(
+            MongoDbRepository(self._get_db_client(), settings.mongo_db_name, DOCUMENT_MANIFEST_COLLECTION)
+        )
+
+    def _get_vector_store_mirror_repository(self) -> Optional[IVectorStoreMirrorRepository]:
+        settings = get_settings()
+        if not settings.knownledge_mirror_enabled:
+            return None
+
+        return VectorStoreMirrorRepository(
+            MongoDbRepository(self._get_db_client(), settings.mongo_db_name, VECTOR_STORE_FILES_COLLECTION)
+        )
+
     def _get_ai_project_client(self) -> AIProjectClient:
         if self._ai_project_client is None:
             settings = get_settings()
@@ -172,22 +380,53 @@ class DependencyContainer:
             
         return self._ai_project_client
 
+    def _get_openai_client_manager(self) -> OpenAiClientManager:
+        if self._openai_client_manager is None:
+            settings = get_settings()
+            self._openai_client_manager = OpenAiClientManager(
+                self._get_ai_project_client(),
+                max_connections=settings.openai_pool_max_connections,
+                max_keepalive_connections=settings.openai_pool_max_keepalive,
+                keepalive_expiry=settings.openai_pool_keepalive_expiry,
+                http2=settings.openai_pool_http2,
+                timeout=settings.openai_pool_timeout
+            )
+
+        return self._openai_client_manager
+
     async def close_all(self):
         
         print("Closing all connection...")
+        if "mongo_index_manager" in self._instances:
+            await self._instances["mongo_index_manager"].close()
+
+        if "ingestion_job_manager" in self._instances:
+            await self._instances["ingestion_job_manager"].close()
+
+        if "knownledge_mirror_manager" in self._instances:
+            await self._instances["knownledge_mirror_manager"].close()
+
         if self._db_client:
             await self._db_client.close()
         
         if self._content_safety_client:
             await self._content_safety_client.close()
 
+        for redis_client in self._redis_clients.values():
+            await redis_client.aclose()
+
+        if self._openai_client_manager:
+            await self._openai_client_manager.close()
+
         if self._ai_project_client:
-            self._ai_project_client.close()
+            await self._ai_project_client.close()
         
         if self._storage_client:
             await self._storage_client.close()
 
         await HttpRepositoryManager.close_all_sessions()
+        await CosmosClientManager.close_all_clients()
+        RenderPoolManager.shutdown()
 
         self.clear()
         print("All connection are closed")
@@ -17,6 +17,22 @@ class AgentType(Enum):
     GEN_IA = "gen_ia"
     FROM_CATALOG= "agents_from_catalog"
 
+CONVERSATIONS_DATABASE = "agent_manager"
+CONVERSATIONS_COLLECTION = "conversations"
+DOCUMENT_MANIFEST_COLLECTION = "document_manifests"
+INGESTION_JOBS_COLLECTION = "ingestion_jobs"
+VECTOR_STORE_FILES_COLLECTION = "vector_store_files"
+IDEMPOTENCY_RECORDS_COLLECTION = "idempotency_records"
+
+class MongoIndexMode(Enum):
+    OFF = "off"
+    CREATE = "create"
+    VERIFY = "verify"
+
+class HistoryTrimStrategy(Enum):
+    COUNT_AGGREGATE = "count_aggregate"
+    BULK_WRITE = "bulk_write"
+
 class AgentClassificationLabel(Enum):
     GEN_IA = "gen_ia_agent"
     FROM_CATALOG = "from_catalog_agent"
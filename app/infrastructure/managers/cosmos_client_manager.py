@@ -0,0 +1,29 @@
+from typing import Dict, Optional
+from azure.cosmos.aio import CosmosClient
+from azure.identity.aio import DefaultAzureCredential
+
+class CosmosClientManager:
+    _clients: Dict[str, CosmosClient] = {}
+    _credential: Optional[DefaultAzureCredential] = None
+
+    @classmethod
+    def get_client_for_url(cls, url: str) -> CosmosClient:
+        from urllib.parse import urlparse
+        key = urlparse(url).hostname or url
+
+        if key not in cls._clients:
+            if cls._credential is None:
+                cls._credential = DefaultAzureCredential()
+            cls._clients[key] = CosmosClient(url=url, credential=cls._credential)
+
+        return cls._clients[key]
+
+    @classmethod
+    async def close_all_clients(cls):
+        for _, client in cls._clients.items():
+            await client.close()
+        cls._clients.clear()
+
+        if cls._credential is not None:
+            await cls._credential.close()
+            cls._credential = None
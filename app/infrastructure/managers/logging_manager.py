@@ -0,0 +1,123 @@
+import sys
+import json
+import time
+import queue
+import random
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from app.domain.parsing import parse_key_values
+
+RESERVED_RECORD_ATTRIBUTES = set(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+def _match_logger(logger_name: str, rules: Dict[str, Any]) -> Optional[Any]:
+    name = logger_name
+    while name:
+        if name in rules:
+            return rules[name]
+        name = name.rpartition(".")[0]
+    return rules.get("", None)
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        extra = {
+            key: value for key, value in record.__dict__.items()
+            if key not in RESERVED_RECORD_ATTRIBUTES and not key.startswith("_")
+        }
+        if extra:
+            payload["extra"] = extra
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, sample_rates: Dict[str, float]) -> None:
+        super().__init__()
+        self.sample_rates = sample_rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sample_rate = _match_logger(record.name, self.sample_rates)
+        if sample_rate is None or record.levelno >= logging.WARNING:
+            return True
+        return random.random() < sample_rate
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, rate_limits: Dict[str, int], period: Optional[float] = 1.0) -> None:
+        super().__init__()
+        self.rate_limits = rate_limits
+        self.period = period
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate_limit = _match_logger(record.name, self.rate_limits)
+        if rate_limit is None or record.levelno >= logging.ERROR:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(record.name, [now, 0])
+            if now - window[0] >= self.period:
+                window[0], window[1] = now, 0
+
+            window[1] += 1
+            return window[1] <= rate_limit
+
+class LoggingManager:
+    _listener: Optional[QueueListener] = None
+
+    @classmethod
+    def parse_rules(cls, raw_rules: Optional[str], cast: Any) -> Dict[str, Any]:
+        return parse_key_values(raw_rules, cast)
+
+    @classmethod
+    def configure(
+        cls,
+        level: Optional[str] = "INFO",
+        json_format: Optional[bool] = True,
+        sample_rates: Optional[Dict[str, float]] = None,
+        rate_limits: Optional[Dict[str, int]] = None,
+        logger_levels: Optional[Dict[str, str]] = None
+    ) -> None:
+        if cls._listener is not None:
+            return
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            JsonFormatter() if json_format
+            else logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        if sample_rates:
+            queue_handler.addFilter(SamplingFilter(sample_rates))
+        if rate_limits:
+            queue_handler.addFilter(RateLimitFilter(rate_limits))
+
+        root_logger = logging.getLogger()
+        root_logger.handlers = [queue_handler]
+        root_logger.setLevel(level)
+
+        for logger_name, logger_level in (logger_levels or {}).items():
+            logging.getLogger(logger_name).setLevel(logger_level)
+
+        cls._listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        cls._listener.start()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
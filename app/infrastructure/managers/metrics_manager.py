@@ -0,0 +1,82 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from opentelemetry import metrics
+
+METER_NAME = "knownledge-agent"
+
+class MetricsManager:
+    _meter = metrics.get_meter(METER_NAME)
+    _counters: Dict[str, Any] = {}
+    _histograms: Dict[str, Any] = {}
+    _values: Dict[str, float] = defaultdict(float)
+    _observations: Dict[str, Dict[str, float]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def increment(cls, name: str, value: Optional[float] = 1, attributes: Optional[Dict[str, Any]] = None) -> None:
+        with cls._lock:
+            if name not in cls._counters:
+                cls._counters[name] = cls._meter.create_counter(name)
+            cls._values[name] += value
+
+        cls._counters[name].add(value, attributes=attributes)
+
+    @classmethod
+    def record(cls, name: str, value: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+        with cls._lock:
+            if name not in cls._histograms:
+                cls._histograms[name] = cls._meter.create_histogram(name)
+                cls._observations[name] = {"count": 0, "sum": 0.0, "max": 0.0}
+
+            observation = cls._observations[name]
+            observation["count"] += 1
+            observation["sum"] += value
+            observation["max"] = max(observation["max"], value)
+
+        cls._histograms[name].record(value, attributes=attributes)
+
+    @classmethod
+    def get_value(cls, name: str) -> float:
+        return cls._values.get(name, 0)
+
+    @classmethod
+    def average(cls, name: str) -> float:
+        observation = cls._observations.get(name)
+        if not observation or not observation["count"]:
+            return 0.0
+        return observation["sum"] / observation["count"]
+
+    @classmethod
+    def ratio(cls, hits_name: str, misses_name: str) -> float:
+        hits = cls.get_value(hits_name)
+        total = hits + cls.get_value(misses_name)
+        return hits / total if total else 0.0
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+        with cls._lock:
+            histograms = {
+                name: {
+                    **observation,
+                    "avg": observation["sum"] / observation["count"] if observation["count"] else 0.0
+                }
+                for name, observation in cls._observations.items()
+            }
+            hit_rates = {
+                f"{name[:-len('_hits')]}_hit_rate": cls.ratio(name, f"{name[:-len('_hits')]}_misses")
+                for name in cls._values if name.endswith("_hits")
+            }
+            return {
+                "counters": dict(cls._values),
+                "hit_rates": hit_rates,
+                "histograms": histograms
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._values.clear()
+            for observation in cls._observations.values():
+                observation.update({"count": 0, "sum": 0.0, "max": 0.0})
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from pymongo import ASCENDING as ASC, DESCENDING as DSC
+from app.domain.repository.item_sql_repository import IItemSqlRepository
+from app.infrastructure.contants import MongoIndexMode
+from app.infrastructure.repository.mongo_message_store import MongoChatMessageStore
+
+logger = logging.getLogger(__name__)
+
+JsonType = Dict[str, Any]
+
+class IndexVerificationError(RuntimeError):
+    def __init__(self, query_name: str, plan_stages: List[str]):
+        super().__init__(f"Query '{query_name}' is not index backed, plan stages: {plan_stages}")
+        self.query_name = query_name
+        self.plan_stages = plan_stages
+
+class MongoIndexManager:
+    HISTORY_INDEX_NAME = "thread_id_timestamp_idx"
+    HISTORY_TTL_INDEX_NAME = "created_at_ttl_idx"
+
+    def __init__(
+        self,
+        conversations_repository: IItemSqlRepository,
+        mode: Optional[MongoIndexMode] = MongoIndexMode.CREATE,
+        conversation_ttl_seconds: Optional[int] = None
+    ) -> None:
+        self.conversations_repository = conversations_repository
+        self.mode = mode
+        self.conversation_ttl_seconds = conversation_ttl_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def get_index_specs(self) -> List[Tuple[List[Tuple[str, int]], JsonType]]:
+        index_specs = [
+            ([("thread_id", ASC), ("timestamp", DSC)], {"name": self.HISTORY_INDEX_NAME})
+        ]
+
+        if self.conversation_ttl_seconds is not None:
+            index_specs.append(
+                (
+                    [("created_at", ASC)],
+                    {"name": self.HISTORY_TTL_INDEX_NAME, "expireAfterSeconds": self.conversation_ttl_seconds}
+                )
+            )
+
+        return index_specs
+
+    def get_hot_queries(self) -> Dict[str, List[JsonType]]:
+        return {
+            "list_messages": MongoChatMessageStore.build_history_pipeline("__index_probe__", 10),
+            "count_messages": [{"$match": {"thread_id": "__index_probe__"}}, {"$count": "total"}],
+        }
+
+    @classmethod
+    def _collect_plan_stages(cls, plan: Any) -> List[str]:
+        if isinstance(plan, list):
+            return [stage for item in plan for stage in cls._collect_plan_stages(item)]
+
+        if not isinstance(plan, dict):
+            return []
+
+        stages = [plan["stage"]] if "stage" in plan else []
+        for key in ("inputStage", "inputStages", "queryPlan", "winningPlan"):
+            if key in plan:
+                stages.extend(cls._collect_plan_stages(plan[key]))
+        return stages
+
+    @classmethod
+    def _find_winning_plans(cls, explain_result: Any) -> List[Any]:
+        if isinstance(explain_result, list):
+            return [plan for item in explain_result for plan in cls._find_winning_plans(item)]
+
+        if not isinstance(explain_result, dict):
+            return []
+
+        if "winningPlan" in explain_result:
+            return [explain_result["winningPlan"]]
+
+        return [plan for value in explain_result.values() for plan in cls._find_winning_plans(value)]
+
+    async def create_indexes(self) -> List[str]:
+        created_indexes = []
+        for keys, options in self.get_index_specs():
+            created_indexes.append(await self.conversations_repository.create_index(keys, **options))
+
+        logger.info("Mongo indexes provisioned: %s", created_indexes)
+        return created_indexes
+
+    async def verify_indexes(self) -> None:
+        for query_name, pipeline in self.get_hot_queries().items():
+            explain_result = await self.conversations_repository.explain_aggregate(pipeline)
+            plan_stages = self._collect_plan_stages(self._find_winning_plans(explain_result))
+
+            if "COLLSCAN" in plan_stages or "IXSCAN" not in plan_stages:
+                raise IndexVerificationError(query_name, plan_stages)
+
+            logger.info("Query '%s' is index backed: %s", query_name, plan_stages)
+
+    async def provision(self) -> None:
+        if self.mode == MongoIndexMode.OFF:
+            return
+
+        await self.create_indexes()
+
+        if self.mode == MongoIndexMode.VERIFY:
+            await self.verify_indexes()
+
+    async def provision_in_background(self) -> None:
+        try:
+            await self.provision()
+        except Exception as e:
+            logger.warning("Mongo index provisioning failed, continuing without it: %s", e)
+
+    async def start(self) -> None:
+        if self.mode == MongoIndexMode.OFF:
+            return
+
+        if self.mode == MongoIndexMode.VERIFY:
+            await self.provision()
+        elif self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.provision_in_background())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
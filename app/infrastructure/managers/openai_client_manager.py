@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI
+from azure.ai.projects.aio import AIProjectClient
+
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+logger = logging.getLogger(__name__)
+
+OPENAI_CLIENT_REUSE = "openai_client_reuse"
+OPENAI_CLIENT_CREATED = "openai_client_created"
+OPENAI_POOL_HITS = "openai_connection_pool_hits"
+OPENAI_POOL_MISSES = "openai_connection_pool_misses"
+
+class PoolMetricsTransport(httpx.AsyncHTTPTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        parent_trace = request.extensions.get("trace")
+        new_connection = False
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal new_connection
+            if event_name.startswith("connection.connect_") and event_name.endswith(".complete"):
+                new_connection = True
+            if parent_trace is not None:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        response = await super().handle_async_request(request)
+        MetricsManager.increment(OPENAI_POOL_MISSES if new_connection else OPENAI_POOL_HITS)
+        return response
+
+class OpenAiClientManager:
+    def __init__(
+        self,
+        ai_project_client: AIProjectClient,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+        http2: Optional[bool] = True,
+        timeout: Optional[float] = 60.0
+    ) -> None:
+        self.ai_project_client = ai_project_client
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.timeout = timeout
+
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._openai_client: Optional[AsyncOpenAI] = None
+        self._lock = asyncio.Lock()
+
+        if http2 and not self.http2:
+            logger.warning("HTTP/2 requested for the OpenAI client but 'h2' is not installed, using HTTP/1.1")
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            transport=PoolMetricsTransport(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+        )
+
+    async def get_client(self) -> AsyncOpenAI:
+        if self._openai_client is not None:
+            MetricsManager.increment(OPENAI_CLIENT_REUSE)
+            return self._openai_client
+
+        async with self._lock:
+            if self._openai_client is None:
+                MetricsManager.increment(OPENAI_CLIENT_CREATED)
+                self._http_client = self._create_http_client()
+                self._openai_client = self.ai_project_client.get_openai_client(http_client=self._http_client)
+                logger.info(
+                    "OpenAI client created (max_connections=%s, keepalive=%s, http2=%s)",
+                    self.max_connections, self.max_keepalive_connections, self.http2
+                )
+            else:
+                MetricsManager.increment(OPENAI_CLIENT_REUSE)
+
+        return self._openai_client
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._openai_client is not None:
+                await self._openai_client.close()
+
+            if self._http_client is not None and not self._http_client.is_closed:
+                await self._http_client.aclose()
+
+            self._openai_client = None
+            self._http_client = None
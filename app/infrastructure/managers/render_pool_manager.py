@@ -0,0 +1,59 @@
+import os
+import math
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+def read_cgroup_cpu_quota() -> Optional[int]:
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as cpu_max:
+            quota, period = cpu_max.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as cfs_quota, open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as cfs_period:
+                quota, period = cfs_quota.read().strip(), cfs_period.read().strip()
+        except OSError:
+            return None
+
+    if quota in ("max", "-1") or int(period) <= 0:
+        return None
+    return max(1, math.ceil(int(quota) / int(period)))
+
+def available_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    quota = read_cgroup_cpu_quota()
+    return min(cpus, quota) if quota else cpus
+
+class RenderPoolManager:
+    _executor: Optional[ProcessPoolExecutor] = None
+    _max_workers: Optional[int] = None
+
+    @classmethod
+    def get_max_workers(cls) -> int:
+        if cls._max_workers is None:
+            from app.config import get_settings
+            cls._max_workers = get_settings().pdf_render_workers or available_cpu_count()
+        return cls._max_workers
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(
+                max_workers=cls.get_max_workers(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info("Render pool started with %s workers", cls._max_workers)
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(cancel_futures=True)
+            cls._executor = None
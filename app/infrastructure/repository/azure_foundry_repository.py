@@ -1,23 +1,28 @@
 from app.domain.repository.ai_project_repository import IAiProjectRepository
-from typing import List, Any, Dict, Tuple, Optional
+from typing import AsyncIterator, List, Any, Dict, Tuple, Optional
 from azure.ai.projects.aio import AIProjectClient
 
 from azure.identity.aio import DefaultAzureCredential
 from azure.ai.projects.models import PromptAgentDefinition, FileSearchTool
+from app.infrastructure.managers.openai_client_manager import OpenAiClientManager
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 JsonType = Dict[str, Any]
 JsonArrayType = List[JsonType]
 
 class AzureFoundryRepository(IAiProjectRepository):
-    def __init__(self, ai_project_client: AIProjectClient):
+    def __init__(self, ai_project_client: AIProjectClient, openai_client_manager: Optional[OpenAiClientManager] = None):
         self.ai_project_client = ai_project_client
+        self.openai_client_manager = openai_client_manager or OpenAiClientManager(ai_project_client)
         pass
 
     async def create_thread(self):
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            created_conversation = await open_ai_client.conversations.create()
-            return created_conversation
+        open_ai_client = await self.openai_client_manager.get_client()
+        created_conversation = await open_ai_client.conversations.create()
+        return created_conversation
     
     @classmethod
     def format_user_input(cls, message: str, image_input_list: Optional[List[str]] = []) -> JsonArrayType:
@@ -44,32 +49,78 @@ class AzureFoundryRepository(IAiProjectRepository):
         ]
 
     async def upload_to_vector_store(self, vector_store_id: str, file_full_path: str) -> str:
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
+        open_ai_client = await self.openai_client_manager.get_client()
 
-            additional_attributes = {
-                "file_name": file_full_path.split("/")[-1]
-            }
+        additional_attributes = {
+            "file_name": file_full_path.split("/")[-1]
+        }
 
+        with open(file_full_path, "rb") as file_content:
             file = await open_ai_client.vector_stores.files.upload_and_poll(
-                vector_store_id=vector_store_id, file=open(file_full_path, "rb"),
+                vector_store_id=vector_store_id, file=file_content,
                 attributes=additional_attributes
             )
 
-            return file.id
-        
-    async def get_files_from_vector_store(self, vector_store_id: str) -> List[Any]:
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            files = open_ai_client.vector_stores.files.list(vector_store_id)
-            original_files = []
+        return file.id
+
+    async def upload_file(self, file_full_path: str) -> str:
+        open_ai_client = await self.openai_client_manager.get_client()
+        with open(file_full_path, "rb") as file_content:
+            file = await open_ai_client.files.create(file=file_content, purpose="assistants")
+        return file.id
+
+    async def add_file_to_vector_store(self, vector_store_id: str, file_id: str, attributes: Optional[JsonType] = None) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.files.create(
+            vector_store_id=vector_store_id, file_id=file_id, attributes=attributes
+        )
+
+    async def get_vector_store_file(self, vector_store_id: str, file_id: str) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.files.retrieve(file_id, vector_store_id=vector_store_id)
+
+    async def create_vector_store_file_batch(self, vector_store_id: str, files: JsonArrayType) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.file_batches.create(vector_store_id=vector_store_id, files=files)
 
-            async for file in files:
-                original_files.append(file)
+    async def get_vector_store_file_batch(self, vector_store_id: str, batch_id: str) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.file_batches.retrieve(batch_id, vector_store_id=vector_store_id)
 
-            return original_files
+    async def get_vector_store_file_batch_files(self, vector_store_id: str, batch_id: str) -> List[Any]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        batch_files = open_ai_client.vector_stores.file_batches.list_files(batch_id, vector_store_id=vector_store_id)
+        return [batch_file async for batch_file in batch_files]
+        
+    async def get_files_from_vector_store(self, vector_store_id: str) -> List[Any]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        files = open_ai_client.vector_stores.files.list(vector_store_id)
+        original_files = []
+
+        async for file in files:
+            original_files.append(file)
+
+        return original_files
+
+    async def list_vector_store_files(self, vector_store_id: str, after: Optional[str] = None,
+                                      limit: Optional[int] = 20) -> Tuple[List[Any], bool]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        cursor = {"after": after} if after else {}
+        page = await open_ai_client.vector_stores.files.list(vector_store_id, limit=limit, order="desc", **cursor)
+        return page.data, page.has_more
+
+    async def iter_vector_store_files(self, vector_store_id: str, page_size: Optional[int] = 100) -> AsyncIterator[Any]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        async for file in open_ai_client.vector_stores.files.list(vector_store_id, limit=page_size, order="desc"):
+            yield file
     
     async def delete_file_from_vector_store(self, vector_store_id: str, file_id: str) -> Any:
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            return await open_ai_client.vector_stores.files.delete(file_id, vector_store_id=vector_store_id)
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.files.delete(file_id, vector_store_id=vector_store_id)
+
+    async def delete_file(self, file_id: str) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.files.delete(file_id)
 
     async def chat(
                 self, conversation_id: str, 
@@ -77,56 +128,77 @@ class AzureFoundryRepository(IAiProjectRepository):
         
         agent_name, agent_version = agent_information
 
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            response = await open_ai_client.responses.create(
-                conversation=conversation_id,
-                input=formated_input,
-                extra_body={
-                    "agent": {
-                        "name": agent_name, 
-                        #"version": agent_version,
-                        "type": "agent_reference"
-                    }
+        open_ai_client = await self.openai_client_manager.get_client()
+        response = await open_ai_client.responses.create(
+            conversation=conversation_id,
+            input=formated_input,
+            extra_body={
+                "agent": {
+                    "name": agent_name, 
+                    #"version": agent_version,
+                    "type": "agent_reference"
                 }
-            )
-            return response
+            }
+        )
+        return response
 
     async def create_vector_store(self, name: str):
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            vector_store = await open_ai_client.vector_stores.create(name="ProductInfoStore")
-            print(f"Vector store created (id: {vector_store.id})")
-            return vector_store
+        open_ai_client = await self.openai_client_manager.get_client()
+        vector_store = await open_ai_client.vector_stores.create(name="ProductInfoStore")
+        logger.info("Vector store created (id: %s)", vector_store.id)
+        return vector_store
+
+    async def get_vector_store(self, vector_store_id: str) -> Any:
+        open_ai_client = await self.openai_client_manager.get_client()
+        return await open_ai_client.vector_stores.retrieve(vector_store_id)
+
+    async def has_conversation_items(self, conversation_id: str) -> bool:
+        open_ai_client = await self.openai_client_manager.get_client()
+        page = await open_ai_client.conversations.items.list(conversation_id, limit=1)
+        return bool(page.data)
+
+    async def append_conversation_turn(self, conversation_id: str, formated_input: JsonArrayType, answer: str) -> List[Any]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        created_items = await open_ai_client.conversations.items.create(
+            conversation_id,
+            items=[
+                *formated_input,
+                {"type": "message", "role": "assistant", "content": [{"type": "output_text", "text": answer}]}
+            ]
+        )
+        return created_items.data
     
     async def stream_chat(
                 self, conversation_id: str, 
                 formated_input: JsonArrayType, agent_information: Tuple[str, str]):
         agent_name, agent_version = agent_information
 
-        async with self.ai_project_client.get_openai_client() as open_ai_client:
-            stream_response = await open_ai_client.responses.create(
-                conversation=conversation_id,
-                input=formated_input,
-                extra_body={
-                    "agent": {
-                        "name": agent_name, 
-                        #"version": agent_version,
-                        "type": "agent_reference"
-                    }
-                },
-                stream=True
-            )
+        open_ai_client = await self.openai_client_manager.get_client()
+        stream_response = await open_ai_client.responses.create(
+            conversation=conversation_id,
+            input=formated_input,
+            extra_body={
+                "agent": {
+                    "name": agent_name, 
+                    #"version": agent_version,
+                    "type": "agent_reference"
+                }
+            },
+            stream=True
+        )
 
+        try:
             async for event in stream_response:
-                if event.type == "response.created":
-                    print(f"Stream response created with ID: {event.response.id}\n")
-                elif event.type == "response.output_text.delta":
-                    #yield(event.delta)
-                    print("Delta Item", event.delta)
+                if event.type == "response.output_text.delta":
                     yield event.delta
+                elif event.type == "response.created":
+                    logger.debug("Stream response created with ID: %s", event.response.id)
                 elif event.type == "response.text.done":
-                    print(f"\n\nResponse text done. Access final text in 'event.text'")
+                    logger.debug("Response text done for conversation %s", conversation_id)
                 elif event.type == "response.completed":
-                    print(f"\n\nResponse completed. Access final text in 'event.response.output_text'")
+                    logger.debug("Response completed for conversation %s", conversation_id)
+        finally:
+            await stream_response.close()
 
 
 async def main():
@@ -152,6 +224,7 @@ async def main():
     await foundry_repository.stream_chat(conversation.id, formatted_data, agent_information)
     print("Response Agent", response)"""
 
+    await foundry_repository.openai_client_manager.close()
     await ai_projet_client.close()
 
 if __name__ == "__main__":
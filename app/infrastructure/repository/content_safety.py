@@ -1,19 +1,94 @@
 
+import re
+import asyncio
 from typing import Optional, List, Dict, Any, Tuple
 from azure.ai.contentsafety.aio import ContentSafetyClient
 from azure.core.credentials import AzureKeyCredential
-from azure.ai.contentsafety.models import AnalyzeTextOptions, TextCategory, AnalyzeTextResult
+from azure.ai.contentsafety.models import (
+    AnalyzeTextOptions, TextCategory, AnalyzeTextResult, TextCategoriesAnalysis
+)
 from app.domain.repository.content_safety_repository import IContentSafetyRepository
 from app.domain.contants import DecisionAction
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+MAX_TEXT_LENGTH = 10000
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?\u3002\n])\s+")
 
 class ContentSafetyGuardilRepository(IContentSafetyRepository):
-    def __init__(self, content_safety_client: ContentSafetyClient):
+    def __init__(self, content_safety_client: ContentSafetyClient, max_chunk_length: Optional[int] = MAX_TEXT_LENGTH,
+                 max_concurrency: Optional[int] = 4):
         self.content_safety_client = content_safety_client
-    
-    async def analyze_text(self, text: str, blocklist_names: Optional[List[str]] = [] ) -> Any:
-        request = AnalyzeTextOptions(text=text, blocklist_names=blocklist_names)
-        response = await self.content_safety_client.analyze_text(request)
-        return response
+        self.max_chunk_length = min(max_chunk_length, MAX_TEXT_LENGTH)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    def split_text(self, text: str) -> List[str]:
+        chunks = []
+        current_chunk = ""
+
+        for sentence in SENTENCE_BOUNDARY.split(text):
+            while len(sentence) > self.max_chunk_length:
+                cut = sentence.rfind(" ", 0, self.max_chunk_length)
+                cut = cut if cut > 0 else self.max_chunk_length
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+
+            if current_chunk and len(current_chunk) + len(sentence) + 1 > self.max_chunk_length:
+                chunks.append(current_chunk)
+                current_chunk = sentence
+            else:
+                current_chunk = f"{current_chunk} {sentence}" if current_chunk else sentence
+
+        if current_chunk:
+            chunks.append(current_chunk)
+        return chunks
+
+    async def _analyze_chunk(self, text: str, blocklist_names: Optional[List[str]] = []) -> AnalyzeTextResult:
+        async with self.semaphore:
+            request = AnalyzeTextOptions(text=text, blocklist_names=blocklist_names)
+            return await self.content_safety_client.analyze_text(request)
+
+    def merge_results(self, results: List[AnalyzeTextResult]) -> AnalyzeTextResult:
+        severities: Dict[Any, int] = {}
+        blocklists_match = []
+
+        for result in results:
+            for category_analysis in result.categories_analysis or []:
+                severities[category_analysis.category] = max(
+                    severities.get(category_analysis.category, 0), category_analysis.severity or 0
+                )
+            blocklists_match.extend(getattr(result, "blocklists_match", None) or [])
+
+        return AnalyzeTextResult(
+            categories_analysis=[
+                TextCategoriesAnalysis(category=category, severity=severity) for category, severity in severities.items()
+            ],
+            blocklists_match=blocklists_match
+        )
+
+    async def analyze_text(self, text: str, blocklist_names: Optional[List[str]] = [],
+                           reject_thresholds: Optional[Dict[Any, int]] = None) -> Any:
+        if len(text) <= self.max_chunk_length:
+            return await self._analyze_chunk(text, blocklist_names)
+
+        chunks = self.split_text(text)
+        MetricsManager.increment("content_safety_chunks", len(chunks))
+        tasks = [asyncio.create_task(self._analyze_chunk(chunk, blocklist_names)) for chunk in chunks]
+        results = []
+
+        try:
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                results.append(result)
+
+                if reject_thresholds is not None and self.make_decision(result, reject_thresholds)[0] == DecisionAction.REJECT:
+                    MetricsManager.increment("content_safety_early_stops")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self.merge_results(results)
 
     def valide_categories(self, response: AnalyzeTextResult, reject_thresholds: Dict[Any, int]) -> Tuple[bool, List[TextCategory]]:
         action_by_category = {}
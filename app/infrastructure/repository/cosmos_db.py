@@ -1,6 +1,4 @@
-from azure.identity import DefaultAzureCredential
-from app.infrastructure.repository.azure_credential_repository import AzureCredentialRepository, CredentialType   
-from azure.cosmos import CosmosClient
+from app.infrastructure.managers.cosmos_client_manager import CosmosClientManager
 from typing import Optional
 from typing import Any, Dict, List
 from app.domain.repository.not_sql_repository import INotSqlRepository
@@ -8,10 +6,11 @@ from app.domain.repository.not_sql_repository import INotSqlRepository
 JsonType = Dict[str, Any]
 JsonArrayType = List[JsonType]
 
+MAX_BATCH_OPERATIONS = 100
+
 class CosmosDbRepository(INotSqlRepository):
     def __init__(self, url: str, database: str, container: Optional[str] = None) -> None:
-        credential = DefaultAzureCredential()
-        self.client = CosmosClient(url=url, credential=credential)
+        self.client = CosmosClientManager.get_client_for_url(url)
         self.database = self.client.get_database_client(f"{database}")
         self.container = self._get_container(container) if container else None
 
@@ -21,46 +20,66 @@ class CosmosDbRepository(INotSqlRepository):
     def _create_container_reference(self, container_name: str):
         return self._get_container(container_name) if self.container is None else self.container
 
-    def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
+    async def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
         container = self._create_container_reference(container)
-        return container.read_item(
+        return await container.read_item(
             item=item_id,
             partition_key=partition_key,
         )
 
-    def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
+    async def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
         container = self._create_container_reference(container)
-        return container.upsert_item(
+        return await container.upsert_item(
             raw_data
         )
 
-    def batch_insert(self, items: List[JsonType], partition_key: str, container: Optional[str] = None):
-        batch_operations = []
+    async def batch_insert(self, items: List[JsonType], partition_key: str, container: Optional[str] = None):
         container = self._create_container_reference(container)
 
-        for item in items:
-            batch_operations.append(
+        for start in range(0, len(items), MAX_BATCH_OPERATIONS):
+            batch_operations = [
                 ("upsert", (item,), {})
+                for item in items[start:start + MAX_BATCH_OPERATIONS]
+            ]
+            await container.execute_item_batch(
+                batch_operations=batch_operations,
+                partition_key=partition_key
             )
 
-        container.execute_item_batch(
-            batch_operations=batch_operations,
-            partition_key=partition_key
-        )
-
-    def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
-                    enable_cross_partition_query: Optional[bool] = None,
-                    container: Optional[str] = None):
+    async def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
+                          partition_key: Optional[str] = None,
+                          container: Optional[str] = None) -> JsonArrayType:
         container = self._create_container_reference(container)
-        return container.query_items(
+        query_kwargs = {"partition_key": partition_key} if partition_key is not None else {}
+        items = container.query_items(
             query=query,
             parameters=parameters,
-            enable_cross_partition_query=enable_cross_partition_query,
+            **query_kwargs
         )
+        return [item async for item in items]
+
+    async def count_items(self, query: str, parameters: Optional[JsonArrayType] = None,
+                          partition_key: Optional[str] = None, container: Optional[str] = None) -> int:
+        result = await self.query_items(query, parameters, partition_key, container)
+        return result[0] if result else 0
+
+    async def upsert_item(self, body: Dict[str, Any], container: Optional[str] = None) -> None:
+        container = self._create_container_reference(container)
+        await container.upsert_item(body)
+
+    async def delete_item(self, item_id: str, partition_key: str, container: Optional[str] = None) -> None:
+        container = self._create_container_reference(container)
+        await container.delete_item(item=item_id, partition_key=partition_key)
 
-    def upsert_item(self, body: Dict[str, Any], container: Optional[str] = None) -> None:
+    async def batch_delete(self, item_ids: List[str], partition_key: str, container: Optional[str] = None) -> None:
         container = self._create_container_reference(container)
-        container.upsert_item(body)
 
-    def delete_item(self):
-        pass
\ No newline at end of file
+        for start in range(0, len(item_ids), MAX_BATCH_OPERATIONS):
+            batch_operations = [
+                ("delete", (item_id,), {})
+                for item_id in item_ids[start:start + MAX_BATCH_OPERATIONS]
+            ]
+            await container.execute_item_batch(
+                batch_operations=batch_operations,
+                partition_key=partition_key
+            )
\ No newline at end of file
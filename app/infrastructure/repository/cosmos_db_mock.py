@@ -15,17 +15,21 @@ class CosmosDbRepositoryMock(INotSqlRepository):
     def _create_container(self, container_name: str):
         return None
 
-    def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
+    async def get_item(self, item_id: str, partition_key: str, container: Optional[str] = None):
         return DISPATCHER_MOCK_SETTINGS
 
-    def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
+    async def insert_item(self, raw_data: JsonType, container: Optional[str] = None) -> None:
         return None
 
-    def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
-                    enable_cross_partition_query: Optional[bool] = None,
-                    container: Optional[str] = None):
+    async def query_items(self, query: str, parameters: Optional[JsonArrayType] = None, 
+                          partition_key: Optional[str] = None,
+                          container: Optional[str] = None):
 
         return []
 
-    def delete_item(self):
+    async def count_items(self, query: str, parameters: Optional[JsonArrayType] = None,
+                          partition_key: Optional[str] = None, container: Optional[str] = None) -> int:
+        return 0
+
+    async def delete_item(self, item_id: str, partition_key: str, container: Optional[str] = None) -> None:
         pass
\ No newline at end of file
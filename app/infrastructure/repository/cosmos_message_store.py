@@ -1,13 +1,17 @@
+import logging
 from collections.abc import Sequence
 from typing import Any, Optional
 from uuid import uuid4
+from datetime import datetime
 import redis.asyncio as redis
 from agent_framework import ChatMessage
 from app.infrastructure.repository.cosmos_db import CosmosDbRepository
-from app.domain.repository.chat_message_store import ChatMessageStore 
+from app.domain.repository.chat_message_store import IChatMessageStore 
 from app.domain.message_store.cosmos_message_store import CosmosMessageStore
 
-class CosmosChatMessageStore(ChatMessageStore):
+logger = logging.getLogger(__name__)
+
+class CosmosChatMessageStore(IChatMessageStore):
 
     def __init__(
         self,
@@ -16,7 +20,8 @@ class CosmosChatMessageStore(ChatMessageStore):
         container_name: str,
         thread_id: str, 
         max_messages: Optional[int] | None = None,
-        key_prefix: Optional[str] = "thread" 
+        key_prefix: Optional[str] = "thread",
+        history_limit: Optional[int] = 10
     ) -> None:
 
         self.url = url
@@ -28,6 +33,7 @@ class CosmosChatMessageStore(ChatMessageStore):
         self.thread_id = thread_id or f"{uuid4()}"
         self.max_messages = max_messages
         self.key_prefix = key_prefix
+        self.history_limit = history_limit
 
     @property
     def cosmos_partition_key(self) -> str:
@@ -42,58 +48,87 @@ class CosmosChatMessageStore(ChatMessageStore):
             {
                 "id": f"{uuid4()}",
                 "thread_id": self.thread_id, 
+                "timestamp": datetime.now().timestamp(),
                 **self._serialize_json_message(msg)
             } 
             for msg in messages]
-        print(f"Serielized messages {serialized_messages}")
-        self.cosmos_db_client.batch_insert(serialized_messages, self.thread_id)
-        print("Messages saved")
+        logger.debug("Serialized messages %s", serialized_messages)
+        await self.cosmos_db_client.batch_insert(serialized_messages, self.thread_id)
+        logger.debug("Saved %s messages for thread %s", len(serialized_messages), self.thread_id)
 
         if self.max_messages is not None:
-            
-            sql_query = """
-                COUNT(*) 
-                FROM historical 
-                WHERE historical.thread_id = @tid
-            """
+            await self._trim_messages()
+
+    async def _count_messages(self) -> int:
+        sql_query = """
+            SELECT VALUE COUNT(1) 
+            FROM historical 
+            WHERE historical.thread_id = @tid
+        """
+
+        parameters = [
+            {"name": "@tid", "value": self.thread_id}
+        ]
+
+        return await self.cosmos_db_client.count_items(
+            query=sql_query,
+            parameters=parameters,
+            partition_key=self.thread_id
+        )
+
+    async def _trim_messages(self) -> None:
+        current_count = await self._count_messages()
+        exceeded_messages = current_count - self.max_messages
+
+        if exceeded_messages <= 0:
+            return
+
+        sql_query = """
+            SELECT VALUE hist.id 
+            FROM historical hist 
+            WHERE hist.thread_id = @tid 
+            ORDER BY hist.timestamp ASC 
+            OFFSET 0 LIMIT @limit
+        """
 
-            parameters = [
-                {"name": "@tid", "value": self.thread_id}
-            ]
+        parameters = [
+            {"name": "@tid", "value": self.thread_id},
+            {"name": "@limit", "value": exceeded_messages}
+        ]
 
-            current_count = len(self.cosmos_db_client.query_items(
-                query=sql_query,
-                parameters=parameters
-            ))
+        oldest_ids = await self.cosmos_db_client.query_items(
+            query=sql_query,
+            parameters=parameters,
+            partition_key=self.thread_id
+        )
 
-            if current_count > self.max_messages:
-                await self.cosmos_db_client.delete_item()
+        await self.cosmos_db_client.batch_delete(oldest_ids, self.thread_id)
 
     async def list_messages(self) -> list[ChatMessage]:
 
         sql_query = """
-            SELECT TOP 10 * 
+            SELECT TOP @limit * 
             FROM historical hist 
             WHERE hist.thread_id = @tid 
             ORDER BY hist.timestamp DESC
         """
 
         parameters = [
-            {"name": "@tid", "value": self.thread_id}
+            {"name": "@tid", "value": self.thread_id},
+            {"name": "@limit", "value": self.history_limit}
         ]
 
-        print("Getting Messages")
-        items_iterator = self.cosmos_db_client.query_items(
+        last_messages = await self.cosmos_db_client.query_items(
             query=sql_query,
-            parameters=parameters 
+            parameters=parameters,
+            partition_key=self.thread_id
         )
 
-        last_messages = list(items_iterator)
         last_messages.reverse() 
 
         messages = []
         for serialized_message in last_messages:
-            print("Seriataled Message", serialized_message, type(serialized_message))
+            logger.debug("Serialized message %s", serialized_message)
             message = self._deserialize_json_message(serialized_message)
             messages.append(message)
 
@@ -125,7 +160,17 @@ class CosmosChatMessageStore(ChatMessageStore):
                 self.cosmos_db_client = CosmosDbRepository(self.url, self.database_name, self.container_name)
 
     async def clear(self) -> None:
-        await self.cosmos_db_client.delete_item()
+        sql_query = "SELECT VALUE hist.id FROM historical hist WHERE hist.thread_id = @tid"
+        parameters = [
+            {"name": "@tid", "value": self.thread_id}
+        ]
+
+        item_ids = await self.cosmos_db_client.query_items(
+            query=sql_query,
+            parameters=parameters,
+            partition_key=self.thread_id
+        )
+        await self.cosmos_db_client.batch_delete(item_ids, self.thread_id)
 
     async def aclose(self) -> None:
         pass
\ No newline at end of file
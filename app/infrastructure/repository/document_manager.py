@@ -1,26 +1,142 @@
 import os
-import shutil
-from typing import Any, List, Optional
+import asyncio
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import Future
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from app.domain.document import RenderedPage, StoredDocument
+from app.domain.exceptions import DocumentTooLarge
 from app.domain.repository.document_repository import IDocumentRepository
-from app.domain.utils import parrallel_pdf_to_img
+from app.domain.utils import (
+    parrallel_pdf_to_img, page_range_pdf_to_pages, prepare_pdf_output, split_page_ranges, copy_hashed_chunk,
+    release_rendered_page, remove_pdf_output, generate_uuid
+)
+from app.infrastructure.managers.render_pool_manager import RenderPoolManager
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
 
 class DocumentManagerRepository(IDocumentRepository):
     def __init__(self):
         pass
 
-    async def save_document_locally(self, file: Any, upload_folder: Optional[str] = 'uploads') -> str:
-        os.makedirs(upload_folder, exist_ok=True)
-        local_file_path = f"{upload_folder}/{file.filename}"
+    async def save_document_locally(self, file: Any, upload_folder: Optional[str] = 'uploads') -> StoredDocument:
+        settings = get_settings()
+        file_name = os.path.basename(file.filename or "") or "document"
+        partial_file_path = None
         try:
-            with open(local_file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            return local_file_path
+            if settings.upload_max_bytes and (getattr(file, "size", None) or 0) > settings.upload_max_bytes:
+                raise DocumentTooLarge(file_name, settings.upload_max_bytes)
+
+            os.makedirs(upload_folder, exist_ok=True)
+            file_descriptor, partial_file_path = tempfile.mkstemp(suffix=".part", dir=upload_folder)
+            digest = hashlib.sha256()
+            size = 0
+
+            with os.fdopen(file_descriptor, "wb") as buffer:
+                while chunk_size := await asyncio.to_thread(
+                    copy_hashed_chunk, file.file, buffer, digest, settings.upload_chunk_bytes
+                ):
+                    size += chunk_size
+                    if settings.upload_max_bytes and size > settings.upload_max_bytes:
+                        raise DocumentTooLarge(file_name, settings.upload_max_bytes)
+
+            content_hash = digest.hexdigest()
+            document_folder = f"{upload_folder}/{content_hash}/{generate_uuid()}"
+            os.makedirs(document_folder, exist_ok=True)
+            local_file_path = f"{document_folder}/{file_name}"
+            os.replace(partial_file_path, local_file_path)
+            partial_file_path = None
+
+            return StoredDocument(file_path=local_file_path, content_hash=content_hash, size=size)
         except Exception as e:
-            print({"message": f"There was an error uploading the file: {e}"})
+            logger.warning("There was an error uploading the file %s: %s", file_name, e)
             raise
         finally:
+            if partial_file_path is not None:
+                try:
+                    os.remove(partial_file_path)
+                except FileNotFoundError:
+                    pass
             await file.close()
 
+    @staticmethod
+    def _remove_local_file(local_file_path: str) -> None:
+        try:
+            os.remove(local_file_path)
+        except FileNotFoundError:
+            pass
+        remove_pdf_output(os.path.dirname(local_file_path))
+
+    async def remove_document_locally(self, local_file_path: str) -> None:
+        await asyncio.to_thread(self._remove_local_file, local_file_path)
+
     def process_document(self, local_file_path: str) -> List[str]:
-        return parrallel_pdf_to_img(local_file_path)
+        settings = get_settings()
+        return parrallel_pdf_to_img(
+            local_file_path,
+            dpi=settings.pdf_render_dpi,
+            image_format=settings.pdf_render_format,
+            max_workers=RenderPoolManager.get_max_workers(),
+            executor=RenderPoolManager.get_executor(),
+            quality=settings.pdf_render_quality,
+            colorspace=settings.pdf_render_colorspace
+        )
 
+    async def stream_document(self, local_file_path: str, blob_prefix: Optional[str] = None) -> AsyncGenerator[RenderedPage, None]:
+        settings = get_settings()
+        loop = asyncio.get_running_loop()
+        executor = RenderPoolManager.get_executor()
+
+        total_pages, output_directory_name = await loop.run_in_executor(None, prepare_pdf_output, local_file_path)
+        page_ranges = split_page_ranges(
+            total_pages, RenderPoolManager.get_max_workers(),
+            first_range_pages=1, max_range_pages=settings.pdf_stream_range_pages
+        )
+
+        in_memory = settings.pdf_upload_mode == "memory"
+        if not in_memory:
+            os.makedirs(output_directory_name, exist_ok=True)
+
+        render_futures = [
+            executor.submit(
+                page_range_pdf_to_pages, local_file_path, start_page, end_page,
+                settings.pdf_render_format, settings.pdf_render_dpi,
+                settings.pdf_render_quality, settings.pdf_render_colorspace,
+                output_directory=None if in_memory else output_directory_name,
+                max_memory_bytes=settings.pdf_memory_max_page_bytes,
+                spill_directory=settings.pdf_spill_directory,
+                blob_prefix=blob_prefix
+            )
+            for start_page, end_page in page_ranges
+        ]
+        futures = [asyncio.wrap_future(render_future) for render_future in render_futures]
+        yielded_pages: Dict[int, RenderedPage] = {}
+
+        def remove_render_output() -> None:
+            if in_memory or not all(render_future.done() for render_future in render_futures):
+                return
+            for rendered_page in list(yielded_pages.values()):
+                rendered_page.output_directory = output_directory_name
+            remove_pdf_output(output_directory_name)
+
+        def release_unconsumed_pages(render_future: Future) -> None:
+            if not render_future.cancelled() and render_future.exception() is None:
+                for rendered_page in render_future.result():
+                    if rendered_page.page_number not in yielded_pages:
+                        release_rendered_page(rendered_page)
+            remove_render_output()
+
+        try:
+            for future in asyncio.as_completed(futures):
+                for rendered_page in await future:
+                    yielded_pages[rendered_page.page_number] = rendered_page
+                    yield rendered_page
+        finally:
+            for future in futures:
+                future.add_done_callback(lambda done_future: done_future.cancelled() or done_future.exception())
+            for render_future in render_futures:
+                if not render_future.cancel():
+                    render_future.add_done_callback(release_unconsumed_pages)
+            remove_render_output()
@@ -0,0 +1,46 @@
+from typing import List, Optional
+from app.domain.document import DocumentManifest
+from app.domain.repository.document_manifest_repository import IDocumentManifestRepository
+from app.domain.repository.item_sql_repository import IItemSqlRepository
+from app.domain.utils import get_current_datetime
+
+class DocumentManifestRepository(IDocumentManifestRepository):
+    def __init__(self, db_repository: IItemSqlRepository) -> None:
+        self.db_repository = db_repository
+
+    async def get_manifest(self, content_hash: str) -> Optional[DocumentManifest]:
+        documents = await self.db_repository.get_items_by_filter({"_id": content_hash}, length=1)
+        if not documents:
+            return None
+
+        document = documents[0]
+        return DocumentManifest(
+            content_hash=document["_id"],
+            file_name=document.get("file_name"),
+            pages=document.get("pages") or {},
+            vector_store_file_ids={
+                vector_store_id: file_id
+                for vector_store_id, file_id in (document.get("vector_store_file_ids") or {}).items()
+                if file_id is not None
+            }
+        )
+
+    async def save_pages(self, content_hash: str, file_name: str, render_profile: str, blob_names: List[str]) -> None:
+        await self.db_repository.update_by_filter(
+            {"_id": content_hash},
+            {"file_name": file_name, f"pages.{render_profile}": blob_names, "updated_at": get_current_datetime()},
+            upsert=True
+        )
+
+    async def save_vector_store_file(self, content_hash: str, file_name: str, vector_store_id: str, file_id: str) -> None:
+        await self.db_repository.update_by_filter(
+            {"_id": content_hash},
+            {"file_name": file_name, f"vector_store_file_ids.{vector_store_id}": file_id, "updated_at": get_current_datetime()},
+            upsert=True
+        )
+
+    async def remove_vector_store_file(self, vector_store_id: str, file_id: str) -> None:
+        await self.db_repository.update_by_filter(
+            {f"vector_store_file_ids.{vector_store_id}": file_id},
+            {f"vector_store_file_ids.{vector_store_id}": None, "updated_at": get_current_datetime()}
+        )
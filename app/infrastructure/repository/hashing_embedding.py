@@ -0,0 +1,27 @@
+import re
+import math
+import hashlib
+from typing import List, Optional
+from app.domain.repository.embedding_repository import IEmbeddingRepository
+from app.domain.utils import normalize_text
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+class HashingEmbeddingRepository(IEmbeddingRepository):
+    def __init__(self, dimensions: Optional[int] = 256) -> None:
+        self.dimensions = dimensions
+
+    def embed_text(self, text: str) -> List[float]:
+        tokens = TOKEN_PATTERN.findall(normalize_text(text))
+        features = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+        vector = [0.0] * self.dimensions
+        for feature in features:
+            value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[value % self.dimensions] += -1.0 if value >> 63 else 1.0
+
+        norm = math.sqrt(sum(component * component for component in vector))
+        return [component / norm for component in vector] if norm else vector
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_text(text) for text in texts]
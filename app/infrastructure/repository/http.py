@@ -13,7 +13,7 @@ class HttpRepository:
 
     async def post(self, endpoint: str, data: dict) -> Coroutine[Any]:
         try:
-            print("Ajaa",f"{self.base_url}{endpoint}")
+            self.logger.debug("POST %s%s", self.base_url, endpoint)
             async with self.session.post(
                 f"{self.base_url}{endpoint}",
                 json=data
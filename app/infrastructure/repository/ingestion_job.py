@@ -0,0 +1,28 @@
+from typing import List, Optional
+from app.domain.contants import IngestionJobStatus
+from app.domain.document import IngestionJob
+from app.domain.repository.ingestion_job_repository import IIngestionJobRepository
+from app.domain.repository.item_sql_repository import IItemSqlRepository
+
+class IngestionJobRepository(IIngestionJobRepository):
+    def __init__(self, db_repository: IItemSqlRepository) -> None:
+        self.db_repository = db_repository
+
+    async def save_job(self, job: IngestionJob) -> None:
+        await self.db_repository.update_by_filter(
+            {"_id": job.job_id}, job.model_dump(mode="json", exclude={"job_id"}), upsert=True
+        )
+
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        documents = await self.db_repository.get_items_by_filter({"_id": job_id}, length=1)
+        if not documents:
+            return None
+
+        document = documents[0]
+        return IngestionJob(job_id=document.pop("_id"), **document)
+
+    async def get_stale_jobs(self, statuses: List[IngestionJobStatus], updated_before: str) -> List[IngestionJob]:
+        documents = await self.db_repository.get_items_by_filter(
+            {"status": {"$in": [status.value for status in statuses]}, "updated_at": {"$lt": updated_before}}
+        )
+        return [IngestionJob(job_id=document.pop("_id"), **document) for document in documents]
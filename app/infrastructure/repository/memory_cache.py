@@ -0,0 +1,56 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from app.domain.repository.cache_repository import ICacheRepository
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+class MemoryCacheRepository(ICacheRepository):
+    def __init__(self, max_size: Optional[int] = 1024, ttl_seconds: Optional[float] = 300.0,
+                 metrics_prefix: Optional[str] = None) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.metrics_prefix = metrics_prefix
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _track(self, event: str) -> None:
+        if self.metrics_prefix:
+            MetricsManager.increment(f"{self.metrics_prefix}_{event}")
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def get(self, key: str, track: Optional[bool] = True) -> Optional[Any]:
+        item = self._items.get(key)
+
+        if item is None:
+            if track:
+                self._track("misses")
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self._track("expirations")
+            if track:
+                self._track("misses")
+            return None
+
+        self._items.move_to_end(key)
+        if track:
+            self._track("hits")
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._items[key] = (time.monotonic() + ttl_seconds, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self._track("evictions")
+
+    async def delete(self, key: str) -> None:
+        self._items.pop(key, None)
+
+    async def clear(self) -> None:
+        self._items.clear()
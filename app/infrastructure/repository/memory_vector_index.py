@@ -0,0 +1,97 @@
+import math
+import heapq
+from operator import itemgetter, mul
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+from app.domain.repository.vector_index_repository import IVectorIndexRepository
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class MemoryVectorIndexRepository(IVectorIndexRepository):
+    def __init__(self, max_size: Optional[int] = 4096, metrics_prefix: Optional[str] = None) -> None:
+        self.max_size = max_size
+        self.metrics_prefix = metrics_prefix
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self._free_slots: List[int] = []
+        self._item_ids: List[Optional[str]] = []
+        self._payloads: List[Any] = []
+        self._vectors: Any = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def normalize(vector: List[float]) -> List[float]:
+        norm = math.sqrt(sum(component * component for component in vector))
+        return [component / norm for component in vector] if norm else list(vector)
+
+    def _allocate(self, dimensions: int) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_size, dimensions), dtype=np.float32) if np is not None else []
+        if np is None:
+            self._vectors.append(None)
+
+        self._item_ids.append(None)
+        self._payloads.append(None)
+        return len(self._item_ids) - 1
+
+    def _release(self, item_id: str) -> None:
+        slot = self._slots.pop(item_id)
+        self._item_ids[slot] = None
+        self._payloads[slot] = None
+        self._vectors[slot] = 0.0 if np is not None else None
+        self._free_slots.append(slot)
+
+    async def add(self, item_id: str, vector: List[float], payload: Any) -> None:
+        if item_id in self._slots:
+            self._release(item_id)
+
+        while len(self._slots) >= self.max_size:
+            self._release(next(iter(self._slots)))
+            if self.metrics_prefix:
+                MetricsManager.increment(f"{self.metrics_prefix}_evictions")
+
+        slot = self._allocate(len(vector))
+        self._vectors[slot] = self.normalize(vector)
+        self._item_ids[slot] = item_id
+        self._payloads[slot] = payload
+        self._slots[item_id] = slot
+
+    async def search(self, vector: List[float], k: int) -> List[Tuple[str, float, Any]]:
+        if not self._slots:
+            return []
+
+        query = self.normalize(vector)
+        if np is not None:
+            scores = self._vectors[:len(self._item_ids)] @ np.asarray(query, dtype=np.float32)
+            ranked = [
+                (int(slot), float(scores[slot])) for slot in np.argsort(-scores)
+                if self._item_ids[slot] is not None
+            ][:k]
+        else:
+            ranked = heapq.nlargest(
+                k,
+                ((slot, sum(map(mul, stored, query))) for slot, stored in enumerate(self._vectors) if stored is not None),
+                key=itemgetter(1)
+            )
+
+        return [(self._item_ids[slot], score, self._payloads[slot]) for slot, score in ranked]
+
+    async def remove(self, item_ids: List[str]) -> None:
+        for item_id in item_ids:
+            if item_id in self._slots:
+                self._release(item_id)
+
+    async def clear(self) -> None:
+        self._slots.clear()
+        self._free_slots.clear()
+        self._item_ids.clear()
+        self._payloads.clear()
+        self._vectors = None
@@ -0,0 +1,14 @@
+from typing import Any, Dict, Optional
+from app.domain.repository.metrics_repository import IMetricsRepository
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+class MetricsRepository(IMetricsRepository):
+
+    def increment(self, name: str, value: Optional[float] = 1, attributes: Optional[Dict[str, Any]] = None) -> None:
+        MetricsManager.increment(name, value, attributes)
+
+    def record(self, name: str, value: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+        MetricsManager.record(name, value, attributes)
+
+    def average(self, name: str) -> float:
+        return MetricsManager.average(name)
@@ -0,0 +1,80 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from pymongo.errors import PyMongoError
+from app.domain.repository.cache_repository import ICacheRepository
+from app.domain.repository.item_sql_repository import IItemSqlRepository
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+logger = logging.getLogger(__name__)
+
+class MongoCacheRepository(ICacheRepository):
+    def __init__(self, db_repository: IItemSqlRepository, ttl_seconds: Optional[float] = 300.0,
+                 local_cache: Optional[ICacheRepository] = None, metrics_prefix: Optional[str] = None) -> None:
+        self.db_repository = db_repository
+        self.ttl_seconds = ttl_seconds
+        self.local_cache = local_cache
+        self.metrics_prefix = metrics_prefix
+        self._indexed = False
+
+    def _track(self, event: str) -> None:
+        if self.metrics_prefix:
+            MetricsManager.increment(f"{self.metrics_prefix}_{event}")
+
+    async def _ensure_index(self) -> None:
+        if not self._indexed:
+            await self.db_repository.create_index([("expires_at", 1)], expireAfterSeconds=0)
+            self._indexed = True
+
+    async def get(self, key: str, track: Optional[bool] = True) -> Optional[Any]:
+        if self.local_cache is not None:
+            value = await self.local_cache.get(key, track)
+            if value is not None:
+                return value
+
+        try:
+            documents = await self.db_repository.get_items_by_filter(
+                {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}}, length=1
+            )
+        except PyMongoError as e:
+            logger.warning("Mongo cache unavailable, skipping lookup: %s", e)
+            self._track("errors")
+            return None
+
+        if not documents:
+            if track:
+                self._track("misses")
+            return None
+
+        if track:
+            self._track("hits")
+        value = documents[0]["value"]
+        if self.local_cache is not None:
+            await self.local_cache.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if self.local_cache is not None:
+            await self.local_cache.set(key, value, ttl_seconds)
+
+        try:
+            await self._ensure_index()
+            await self.db_repository.update_by_filter(
+                {"_id": key},
+                {"value": value, "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)},
+                upsert=True
+            )
+        except PyMongoError as e:
+            logger.warning("Mongo cache unavailable, skipping write: %s", e)
+            self._track("errors")
+
+    async def delete(self, key: str) -> None:
+        if self.local_cache is not None:
+            await self.local_cache.delete(key)
+        await self.db_repository.delete_many_items({"_id": key})
+
+    async def clear(self) -> None:
+        if self.local_cache is not None:
+            await self.local_cache.clear()
+        await self.db_repository.delete_many_items({})
@@ -1,6 +1,6 @@
 from bson import ObjectId
 from pymongo import AsyncMongoClient
-from typing import Coroutine, Optional, Any, Dict, List
+from typing import Coroutine, Optional, Any, Dict, List, Tuple
 from app.domain.repository.item_sql_repository import IItemSqlRepository
 
 JsonType = Dict[str, Any]
@@ -31,6 +31,15 @@ class MongoDbRepository(IItemSqlRepository):
             projection=projection
         ).to_list(length=length)
 
+    async def get_sorted_items(self, filter: Dict[str, Any], sort: List[Tuple[str, int]],
+                               projection: Optional[Dict[str, Any]] = None, skip: Optional[int] = 0,
+                               length: Optional[int] = None, collection_name: Optional[str] = None) -> List[JsonType]:
+        collection = self._create_collection_reference(collection_name)
+        cursor = collection.find(filter=filter, projection=projection, sort=sort, skip=skip)
+        if length:
+            cursor = cursor.limit(length)
+        return await cursor.to_list(length=length)
+
     async def insert_item(self, raw_data: JsonType, collection_name: Optional[str] = None) -> None:
         collection = self._create_collection_reference(collection_name)
         return await collection.insert_one(raw_data)
@@ -48,6 +57,10 @@ class MongoDbRepository(IItemSqlRepository):
         collection = self._create_collection_reference(collection_name)
         await collection.insert_many(items)
 
+    async def bulk_write(self, operations: List[Any], ordered: Optional[bool] = True, collection_name: Optional[str] = None) -> Any:
+        collection = self._create_collection_reference(collection_name)
+        return await collection.bulk_write(operations, ordered=ordered)
+
     async def delete_item(self, item_id: str, collection_name: Optional[str] = None) -> None:
         collection = self._create_collection_reference(collection_name)
         await collection.delete_one({"_id": ObjectId(item_id)})
@@ -56,7 +69,19 @@ class MongoDbRepository(IItemSqlRepository):
         collection = self._create_collection_reference(collection_name)
         await collection.delete_many(filter)
 
-    async def update_by_filter(self, filter: Dict[str, Any], updated_value: Dict[str, Any], collection_name: Optional[str] = None) -> None:
+    async def update_by_filter(self, filter: Dict[str, Any], updated_value: Dict[str, Any], collection_name: Optional[str] = None,
+                               upsert: Optional[bool] = False) -> None:
+        collection = self._create_collection_reference(collection_name)
+        await collection.update_one(filter, {"$set": updated_value}, upsert=upsert)
+
+    async def create_index(self, keys: List[Tuple[str, int]], collection_name: Optional[str] = None, **kwargs: Any) -> str:
+        collection = self._create_collection_reference(collection_name)
+        return await collection.create_index(keys, **kwargs)
+
+    async def explain_aggregate(self, pipeline: JsonArrayType, collection_name: Optional[str] = None) -> JsonType:
         collection = self._create_collection_reference(collection_name)
-        await collection.update_one(filter, {"$set": updated_value})
+        return await self.database.command({
+            "explain": {"aggregate": collection.name, "pipeline": pipeline, "cursor": {}},
+            "verbosity": "queryPlanner"
+        })
         
\ No newline at end of file
@@ -1,14 +1,36 @@
+import logging
 from collections.abc import Sequence
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 from agent_framework import ChatMessage
 from app.domain.message_store.mongo_message_store import MongoMessageStore
 from app.infrastructure.repository.mongo_db import MongoDbRepository
 from app.domain.repository.chat_message_store import IChatMessageStore 
 from app.domain.repository.history_converter import HistoryConverter
+from app.domain.repository.cache_repository import ICacheRepository
 from app.domain.contants import LlmProviderEnum
-from pymongo import DESCENDING as DSC
-from datetime import datetime
+from app.infrastructure.repository.memory_cache import MemoryCacheRepository
+from app.config import get_settings
+from app.infrastructure.contants import HistoryTrimStrategy
+from pymongo import DESCENDING as DSC, InsertOne, DeleteMany
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_LIMIT = 10
+
+@lru_cache
+def get_history_cache() -> Optional[ICacheRepository]:
+    settings = get_settings()
+    if not settings.history_cache_enabled:
+        return None
+
+    return MemoryCacheRepository(
+        max_size=settings.history_cache_max_size,
+        ttl_seconds=settings.history_cache_ttl_seconds,
+        metrics_prefix="history_cache"
+    )
 
 class MongoChatMessageStore(IChatMessageStore):
 
@@ -18,7 +40,10 @@ class MongoChatMessageStore(IChatMessageStore):
         thread_id: str, 
         max_messages: Optional[int] | None = None,
         key_prefix: Optional[str] = "thread",
-        provider: Optional[LlmProviderEnum] = LlmProviderEnum.OPEN_AI
+        provider: Optional[LlmProviderEnum] = LlmProviderEnum.OPEN_AI,
+        history_cache: Optional[ICacheRepository] = None,
+        history_limit: Optional[int] = DEFAULT_HISTORY_LIMIT,
+        trim_strategy: Optional[HistoryTrimStrategy] = None
     ) -> None:
 
         self.db_repository = db_repository
@@ -28,11 +53,98 @@ class MongoChatMessageStore(IChatMessageStore):
         self.key_prefix = key_prefix
         self.provider = provider
         self.history_converter = HistoryConverter(self.provider)
+        self.history_cache = history_cache if history_cache is not None else get_history_cache()
+        self.history_limit = history_limit
+        self.expiring_history = get_settings().mongo_conversation_ttl_seconds is not None
+        self.trim_strategy = trim_strategy or HistoryTrimStrategy(get_settings().mongo_history_trim_strategy)
 
     @property
     def mongo_partition_key(self) -> str:
         return f"{self.key_prefix}:{self.thread_id}"
 
+    @property
+    def history_version_key(self) -> str:
+        return f"{self.mongo_partition_key}:version"
+
+    @property
+    def cached_history_size(self) -> int:
+        if self.max_messages is None:
+            return self.history_limit
+        return min(self.history_limit, self.max_messages)
+
+    @staticmethod
+    def build_history_pipeline(thread_id: str, limit: int) -> List[Dict[str, Any]]:
+        return [
+            {"$match": {"thread_id": thread_id}},
+            {"$sort": {"timestamp": DSC}},
+            {"$limit": limit}
+        ]
+
+    async def _invalidate_history_cache(self) -> None:
+        if self.history_cache is None:
+            return
+
+        await self.history_cache.set(self.history_version_key, uuid4().hex)
+        await self.history_cache.delete(self.mongo_partition_key)
+
+    async def _trim_by_count(self) -> None:
+        filter = {"thread_id": self.thread_id}
+        current_count = await self.db_repository.count_items(filter)
+
+        if current_count <= self.max_messages:
+            return
+
+        pipeline = [
+            {"$match": {"thread_id": self.thread_id}},
+            {"$sort": {"timestamp": DSC}},
+            {"$limit": self.max_messages},
+            {"$group": {
+                "_id": None,
+                "min_timestamp": {"$min": "$timestamp"}
+            }}
+        ]
+
+        result = await self.db_repository.aggregate(pipeline, max_length=1)
+
+        if result:
+            min_timestamp = result[0]["min_timestamp"]
+            await self.db_repository.delete_many_items({
+                "thread_id": self.thread_id,
+                "timestamp": {"$lt": min_timestamp}
+            })
+
+    async def _get_trim_filter(self, serialized_messages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        kept_existing_messages = self.max_messages - len(serialized_messages)
+
+        if self.max_messages <= 0:
+            return {"thread_id": self.thread_id}
+
+        if kept_existing_messages <= 0:
+            cutoff_timestamp = serialized_messages[-self.max_messages]["timestamp"]
+            return {"thread_id": self.thread_id, "timestamp": {"$lt": cutoff_timestamp}}
+
+        cutoff = await self.db_repository.get_sorted_items(
+            {"thread_id": self.thread_id},
+            sort=[("timestamp", DSC)],
+            projection={"timestamp": 1, "_id": 0},
+            skip=kept_existing_messages - 1,
+            length=1
+        )
+
+        if not cutoff:
+            return None
+
+        return {"thread_id": self.thread_id, "timestamp": {"$lt": cutoff[0]["timestamp"]}}
+
+    async def _insert_and_trim(self, serialized_messages: List[Dict[str, Any]]) -> None:
+        operations = [InsertOne(serialized_message) for serialized_message in serialized_messages]
+
+        trim_filter = await self._get_trim_filter(serialized_messages)
+        if trim_filter is not None:
+            operations.append(DeleteMany(trim_filter))
+
+        await self.db_repository.bulk_write(operations)
+
     async def add_messages(self, messages: Sequence[ChatMessage]) -> None:
         
         if not messages:
@@ -45,56 +157,48 @@ class MongoChatMessageStore(IChatMessageStore):
                 **self._serialize_json_message(msg)
             } 
             for msg in messages]
-        print(f"Serielized messages {serialized_messages}")
-        await self.db_repository.batch_insert(serialized_messages)
-        print("Messages saved")
-
-        if self.max_messages is not None:
-            
-            filter = {"thread_id": self.thread_id}
-            current_count = await self.db_repository.count_items(filter)
-
-            if current_count > self.max_messages:
-                
-                pipeline = [
-                {"$match": {"thread_id": self.thread_id}},
-                {"$sort": {"timestamp": DSC}},
-                {"$limit": self.max_messages},
-                {"$group": {
-                    "_id": None,
-                    "min_timestamp": {"$min": "$timestamp"}
-                }}
-            ]
-
-            result = await self.db_repository.aggregate(pipeline, max_length=1)
-        
-            if result:
-                min_timestamp = result[0]["min_timestamp"]
-                await self.db_repository.delete_many_items({
-                    "thread_id": self.thread_id,
-                    "timestamp": {"$lt": min_timestamp}
-                })
+
+        if self.expiring_history:
+            created_at = datetime.now(timezone.utc)
+            for serialized_message in serialized_messages:
+                serialized_message["created_at"] = created_at
+        logger.debug("Serialized messages %s", serialized_messages)
+        if self.max_messages is None:
+            await self.db_repository.batch_insert(serialized_messages)
+        elif self.trim_strategy == HistoryTrimStrategy.BULK_WRITE:
+            await self._insert_and_trim(serialized_messages)
+        else:
+            await self.db_repository.batch_insert(serialized_messages)
+            await self._trim_by_count()
+        logger.debug("Saved %s messages for thread %s", len(serialized_messages), self.thread_id)
+
+        await self._invalidate_history_cache()
 
 
     async def list_messages(self) -> list[ChatMessage]:
 
-        pipeline = [
-            {"$match": {"thread_id": self.thread_id}},
-            {"$sort": {"timestamp": DSC}},
-            {"$limit": 10}
-        ]
+        history_version = None
+        if self.history_cache is not None:
+            cached_messages = await self.history_cache.get(self.mongo_partition_key)
+            if cached_messages is not None:
+                return list(cached_messages)
+            history_version = await self.history_cache.get(self.history_version_key, track=False)
+
+        pipeline = self.build_history_pipeline(self.thread_id, self.cached_history_size)
 
-        print("Getting Messages")
         last_messages = await self.db_repository.aggregate(pipeline)
         last_messages.reverse() 
 
         messages = []
         for serialized_message in last_messages:
-            print("Seriataled Message", serialized_message, type(serialized_message))
+            logger.debug("Serialized message %s", serialized_message)
             converted_serialized_message = self.history_converter.transform(serialized_message)
             message = self._deserialize_json_message(converted_serialized_message)
             messages.append(message)
 
+        if self.history_cache is not None and await self.history_cache.get(self.history_version_key, track=False) == history_version:
+            await self.history_cache.set(self.mongo_partition_key, list(messages))
+
         return messages
 
     async def serialize_state(self, **kwargs: Any) -> Any:
@@ -121,4 +225,5 @@ class MongoChatMessageStore(IChatMessageStore):
 
 
     async def clear(self) -> None:
-        await self.db_repository.delete_many_items({"thread_id": self.thread_id})
\ No newline at end of file
+        await self.db_repository.delete_many_items({"thread_id": self.thread_id})
+        await self._invalidate_history_cache()
\ No newline at end of file
@@ -0,0 +1,15 @@
+from typing import List, Optional
+from app.domain.repository.embedding_repository import IEmbeddingRepository
+from app.infrastructure.managers.openai_client_manager import OpenAiClientManager
+
+class OpenAiEmbeddingRepository(IEmbeddingRepository):
+    def __init__(self, openai_client_manager: OpenAiClientManager, model: str, dimensions: Optional[int] = None) -> None:
+        self.openai_client_manager = openai_client_manager
+        self.model = model
+        self.dimensions = dimensions
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        open_ai_client = await self.openai_client_manager.get_client()
+        options = {"dimensions": self.dimensions} if self.dimensions else {}
+        response = await open_ai_client.embeddings.create(model=self.model, input=texts, **options)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -0,0 +1,81 @@
+import json
+import logging
+from typing import Any, Optional
+import redis.asyncio as redis
+from app.domain.repository.cache_repository import ICacheRepository
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+logger = logging.getLogger(__name__)
+
+class RedisCacheRepository(ICacheRepository):
+    def __init__(self, redis_client: redis.Redis, key_prefix: str, ttl_seconds: Optional[float] = 300.0,
+                 local_cache: Optional[ICacheRepository] = None, metrics_prefix: Optional[str] = None) -> None:
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self.local_cache = local_cache
+        self.metrics_prefix = metrics_prefix
+
+    def _track(self, event: str) -> None:
+        if self.metrics_prefix:
+            MetricsManager.increment(f"{self.metrics_prefix}_{event}")
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def get(self, key: str, track: Optional[bool] = True) -> Optional[Any]:
+        if self.local_cache is not None:
+            value = await self.local_cache.get(key, track)
+            if value is not None:
+                return value
+
+        try:
+            raw_value = await self.redis_client.get(self._get_key(key))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable, skipping lookup: %s", e)
+            self._track("errors")
+            return None
+
+        if raw_value is None:
+            if track:
+                self._track("misses")
+            return None
+
+        if track:
+            self._track("hits")
+        value = json.loads(raw_value)
+        if self.local_cache is not None:
+            await self.local_cache.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if self.local_cache is not None:
+            await self.local_cache.set(key, value, ttl_seconds)
+
+        try:
+            await self.redis_client.set(self._get_key(key), json.dumps(value, default=str), px=int(ttl_seconds * 1000))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable, skipping write: %s", e)
+            self._track("errors")
+
+    async def delete(self, key: str) -> None:
+        if self.local_cache is not None:
+            await self.local_cache.delete(key)
+
+        try:
+            await self.redis_client.delete(self._get_key(key))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable, skipping delete: %s", e)
+            self._track("errors")
+
+    async def clear(self) -> None:
+        if self.local_cache is not None:
+            await self.local_cache.clear()
+
+        try:
+            async for key in self.redis_client.scan_iter(match=f"{self.key_prefix}:*"):
+                await self.redis_client.delete(key)
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable, skipping clear: %s", e)
+            self._track("errors")
@@ -1,36 +1,97 @@
 import os
 import logging
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List
 from datetime import datetime, timedelta, timezone
 from azure.storage.blob.aio import BlobServiceClient
 from azure.storage.blob import generate_blob_sas, BlobSasPermissions
 from app.domain.repository.storage_repository import IStorageRepository
 from app.domain.utils import get_class_name 
+from app.infrastructure.managers.metrics_manager import MetricsManager
 from concurrent.futures import as_completed, ThreadPoolExecutor
 from tqdm import tqdm 
 import asyncio
 
 class StorageAccountRepository(IStorageRepository):
-    def __init__(self, client: BlobServiceClient, storage_account: str):
+    def __init__(self, client: BlobServiceClient, storage_account: str,
+                 delegation_key_lifetime: Optional[timedelta] = timedelta(hours=2),
+                 delegation_key_refresh_margin: Optional[timedelta] = timedelta(minutes=45),
+                 sas_lifetime: Optional[timedelta] = timedelta(minutes=40)):
         self.client = client
         self.storage_account = storage_account
         self.logger = logging.getLogger(get_class_name(self))
-        pass
-    
-    async def generate_token(self, container_name: str, blob_name: str) -> str:
-        user_delegation_key = await self.client.get_user_delegation_key(
-            key_start_time=datetime.now(timezone.utc) - timedelta(minutes=2),
-            key_expiry_time=datetime.now(timezone.utc) + timedelta(hours=1))
+        self.delegation_key_lifetime = delegation_key_lifetime
+        self.delegation_key_refresh_margin = delegation_key_refresh_margin
+        self.sas_lifetime = sas_lifetime
+        self._delegation_key = None
+        self._delegation_key_expiry: Optional[datetime] = None
+        self._delegation_key_lock = asyncio.Lock()
+        self._delegation_key_refresh: Optional[asyncio.Task] = None
+
+    async def _refresh_delegation_key(self) -> Any:
+        async with self._delegation_key_lock:
+            now = datetime.now(timezone.utc)
+            if self._delegation_key is not None and now < self._delegation_key_expiry - self.delegation_key_refresh_margin:
+                MetricsManager.increment("storage_delegation_key_hits")
+                return self._delegation_key
+
+            key_expiry = now + self.delegation_key_lifetime
+            self._delegation_key = await self.client.get_user_delegation_key(
+                key_start_time=now - timedelta(minutes=2),
+                key_expiry_time=key_expiry)
+            self._delegation_key_expiry = key_expiry
+            MetricsManager.increment("storage_delegation_key_misses")
+            self.logger.info("User delegation key refreshed, valid until %s", key_expiry.isoformat())
+            return self._delegation_key
+
+    def _on_delegation_key_refreshed(self, refresh: asyncio.Task) -> None:
+        if self._delegation_key_refresh is refresh:
+            self._delegation_key_refresh = None
+
+        if not refresh.cancelled() and refresh.exception() is not None:
+            self.logger.warning("Background user delegation key refresh failed: %s", refresh.exception())
+            MetricsManager.increment("storage_delegation_key_errors")
+
+    async def get_user_delegation_key(self) -> Any:
+        now = datetime.now(timezone.utc)
+        if self._delegation_key is None or now >= self._delegation_key_expiry - timedelta(minutes=1):
+            return await self._refresh_delegation_key()
+
+        if now >= self._delegation_key_expiry - self.delegation_key_refresh_margin and (
+            self._delegation_key_refresh is None or self._delegation_key_refresh.done()
+        ):
+            self._delegation_key_refresh = asyncio.create_task(self._refresh_delegation_key())
+            self._delegation_key_refresh.add_done_callback(self._on_delegation_key_refreshed)
 
+        MetricsManager.increment("storage_delegation_key_hits")
+        return self._delegation_key
+
+    def sign_blob(self, container_name: str, blob_name: str, user_delegation_key: Any) -> str:
         return generate_blob_sas(
             account_name=self.storage_account,
             container_name=container_name,
             blob_name=blob_name,
             user_delegation_key=user_delegation_key,
             permission=BlobSasPermissions(read=True),
-            expiry=datetime.now(timezone.utc) + timedelta(minutes=40)
+            expiry=min(datetime.now(timezone.utc) + self.sas_lifetime, self._delegation_key_expiry)
         )
 
+    async def generate_token(self, container_name: str, blob_name: str) -> str:
+        return self.sign_blob(container_name, blob_name, await self.get_user_delegation_key())
+
+    async def generate_tokens(self, container_name: str, blob_names: List[str]) -> Dict[str, str]:
+        user_delegation_key = await self.get_user_delegation_key()
+        return {
+            blob_name: self.sign_blob(container_name, blob_name, user_delegation_key)
+            for blob_name in blob_names
+        }
+
+    def get_signed_url(self, container_name: str, blob_name: str, sas_token: str) -> str:
+        return f"https://{self.storage_account}.blob.core.windows.net/{container_name}/{blob_name}?{sas_token}"
+
+    async def generate_signed_urls(self, container_name: str, blob_names: List[str]) -> List[str]:
+        sas_tokens = await self.generate_tokens(container_name, blob_names)
+        return [self.get_signed_url(container_name, blob_name, sas_tokens[blob_name]) for blob_name in blob_names]
+
     async def upload_file(
                     self, container_name: str, local_file_path: str, semaphore = None,
                     blob_name: Optional[str] = None, enable_signature: Optional[bool] = True,
@@ -44,18 +105,41 @@ class StorageAccountRepository(IStorageRepository):
                         self, container_name: str, local_file_path: str, 
                         blob_name: Optional[str] = None, enable_signature: Optional[bool] = True) -> str:
         container_client = self.client.get_container_client(container_name)
-        print("El blob", os.path.basename(local_file_path))
+        self.logger.debug("Uploading blob %s", os.path.basename(local_file_path))
         blob_name = blob_name if blob_name else os.path.basename(local_file_path)
         
         async with container_client.get_blob_client(blob_name) as blob_client:
             with open(local_file_path, "rb") as data:
                 await blob_client.upload_blob(data, overwrite=True)
 
+        return await self._get_blob_url(container_name, blob_name, blob_client.url, enable_signature)
+
+    async def upload_content(
+                    self, container_name: str, blob_name: str, content: bytes, semaphore = None,
+                    enable_signature: Optional[bool] = True
+                    ) -> str:
+        if semaphore:
+            async with semaphore:
+                return await self._upload_content(container_name, blob_name, content, enable_signature)
+        return await self._upload_content(container_name, blob_name, content, enable_signature)
+
+    async def _upload_content(
+                        self, container_name: str, blob_name: str, content: bytes,
+                        enable_signature: Optional[bool] = True) -> str:
+        container_client = self.client.get_container_client(container_name)
+        self.logger.debug("Uploading blob %s from memory (%s bytes)", blob_name, len(content))
+
+        async with container_client.get_blob_client(blob_name) as blob_client:
+            await blob_client.upload_blob(content, overwrite=True, length=len(content))
+
+        return await self._get_blob_url(container_name, blob_name, blob_client.url, enable_signature)
+
+    async def _get_blob_url(self, container_name: str, blob_name: str, blob_url: str, enable_signature: Optional[bool] = True) -> str:
         if not enable_signature:
-            return blob_client.url
+            return blob_url
 
         sas_token = await self.generate_token(container_name, blob_name)
-        return f"https://{self.storage_account}.blob.core.windows.net/{container_name}/{blob_name}?{sas_token}"
+        return self.get_signed_url(container_name, blob_name, sas_token)
 
     async def upload_many_files(self, container_name: str, files_list: List[str],
                                 max_concurrent: Optional[str] = 20 ) -> List[str]:
@@ -66,18 +150,24 @@ class StorageAccountRepository(IStorageRepository):
             self.upload_file(
                 container_name=container_name,
                 local_file_path=current_file,
-                semaphore=semaphore
+                semaphore=semaphore,
+                enable_signature=False
             )
             for current_file in files_list
         ]
 
         process_results = await asyncio.gather(*uplodad_tasks, return_exceptions=True)
 
-        successes = [result for result in process_results if not isinstance(result, Exception)]
+        uploaded_blobs = [
+            os.path.basename(current_file) for current_file, result in zip(files_list, process_results)
+            if not isinstance(result, Exception)
+        ]
+        sas_tokens = await self.generate_tokens(container_name, uploaded_blobs)
+        successes = [self.get_signed_url(container_name, blob_name, sas_tokens[blob_name]) for blob_name in uploaded_blobs]
         failures = [(files_list[i], result) for i, result in enumerate(process_results) 
                    if isinstance(result, Exception)]
         
         if failures:
-            print(f"These files has been failure {len(failures)} -> {failures}")
+            self.logger.warning("%s files failed to upload: %s", len(failures), failures)
         
         return successes
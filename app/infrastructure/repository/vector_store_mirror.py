@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+from pymongo import ASCENDING as ASC, DESCENDING as DSC, UpdateOne
+from app.domain.document import VectorStoreFileRecord
+from app.domain.exceptions import InvalidPageCursor
+from app.domain.repository.item_sql_repository import IItemSqlRepository
+from app.domain.repository.vector_store_mirror_repository import IVectorStoreMirrorRepository
+
+MIRROR_SORT = [("created_at", DSC), ("vector_store_file_id", DSC)]
+
+class VectorStoreMirrorRepository(IVectorStoreMirrorRepository):
+    def __init__(self, db_repository: IItemSqlRepository) -> None:
+        self.db_repository = db_repository
+
+    @staticmethod
+    def _get_key(vector_store_id: str, file_id: str) -> str:
+        return f"{vector_store_id}:{file_id}"
+
+    async def create_indexes(self) -> List[str]:
+        return [
+            await self.db_repository.create_index(
+                [("vector_store_id", ASC), *MIRROR_SORT], name="vector_store_created_at_idx"
+            ),
+            await self.db_repository.create_index(
+                [("vector_store_id", ASC), ("file_name", ASC), *MIRROR_SORT], name="vector_store_file_name_idx"
+            ),
+            await self.db_repository.create_index([("vector_store_id", ASC), ("synced_at", ASC)], name="vector_store_synced_at_idx")
+        ]
+
+    async def upsert_files(self, records: List[VectorStoreFileRecord], synced_at: str) -> None:
+        if not records:
+            return
+
+        await self.db_repository.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": self._get_key(record.vector_store_id, record.vector_store_file_id)},
+                    {"$set": {**record.model_dump(), "synced_at": synced_at}},
+                    upsert=True
+                )
+                for record in records
+            ],
+            ordered=False
+        )
+
+    async def remove_files(self, vector_store_id: str, file_ids: List[str]) -> None:
+        await self.db_repository.delete_many_items(
+            {"_id": {"$in": [self._get_key(vector_store_id, file_id) for file_id in file_ids]}}
+        )
+
+    async def remove_stale_files(self, vector_store_id: str, synced_before: str) -> None:
+        await self.db_repository.delete_many_items({"vector_store_id": vector_store_id, "synced_at": {"$lt": synced_before}})
+
+    async def list_files(self, vector_store_id: str, after: Optional[str] = None, limit: Optional[int] = 20,
+                         file_name: Optional[str] = None) -> List[VectorStoreFileRecord]:
+        filter: Dict[str, Any] = {"vector_store_id": vector_store_id}
+        if file_name:
+            filter["file_name"] = file_name
+
+        if after:
+            cursor_items = await self.db_repository.get_items_by_filter(
+                {"_id": self._get_key(vector_store_id, after)}, projection={"created_at": 1}, length=1
+            )
+            if not cursor_items:
+                raise InvalidPageCursor(after)
+
+            created_at = cursor_items[0]["created_at"]
+            filter["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "vector_store_file_id": {"$lt": after}}
+            ]
+
+        items = await self.db_repository.get_sorted_items(filter, MIRROR_SORT, projection={"_id": 0, "synced_at": 0}, length=limit)
+        return [VectorStoreFileRecord(**item) for item in items]
+
+    async def list_files_by_status(self, vector_store_id: str, status: str,
+                                   limit: Optional[int] = 100) -> List[VectorStoreFileRecord]:
+        items = await self.db_repository.get_sorted_items(
+            {"vector_store_id": vector_store_id, "status": status}, MIRROR_SORT,
+            projection={"_id": 0, "synced_at": 0}, length=limit
+        )
+        return [VectorStoreFileRecord(**item) for item in items]
+
+    async def get_latest_created_at(self, vector_store_id: str) -> Optional[int]:
+        items = await self.db_repository.get_sorted_items(
+            {"vector_store_id": vector_store_id}, MIRROR_SORT, projection={"created_at": 1}, length=1
+        )
+        return items[0]["created_at"] if items else None
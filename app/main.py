@@ -1,5 +1,3 @@
-import logging
-import sys
 import uvicorn
 
 from app.config import get_settings
@@ -20,17 +18,19 @@ from pydantic import ValidationError
 from app.presentation.exception_handlers import api_exception_handler, domain_exception_handler, generic_exception_handler
 from app.presentation.exception_handlers import request_validation_exception_handler, validation_exception_handler
 from app.presentation.api.routes import checks, conversations, documents, knownledge
-
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+from app.infrastructure.managers.logging_manager import LoggingManager
+
+def setup_logging(settings) -> None:
+    LoggingManager.configure(
+        level=settings.log_level,
+        json_format=settings.log_json,
+        sample_rates=LoggingManager.parse_rules(settings.log_sample_rates, float),
+        rate_limits=LoggingManager.parse_rules(settings.log_rate_limits, int),
+        logger_levels={
+            'app.infrastructure': settings.log_level,
+            'app.presentation': settings.log_level
+        }
     )
-    logging.getLogger('app.infrastructure').setLevel(logging.INFO)
-    logging.getLogger('app.presentation').setLevel(logging.INFO)
 
 def setup_opentelemetry(settings) -> None:
     from agent_framework.observability import configure_otel_providers
@@ -39,15 +39,20 @@ def setup_opentelemetry(settings) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    container = get_container()
 
     try:
+        await container.get("mongo_index_manager").start()
+        container.get("ingestion_job_manager").start()
+        if get_settings().knownledge_mirror_enabled:
+            container.get("knownledge_mirror_manager").start()
         print("✅ Application is running...")
         yield        
     finally:
         print("🛑 Shutting down application...")
-        container = get_container()
         await container.close_all()
         print("✅ All connections closed")
+        LoggingManager.shutdown()
     
 
 def create_app():
@@ -59,6 +64,7 @@ def create_app():
     app.include_router(checks.router)
     
     settings = get_settings()
+    setup_logging(settings)
     setup_opentelemetry(settings)
 
     app.add_middleware(
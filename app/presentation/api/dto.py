@@ -78,6 +78,32 @@ class UploadedDocumentResponse(BaseModel):
     file_name: str = Field(description="File name")
 
 class UploadedKnownledgeDocumentResponse(BaseModel):
-    vector_store_file_id: str = Field(description="File id in vector store")
+    vector_store_file_id: Optional[str] = Field(default=None, description="File id in vector store once indexed")
     file_name: str = Field(description="File name")
-    id: str = Field(description="File id")
+    id: str = Field(description="Ingestion job id")
+    status: str = Field(description="Ingestion job status")
+
+class KnownledgeBatchUploadItem(BaseModel):
+    file_name: Optional[str] = Field(default=None, description="File name")
+    status: str = Field(description="File ingestion status, rejected when the file could not be saved")
+    vector_store_file_id: Optional[str] = Field(default=None, description="File id in vector store once indexed")
+    deduplicated: bool = Field(default=False, description="Whether the file was already indexed")
+    error: Optional[str] = Field(default=None, description="Failure reason")
+
+class KnownledgeBatchUploadResponse(BaseModel):
+    id: Optional[str] = Field(default=None, description="Ingestion job id")
+    status: str = Field(description="Ingestion job status")
+    files: List[KnownledgeBatchUploadItem] = Field(default_factory=list, description="Per file report in request order")
+
+class KnownledgeBatchDeleteRequest(BaseModel):
+    document_ids: List[str] = Field(min_length=1, description="Vector store file ids to delete")
+
+class KnownledgeBatchDeleteItem(BaseModel):
+    document_id: str = Field(description="Vector store file id")
+    deleted: bool = Field(description="Whether the file was deleted")
+    error: Optional[str] = Field(default=None, description="Failure reason")
+
+class KnownledgeBatchDeleteResponse(BaseModel):
+    deleted: int = Field(description="Number of deleted files")
+    failed: int = Field(description="Number of files that could not be deleted")
+    results: List[KnownledgeBatchDeleteItem] = Field(default_factory=list, description="Per file report in request order")
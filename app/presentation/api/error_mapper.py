@@ -7,7 +7,12 @@ class ExceptionMapper:
     _DOMAIN_TO_HTTP = {
         DomainExceptionCode.AGENT_NOT_FOUND: HTTPStatus.NOT_FOUND,
         DomainExceptionCode.GUARDIAL_POLICIES_VIOLATED: HTTPStatus.BAD_REQUEST,
-        DomainExceptionCode.THREAD_NOT_FOUND: HTTPStatus.NOT_FOUND
+        DomainExceptionCode.THREAD_NOT_FOUND: HTTPStatus.NOT_FOUND,
+        DomainExceptionCode.DOCUMENT_TOO_LARGE: HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        DomainExceptionCode.INGESTION_JOB_NOT_FOUND: HTTPStatus.NOT_FOUND,
+        DomainExceptionCode.CONVERSATION_BUSY: HTTPStatus.CONFLICT,
+        DomainExceptionCode.IDEMPOTENCY_KEY_MISMATCH: HTTPStatus.UNPROCESSABLE_ENTITY,
+        DomainExceptionCode.INVALID_PAGE_CURSOR: HTTPStatus.BAD_REQUEST
     }
     
     @classmethod
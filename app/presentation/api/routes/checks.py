@@ -1,7 +1,12 @@
 from fastapi import APIRouter
+from app.infrastructure.managers.metrics_manager import MetricsManager
 
 router = APIRouter()
 
 @router.get("/health")
 async def health():
-    return {"status":200}
\ No newline at end of file
+    return {"status":200}
+
+@router.get("/metrics")
+async def get_metrics():
+    return MetricsManager.snapshot()
@@ -1,5 +1,6 @@
 import logging
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Header, Request
 from fastapi.responses import StreamingResponse
 from starlette.responses import JSONResponse
 
@@ -12,7 +13,9 @@ from app.presentation.api.dto import (
     ConversationFilters,
     ConversationRequest, ConversationResponse
 )
-from app.presentation.streaming.sse import stream_response
+from app.presentation.streaming.sse import stream_response, stream_fast_response
+from app.presentation.streaming.pipeline import guard_stream, prime_stream
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +34,8 @@ STREAMING_HEADERS = {
 }
 
 @router.post("/{conversation_id}/")
-async def chat(conversation_id: str, conversation_request: ConversationRequest):
+async def chat(conversation_id: str, conversation_request: ConversationRequest,
+               idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key")):
     handle_message = get_handle_message_use_case()
 
     logger.info(f"Thread conversation {conversation_id}")
@@ -41,7 +45,8 @@ async def chat(conversation_id: str, conversation_request: ConversationRequest):
         additional_files=conversation_request.additional_files,
         conversation_id=conversation_id,
         additional_information=conversation_request.additional_information,
-        trace=conversation_request.trace.to_json()
+        trace=conversation_request.trace.to_json(),
+        idempotency_key=idempotency_key
     )
 
     chat_response = ConversationResponse(
@@ -53,20 +58,59 @@ async def chat(conversation_id: str, conversation_request: ConversationRequest):
 
 
 @router.post("/{conversation_id}/stream/")
-async def chat_stream(conversation_id: str, conversation_request: ConversationRequest):
+async def chat_stream(conversation_id: str, conversation_request: ConversationRequest, request: Request,
+                      idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key")):
     handle_message_stream = get_handle_message_stream_use_case()
 
     logger.info(f"Thread conversation {conversation_id}")
 
+    settings = get_settings()
+
+    if settings.streaming_fast_path:
+        deltas = await prime_stream(
+            handle_message_stream.generate_deltas(
+                message=conversation_request.message,
+                additional_files=conversation_request.additional_files,
+                conversation_id=conversation_id,
+                idempotency_key=idempotency_key
+            )
+        )
+        return StreamingResponse(
+            stream_fast_response(
+                handle_message_stream.start_event(),
+                guard_stream(
+                    request,
+                    deltas,
+                    max_buffered_items=settings.streaming_buffer_size,
+                    disconnect_poll_interval=settings.streaming_disconnect_poll_ms / 1000
+                ),
+                handle_message_stream.end_event(),
+                coalesce_delay=settings.streaming_coalesce_ms / 1000,
+                coalesce_bytes=settings.streaming_coalesce_bytes
+            ),
+            media_type="text/event-stream",
+            headers=STREAMING_HEADERS
+        )
+
+    events = await prime_stream(
+        handle_message_stream.execute(
+            message=conversation_request.message,
+            additional_files=conversation_request.additional_files,
+            conversation_id=conversation_id,
+            additional_information=conversation_request.additional_information,
+            trace=conversation_request.trace.to_json(),
+            idempotency_key=idempotency_key
+        )
+    )
+
     async def generate():
         try:
             async for chunk in stream_response(
-                handle_message_stream.execute(
-                    message=conversation_request.message,
-                    additional_files=conversation_request.additional_files,
-                    conversation_id=conversation_id,
-                    additional_information=conversation_request.additional_information,
-                    trace=conversation_request.trace.to_json()
+                guard_stream(
+                    request,
+                    events,
+                    max_buffered_items=settings.streaming_buffer_size,
+                    disconnect_poll_interval=settings.streaming_disconnect_poll_ms / 1000
                 )
             ):
                 yield chunk
@@ -1,6 +1,7 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Any, AsyncGenerator, Dict, Literal
 from fastapi import APIRouter, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 
 from starlette.responses import JSONResponse
 
@@ -11,6 +12,7 @@ from app.presentation.api.dependencies import (
 from app.presentation.api.dto import (
     UploadedDocumentResponse
 )
+from app.presentation.streaming.sse import SseFrameEncoder, dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,34 @@ async def upload_document(
     
     return JSONResponse(uploaded_document.model_dump(), headers={"status_code": "200"})
 
+async def encode_document_events(
+    events: AsyncGenerator[Dict[str, Any], None], output_format: str
+) -> AsyncGenerator[bytes, None]:
+    encoder = SseFrameEncoder()
+    try:
+        async for event in events:
+            yield encoder.encode(event) if output_format == "sse" else dumps_json(event) + b"\n"
+    except Exception as e:
+        logger.exception("Exception while streaming document pages: %s", e)
+        error_event = {"type": "error", "message": str(e), "error_type": type(e).__name__}
+        yield encoder.encode(error_event) if output_format == "sse" else dumps_json(error_event) + b"\n"
+
+@router.post("/stream/")
+async def upload_document_stream(
+    file: UploadFile = File(...),
+    username: Annotated[str, Form()] = "anonymous",
+    output_format: Literal["ndjson", "sse"] = "ndjson"
+    ):
+
+    handle_document = get_handle_documents_use_case()
+    document_events = await handle_document.stream_upload_document(file)
+
+    return StreamingResponse(
+        encode_document_events(document_events, output_format),
+        media_type="text/event-stream" if output_format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/documents/index/")
 async def upload_document(
     file: UploadFile = File(...),
@@ -1,16 +1,21 @@
 import logging
-from typing import Annotated, Optional
-from fastapi import APIRouter, UploadFile, File, Form
+from http import HTTPStatus
+from typing import Annotated, Any, AsyncGenerator, Dict, List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, Query
+from fastapi.responses import StreamingResponse
 
 from starlette.responses import JSONResponse
 
+from app.domain.contants import IngestionJobStatus
 from app.presentation.api.dependencies import (
     get_handle_knownledge_use_case,
 
 )
 from app.presentation.api.dto import (
-    UploadedKnownledgeDocumentResponse
+    UploadedKnownledgeDocumentResponse, KnownledgeBatchUploadItem, KnownledgeBatchUploadResponse,
+    KnownledgeBatchDeleteRequest, KnownledgeBatchDeleteItem, KnownledgeBatchDeleteResponse
 )
+from app.presentation.streaming.sse import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -29,29 +34,114 @@ async def upload_document(
 
     handle_knownlege_documents = get_handle_knownledge_use_case()
 
-    vector_store_file_id = await handle_knownlege_documents.upload_document(file)
+    ingestion_job = await handle_knownlege_documents.upload_document(file)
 
     uploaded_document = UploadedKnownledgeDocumentResponse(
-        vector_store_file_id=vector_store_file_id,
+        vector_store_file_id=ingestion_job.files[0].vector_store_file_id,
         file_name=file.filename,
-        id=""
+        id=ingestion_job.job_id,
+        status=ingestion_job.status.value
     )
     
-    return JSONResponse(uploaded_document.model_dump(), headers={"status_code": "200"})
+    status_code = HTTPStatus.OK if ingestion_job.status == IngestionJobStatus.COMPLETED else HTTPStatus.ACCEPTED
+    return JSONResponse(uploaded_document.model_dump(), status_code=status_code)
+
+@router.post("/batch/")
+async def upload_documents(
+    files: List[UploadFile] = File(...),
+    username: Annotated[str, Form()] = "anonymous"
+    ):
+
+    handle_knownlege_documents = get_handle_knownledge_use_case()
+
+    ingestion_job, results = await handle_knownlege_documents.upload_documents(files)
+
+    uploaded_documents = KnownledgeBatchUploadResponse(
+        id=ingestion_job.job_id if ingestion_job is not None else None,
+        status=ingestion_job.status.value if ingestion_job is not None else IngestionJobStatus.FAILED.value,
+        files=[
+            KnownledgeBatchUploadItem(file_name=file.filename, status="rejected", error=str(result))
+            if isinstance(result, Exception) else KnownledgeBatchUploadItem(**result.model_dump(mode="json"))
+            for file, result in zip(files, results)
+        ]
+    )
+
+    if ingestion_job is None:
+        status_code = HTTPStatus.BAD_REQUEST
+    else:
+        status_code = HTTPStatus.OK if ingestion_job.status == IngestionJobStatus.COMPLETED else HTTPStatus.ACCEPTED
+    return JSONResponse(uploaded_documents.model_dump(), status_code=status_code)
+
+@router.post("/batch/delete/")
+async def delete_documents(request: KnownledgeBatchDeleteRequest):
+
+    handle_knownlege_documents = get_handle_knownledge_use_case()
+    results = await handle_knownlege_documents.delete_documents(request.document_ids)
+
+    deleted_documents = [
+        KnownledgeBatchDeleteItem(
+            document_id=document_id,
+            deleted=not isinstance(result, Exception),
+            error=str(result) if isinstance(result, Exception) else None
+        )
+        for document_id, result in results
+    ]
+    deleted = sum(1 for item in deleted_documents if item.deleted)
+
+    return JSONResponse(
+        KnownledgeBatchDeleteResponse(
+            deleted=deleted, failed=len(deleted_documents) - deleted, results=deleted_documents
+        ).model_dump(),
+        headers={"status_code": "200"}
+    )
+
+@router.get("/jobs/{job_id}/")
+async def get_ingestion_job(job_id: str):
+
+    handle_knownlege_documents = get_handle_knownledge_use_case()
+    ingestion_job = await handle_knownlege_documents.get_ingestion_job(job_id)
+
+    return JSONResponse(ingestion_job.model_dump(mode="json"), headers={"status_code": "200"})
 
 @router.get("/")
-async def get_documents():
+async def get_documents(
+    after: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    file_name: Optional[str] = None
+    ):
+
+    handle_knownlege_documents = get_handle_knownledge_use_case()
+    vector_store_documents = await handle_knownlege_documents.get_documents(after, limit, file_name)
+
+    return JSONResponse(
+        vector_store_documents.model_dump(exclude={"data": {"__all__": {"vector_store_id"}}}),
+        headers={"status_code": "200"}
+    )
+
+async def encode_ndjson(documents: AsyncGenerator[Dict[str, Any], None]) -> AsyncGenerator[bytes, None]:
+    try:
+        async for document in documents:
+            yield dumps_json(document) + b"\n"
+    except Exception as e:
+        logger.exception("Exception while streaming knowledge documents: %s", e)
+        yield dumps_json({"type": "error", "message": str(e), "error_type": type(e).__name__}) + b"\n"
+
+@router.get("/stream/")
+async def stream_documents(file_name: Optional[str] = None):
 
     handle_knownlege_documents = get_handle_knownledge_use_case()
-    vector_store_documents = handle_knownlege_documents.get_documents()
 
-    return JSONResponse(vector_store_documents, headers={"status_code": "200"})
+    return StreamingResponse(
+        encode_ndjson(handle_knownlege_documents.stream_documents(file_name)),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.delete("/{document_id}/")
 async def delete_document(document_id: str):
 
     handle_knownlege_documents = get_handle_knownledge_use_case()
-    handle_knownlege_documents.delete_document(document_id)
+    await handle_knownlege_documents.delete_document(document_id)
 
     return JSONResponse({}, headers={"status_code": "200"})
 
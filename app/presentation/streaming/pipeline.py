@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+from starlette.requests import Request
+from app.infrastructure.managers.metrics_manager import MetricsManager
+
+logger = logging.getLogger(__name__)
+
+STREAM_COMPLETED = "streaming_completed_streams"
+STREAM_CANCELLED = "streaming_cancelled_streams"
+STREAM_FAILED = "streaming_failed_streams"
+STREAM_WASTED_TOKENS = "streaming_wasted_tokens"
+
+_END_OF_STREAM = object()
+
+
+async def _close_source(source: AsyncIterator[Any]) -> None:
+    aclose = getattr(source, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def guard_stream(
+    request: Request,
+    source: AsyncIterator[Any],
+    max_buffered_items: Optional[int] = 64,
+    disconnect_poll_interval: Optional[float] = 0.25
+) -> AsyncGenerator[Any, None]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_items)
+    pulled_items = 0
+    delivered_items = 0
+    disconnected = False
+    status = STREAM_CANCELLED
+
+    async def produce() -> None:
+        nonlocal pulled_items
+        try:
+            async for item in source:
+                pulled_items += 1
+                await queue.put(item)
+            await queue.put(_END_OF_STREAM)
+        except Exception as e:
+            await queue.put(e)
+
+    async def watch_disconnect() -> None:
+        nonlocal disconnected
+        while not await request.is_disconnected():
+            await asyncio.sleep(disconnect_poll_interval)
+
+        logger.info("Client disconnected, closing upstream stream")
+        disconnected = True
+        producer.cancel()
+        if not queue.full():
+            queue.put_nowait(_END_OF_STREAM)
+
+    producer = asyncio.create_task(produce())
+    watcher = asyncio.create_task(watch_disconnect())
+
+    try:
+        while not disconnected:
+            item = await queue.get()
+
+            if item is _END_OF_STREAM:
+                if not disconnected:
+                    status = STREAM_COMPLETED
+                return
+
+            if isinstance(item, Exception):
+                status = STREAM_FAILED
+                raise item
+
+            delivered_items += 1
+            yield item
+    finally:
+        watcher.cancel()
+        producer.cancel()
+        await asyncio.gather(producer, watcher, return_exceptions=True)
+        await _close_source(source)
+
+        MetricsManager.increment(status)
+        if status == STREAM_CANCELLED:
+            MetricsManager.increment(STREAM_WASTED_TOKENS, pulled_items - delivered_items)
+
+
+async def _resume_stream(source: AsyncIterator[Any], *first_items: Any) -> AsyncGenerator[Any, None]:
+    try:
+        for item in first_items:
+            yield item
+        async for item in source:
+            yield item
+    finally:
+        await _close_source(source)
+
+
+async def prime_stream(source: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    try:
+        first_item = await source.__anext__()
+    except StopAsyncIteration:
+        return _resume_stream(source)
+    except BaseException:
+        await _close_source(source)
+        raise
+
+    return _resume_stream(source, first_item)
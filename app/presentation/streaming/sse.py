@@ -2,11 +2,20 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, AsyncGenerator
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterator, Deque, Dict, List, Optional
 from app.domain.exceptions import DomainException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
 
 async def format_sse(data: dict[str, Any]) -> str:
     json_data = json.dumps(data, ensure_ascii=False)
@@ -34,3 +43,131 @@ async def stream_response(
             "timestamp": datetime.now().isoformat(),
         }
         yield await format_sse(error_data)
+
+
+def dumps_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SseFrameEncoder:
+    def __init__(self, data_type: Optional[str] = "chunk", text_field: Optional[str] = "text") -> None:
+        self.data_prefix = SSE_PREFIX + b'{"type":' + dumps_json(data_type) + b',"' + text_field.encode("utf-8") + b'":'
+        self.data_suffix = b"}" + SSE_SUFFIX
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return SSE_PREFIX + dumps_json(data) + SSE_SUFFIX
+
+    def encode_text(self, text: str) -> bytes:
+        return self.data_prefix + dumps_json(text) + self.data_suffix
+
+
+async def coalesce_deltas(
+    deltas: AsyncIterator[str], max_delay: Optional[float] = 0.02, max_bytes: Optional[int] = 256,
+    max_pending_chunks: Optional[int] = 64
+) -> AsyncGenerator[str, None]:
+    if max_delay <= 0 and max_bytes <= 0:
+        async for delta in deltas:
+            yield delta
+        return
+
+    loop = asyncio.get_running_loop()
+    chunks: Deque[str] = deque()
+    buffer: List[str] = []
+    buffered_bytes = 0
+    flush_timer = None
+    finished = False
+    error: Optional[BaseException] = None
+    ready = loop.create_future()
+    has_space = asyncio.Event()
+    has_space.set()
+
+    def flush() -> None:
+        nonlocal buffer, buffered_bytes, flush_timer
+        if buffer:
+            chunks.append("".join(buffer))
+            buffer, buffered_bytes = [], 0
+        if flush_timer is not None:
+            flush_timer.cancel()
+            flush_timer = None
+        if not ready.done():
+            ready.set_result(None)
+
+    async def produce() -> None:
+        nonlocal buffered_bytes, flush_timer, finished, error
+        try:
+            async for delta in deltas:
+                buffer.append(delta)
+                buffered_bytes += len(delta.encode("utf-8"))
+
+                if max_bytes > 0 and buffered_bytes >= max_bytes:
+                    flush()
+                elif flush_timer is None:
+                    flush_timer = loop.call_later(max(max_delay, 0), flush)
+
+                if len(chunks) >= max_pending_chunks:
+                    has_space.clear()
+                    await has_space.wait()
+        except Exception as e:
+            error = e
+        finally:
+            finished = True
+            flush()
+
+    producer = asyncio.create_task(produce())
+
+    try:
+        while True:
+            while chunks:
+                yield chunks.popleft()
+                has_space.set()
+
+            if finished:
+                if error is not None:
+                    raise error
+                return
+
+            ready = loop.create_future()
+            await ready
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        if flush_timer is not None:
+            flush_timer.cancel()
+
+        aclose = getattr(deltas, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def stream_fast_response(
+    start_event: Dict[str, Any],
+    deltas: AsyncIterator[str],
+    end_event: Dict[str, Any],
+    coalesce_delay: Optional[float] = 0.02,
+    coalesce_bytes: Optional[int] = 256,
+    encoder: Optional[SseFrameEncoder] = None
+) -> AsyncGenerator[bytes, None]:
+    encoder = encoder or SseFrameEncoder()
+
+    try:
+        yield encoder.encode(start_event)
+
+        async for text in coalesce_deltas(deltas, coalesce_delay, coalesce_bytes):
+            yield encoder.encode_text(text)
+
+        yield encoder.encode(end_event)
+
+    except asyncio.CancelledError:
+        logger.info("Stream cancelled by client")
+        raise
+
+    except Exception as e:
+        logger.exception("Exception while generating response stream: %s", e)
+        yield encoder.encode({
+            "type": "error",
+            "message": str(e),
+            "error_type": type(e).__name__,
+            "timestamp": datetime.now().isoformat(),
+        })
@@ -0,0 +1,97 @@
+import time
+import asyncio
+import argparse
+import statistics
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from app.application.services.agent_manager import AgentManager
+from app.domain.contants import DecisionAction, GuardMode
+from app.domain.exceptions import GuardialError
+
+class SimulatedAgentCore:
+    def __init__(self, first_token_delay: float, token_delay: float, tokens: int) -> None:
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.tokens = tokens
+        self.generated_tokens = 0
+
+    def format_user_input(self, message: str, additional_files: Optional[List[str]] = []) -> List[Dict[str, Any]]:
+        return [{"role": "user", "content": message}]
+
+    async def stream_chat(self, conversation_id: str, content: Any, agent_information: Tuple[str, str]) -> AsyncGenerator[str, None]:
+        await asyncio.sleep(self.first_token_delay)
+        for index in range(self.tokens):
+            if index:
+                await asyncio.sleep(self.token_delay)
+            self.generated_tokens += 1
+            yield " token"
+
+    async def chat(self, conversation_id: str, content: Any, agent_information: Tuple[str, str]) -> str:
+        await asyncio.sleep(self.first_token_delay + self.token_delay * (self.tokens - 1))
+        self.generated_tokens += self.tokens
+        return " token" * self.tokens
+
+class SimulatedContentSafety:
+    def __init__(self, delay: float, reject: bool) -> None:
+        self.delay = delay
+        self.reject = reject
+
+    async def analyze_text(self, text: str, blocklist_names: Optional[List[str]] = [],
+                           reject_thresholds: Optional[Dict[Any, int]] = None) -> None:
+        await asyncio.sleep(self.delay)
+
+    def make_decision(self, response: Any, reject_thresholds: Dict[Any, int]) -> Tuple[DecisionAction, Dict[str, str]]:
+        decision = DecisionAction.REJECT if self.reject else DecisionAction.ACCEPT
+        return decision, {"Hate": decision.value}
+
+async def run_stream(args: argparse.Namespace, guard_mode: GuardMode, reject: bool) -> Tuple[Optional[float], float, int]:
+    agent_core = SimulatedAgentCore(args.first_token_ms / 1000, args.token_ms / 1000, args.tokens)
+    agent_manager = AgentManager(agent_core, SimulatedContentSafety(args.safety_ms / 1000, reject))
+
+    first_token_ms = None
+    start_time = time.perf_counter()
+    try:
+        async for _ in agent_manager.generate_guarded_stream_content("hola", [], "bench", guard_mode):
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - start_time) * 1000
+    except GuardialError:
+        pass
+
+    return first_token_ms, (time.perf_counter() - start_time) * 1000, agent_core.generated_tokens
+
+async def run_chat(args: argparse.Namespace, guard_mode: GuardMode) -> float:
+    agent_core = SimulatedAgentCore(args.first_token_ms / 1000, args.token_ms / 1000, args.tokens)
+    agent_manager = AgentManager(agent_core, SimulatedContentSafety(args.safety_ms / 1000, False))
+
+    start_time = time.perf_counter()
+    await agent_manager.generate_guarded_content("hola", [], "bench", guard_mode)
+    return (time.perf_counter() - start_time) * 1000
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"safety={args.safety_ms}ms first_token={args.first_token_ms}ms "
+        f"token={args.token_ms}ms tokens={args.tokens} runs={args.runs}"
+    )
+
+    for guard_mode in GuardMode:
+        stream_results = [await run_stream(args, guard_mode, False) for _ in range(args.runs)]
+        chat_results = [await run_chat(args, guard_mode) for _ in range(args.runs)]
+        print(
+            f"{guard_mode.value:<11} stream ttft={statistics.median(r[0] for r in stream_results):.1f}ms "
+            f"total={statistics.median(r[1] for r in stream_results):.1f}ms "
+            f"chat={statistics.median(chat_results):.1f}ms"
+        )
+
+    for guard_mode in (GuardMode.SEQUENTIAL, GuardMode.OVERLAPPED):
+        _, rejected_ms, generated_tokens = await run_stream(args, guard_mode, True)
+        print(f"{guard_mode.value:<11} rejected after={rejected_ms:.1f}ms wasted_tokens={generated_tokens}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sequential versus overlapped content-safety checks")
+    parser.add_argument("--safety-ms", type=float, default=120)
+    parser.add_argument("--first-token-ms", type=float, default=400)
+    parser.add_argument("--token-ms", type=float, default=15)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=5)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,94 @@
+import os
+import time
+import asyncio
+import argparse
+import statistics
+from uuid import uuid4
+from typing import Dict, List
+
+from pymongo import AsyncMongoClient, monitoring
+from agent_framework import ChatMessage
+
+from app.infrastructure.contants import HistoryTrimStrategy
+from app.infrastructure.repository.mongo_db import MongoDbRepository
+from app.infrastructure.repository.mongo_message_store import MongoChatMessageStore
+
+IGNORED_COMMANDS = {"hello", "isMaster", "ismaster", "ping", "endSessions", "saslStart", "saslContinue"}
+
+class RoundTripCounter(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.round_trips = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in IGNORED_COMMANDS:
+            self.round_trips += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+async def run_strategy(
+    db_repository: MongoDbRepository, counter: RoundTripCounter, strategy: HistoryTrimStrategy,
+    turns: int, max_messages: int, messages_per_turn: int
+) -> Dict[str, float]:
+    store = MongoChatMessageStore(
+        db_repository=db_repository,
+        thread_id=f"bench-{strategy.value}-{uuid4()}",
+        max_messages=max_messages,
+        trim_strategy=strategy
+    )
+    store.history_cache = None
+
+    latencies: List[float] = []
+    round_trips: List[int] = []
+
+    for turn in range(turns):
+        messages = [ChatMessage(role="user", text=f"turn {turn} message {index}") for index in range(messages_per_turn)]
+
+        counter.round_trips = 0
+        start_time = time.perf_counter()
+        await store.add_messages(messages)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        round_trips.append(counter.round_trips)
+
+    stored_messages = await db_repository.count_items({"thread_id": store.thread_id})
+    await store.clear()
+
+    latencies.sort()
+    return {
+        "avg_round_trips": statistics.mean(round_trips),
+        "max_round_trips": max(round_trips),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "stored_messages": stored_messages
+    }
+
+async def main(args: argparse.Namespace) -> None:
+    counter = RoundTripCounter()
+    client = AsyncMongoClient(args.connection_string, event_listeners=[counter])
+    db_repository = MongoDbRepository(client, args.database, args.collection)
+
+    print(f"turns={args.turns} max_messages={args.max_messages} messages_per_turn={args.messages_per_turn}")
+    for strategy in HistoryTrimStrategy:
+        result = await run_strategy(
+            db_repository, counter, strategy, args.turns, args.max_messages, args.messages_per_turn
+        )
+        print(
+            f"{strategy.value:<16} round_trips(avg={result['avg_round_trips']:.2f}, max={result['max_round_trips']}) "
+            f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms stored={result['stored_messages']}"
+        )
+
+    await client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Mongo history trimming strategies")
+    parser.add_argument("--connection-string", default=os.getenv("MONGO_DB_CONNECTION_STRING", "mongodb://localhost:27017"))
+    parser.add_argument("--database", default="benchmarks")
+    parser.add_argument("--collection", default="conversations_trimming")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--max-messages", type=int, default=20)
+    parser.add_argument("--messages-per-turn", type=int, default=2)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,150 @@
+import io
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Set, Tuple
+
+import fitz
+from PIL import Image
+
+from app.domain.utils import parrallel_pdf_to_img
+from app.infrastructure.managers.render_pool_manager import RenderPoolManager, available_cpu_count
+
+def build_pdf(path: str, pages: int) -> None:
+    with fitz.open() as pdf:
+        for page_number in range(pages):
+            page = pdf.new_page()
+            page.insert_text((72, 72), f"Benchmark page {page_number + 1}", fontsize=24)
+            page.draw_rect(fitz.Rect(72, 120, 520, 700), color=(0, 0, 1), fill=(0.9, 0.9, 1))
+            page.insert_textbox(fitz.Rect(90, 140, 500, 680), "Lorem ipsum dolor sit amet. " * 60, fontsize=11)
+        pdf.save(path)
+
+def read_rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def read_children(pid: int) -> Set[int]:
+    children = set()
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as task_children:
+                children.update(int(child) for child in task_children.read().split())
+    except OSError:
+        pass
+    return children
+
+class RssSampler(threading.Thread):
+    def __init__(self, interval: float = 0.01) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_rss_kb = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            pids = {os.getpid()}
+            pending = list(pids)
+            while pending:
+                children = read_children(pending.pop())
+                pending.extend(children - pids)
+                pids.update(children)
+
+            self.peak_rss_kb = max(self.peak_rss_kb, sum(read_rss_kb(pid) for pid in pids))
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> int:
+        self._stopped.set()
+        self.join()
+        return self.peak_rss_kb
+
+def legacy_page_pdf_to_img(
+                source_pdf: str, page_number: int, output_directory: str,
+                output_file_path: str, format: str = 'jpg', dpi: int = 150
+            ) -> Tuple[int, str]:
+    os.makedirs(output_directory, exist_ok=True)
+    pdf = fitz.open(source_pdf)
+    pagina = pdf[page_number]
+
+    zoom = dpi / 72
+    pixmap = pagina.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+
+    img = Image.open(io.BytesIO(pixmap.tobytes("ppm")))
+    if format.lower() in ["jpg", "jpeg"]:
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGB")
+        img.save(output_file_path, "JPEG", quality=95)
+    else:
+        img.save(output_file_path, "PNG")
+
+    pdf.close()
+    return page_number, output_file_path
+
+def legacy_pdf_to_img(source_pdf: str, dpi: int, image_format: str, max_workers: int = 40) -> List[str]:
+    with fitz.open(source_pdf) as pdf:
+        total_pages = len(pdf)
+
+    output_directory = tempfile.mkdtemp(prefix="legacy-render-", dir=".")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                legacy_page_pdf_to_img, source_pdf, index, output_directory,
+                f"{output_directory}/page_{index}.{image_format}", image_format, dpi
+            )
+            for index in range(total_pages)
+        ]
+        results = sorted(future.result() for future in as_completed(futures))
+
+    return [path for _, path in results]
+
+def pooled_pdf_to_img(source_pdf: str, dpi: int, image_format: str) -> List[str]:
+    return parrallel_pdf_to_img(
+        source_pdf, dpi=dpi, image_format=image_format,
+        max_workers=RenderPoolManager.get_max_workers(), executor=RenderPoolManager.get_executor()
+    )
+
+def measure(render: Callable[[], List[str]], pages: int) -> str:
+    sampler = RssSampler()
+    sampler.start()
+    start_time = time.perf_counter()
+    images = render()
+    elapsed = time.perf_counter() - start_time
+    peak_rss_kb = sampler.stop()
+
+    shutil.rmtree(os.path.commonpath([os.path.abspath(image) for image in images]), ignore_errors=True)
+
+    return f"pages/s={pages / elapsed:8.1f} elapsed={elapsed:6.2f}s peak_rss={peak_rss_kb / 1024:7.1f}MB"
+
+def main(args: argparse.Namespace) -> None:
+    work_directory = tempfile.mkdtemp(prefix="pdf-bench-")
+    os.chdir(work_directory)
+    print(f"cpus={os.cpu_count()} available_cpus={available_cpu_count()} render_workers={RenderPoolManager.get_max_workers()} dpi={args.dpi} format={args.format}")
+
+    RenderPoolManager.get_executor().submit(os.getpid).result()
+    try:
+        for pages in args.pages:
+            source_pdf = os.path.join(work_directory, f"bench_{pages}.pdf")
+            build_pdf(source_pdf, pages)
+
+            print(f"{pages:>4} pages legacy  {measure(lambda: legacy_pdf_to_img(source_pdf, args.dpi, args.format), pages)}")
+            print(f"{pages:>4} pages pooled  {measure(lambda: pooled_pdf_to_img(source_pdf, args.dpi, args.format), pages)}")
+    finally:
+        RenderPoolManager.shutdown()
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-upload process pool versus persistent render pool")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--format", default="jpg")
+
+    main(parser.parse_args())
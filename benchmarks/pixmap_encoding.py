@@ -0,0 +1,96 @@
+import io
+import os
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from typing import Callable, Dict, Tuple
+
+import fitz
+from PIL import Image
+
+from app.domain.utils import render_pixmap, encode_pixmap
+
+def legacy_encode(page: fitz.Page, output_file_path: str, dpi: int, format: str, quality: int) -> None:
+    zoom = dpi / 72
+    pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    img = Image.open(io.BytesIO(pixmap.tobytes("ppm")))
+
+    if format in ["jpg", "jpeg"]:
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGB")
+        img.save(output_file_path, "JPEG", quality=quality)
+    else:
+        img.save(output_file_path, "PNG")
+
+def direct_encode(colorspace: str) -> Callable[[fitz.Page, str, int, str, int], None]:
+    def encode(page: fitz.Page, output_file_path: str, dpi: int, format: str, quality: int) -> None:
+        encode_pixmap(render_pixmap(page, dpi, colorspace), output_file_path, format, quality)
+    return encode
+
+SCENARIOS: Dict[str, Tuple[Callable, str]] = {
+    "legacy-jpg": (legacy_encode, "jpg"),
+    "legacy-png": (legacy_encode, "png"),
+    "direct-jpg": (direct_encode("rgb"), "jpg"),
+    "direct-png": (direct_encode("rgb"), "png"),
+    "direct-webp": (direct_encode("rgb"), "webp"),
+    "direct-jpg-gray": (direct_encode("gray"), "jpg"),
+}
+
+def build_pdf(path: str, pages: int) -> None:
+    with fitz.open() as pdf:
+        for page_number in range(pages):
+            page = pdf.new_page()
+            page.insert_text((72, 72), f"Benchmark page {page_number + 1}", fontsize=24)
+            page.draw_rect(fitz.Rect(72, 120, 520, 700), color=(0, 0, 1), fill=(0.9, 0.9, 1))
+            page.insert_textbox(fitz.Rect(90, 140, 500, 680), "Lorem ipsum dolor sit amet. " * 60, fontsize=11)
+        pdf.save(path)
+
+def run_scenario(name: str, source_pdf: str, output_directory: str, dpi: int, quality: int, results: multiprocessing.Queue) -> None:
+    encode, format = SCENARIOS[name]
+    base_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with fitz.open(source_pdf) as pdf:
+        start_time = time.perf_counter()
+        for page_number in range(len(pdf)):
+            encode(pdf[page_number], os.path.join(output_directory, f"{name}_{page_number}.{format}"), dpi, format, quality)
+        elapsed = time.perf_counter() - start_time
+        pages = len(pdf)
+
+    output_bytes = sum(
+        os.path.getsize(os.path.join(output_directory, file_name))
+        for file_name in os.listdir(output_directory) if file_name.startswith(f"{name}_")
+    )
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((elapsed / pages * 1000, peak_rss_kb - base_rss_kb, output_bytes / pages / 1024))
+
+def main(args: argparse.Namespace) -> None:
+    work_directory = tempfile.mkdtemp(prefix="pixmap-bench-")
+    source_pdf = os.path.join(work_directory, "bench.pdf")
+    build_pdf(source_pdf, args.pages)
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+
+    print(f"pages={args.pages} dpi={args.dpi} quality={args.quality}")
+    try:
+        for name in SCENARIOS:
+            process = context.Process(
+                target=run_scenario, args=(name, source_pdf, work_directory, args.dpi, args.quality, results)
+            )
+            process.start()
+            ms_per_page, rss_growth_kb, kb_per_page = results.get()
+            process.join()
+            print(f"{name:<16} {ms_per_page:7.2f}ms/page rss_growth={rss_growth_kb / 1024:6.1f}MB size={kb_per_page:7.1f}KB/page")
+    finally:
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PPM→PIL round trip versus direct pixmap encoding")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--quality", type=int, default=95)
+
+    main(parser.parse_args())
@@ -0,0 +1,64 @@
+import time
+import asyncio
+import argparse
+from typing import AsyncGenerator, Dict, List, Tuple
+
+from app.domain.conversation.conversation import (
+    StartStreamingResponse, DataStreamingResponse, EndStreamingResponse,
+    TypeStreamingResponseEnum
+)
+from app.presentation.streaming.sse import stream_response, stream_fast_response
+
+async def generate_tokens(total_tokens: int, token: str) -> AsyncGenerator[str, None]:
+    for _ in range(total_tokens):
+        yield token
+
+async def legacy_events(total_tokens: int, token: str) -> AsyncGenerator[Dict, None]:
+    yield StartStreamingResponse(agent="benchmark").model_dump()
+    async for chunk in generate_tokens(total_tokens, token):
+        yield DataStreamingResponse(type=TypeStreamingResponseEnum.DATA.value, text=chunk).model_dump()
+    yield EndStreamingResponse(type=TypeStreamingResponseEnum.END.value).model_dump()
+
+async def consume(frames: AsyncGenerator) -> Tuple[float, int, int]:
+    writes = 0
+    written_bytes = 0
+    start_time = time.process_time()
+
+    async for frame in frames:
+        writes += 1
+        written_bytes += len(frame)
+
+    return time.process_time() - start_time, writes, written_bytes
+
+async def main(args: argparse.Namespace) -> None:
+    start_event = StartStreamingResponse(agent="benchmark").model_dump()
+    end_event = EndStreamingResponse(type=TypeStreamingResponseEnum.END.value).model_dump()
+
+    scenarios: List[Tuple[str, AsyncGenerator]] = [
+        ("legacy", stream_response(legacy_events(args.tokens, args.token))),
+        ("fast", stream_fast_response(
+            start_event, generate_tokens(args.tokens, args.token), end_event,
+            coalesce_delay=0, coalesce_bytes=0
+        )),
+        ("fast+coalesce", stream_fast_response(
+            start_event, generate_tokens(args.tokens, args.token), end_event,
+            coalesce_delay=args.coalesce_ms / 1000, coalesce_bytes=args.coalesce_bytes
+        )),
+    ]
+
+    print(f"tokens={args.tokens} token={args.token!r}")
+    for name, frames in scenarios:
+        cpu_time, writes, written_bytes = await consume(frames)
+        print(
+            f"{name:<14} cpu/token={cpu_time / args.tokens * 1e6:.2f}us "
+            f"writes={writes} bytes={written_bytes}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-token CPU cost of the SSE streaming paths")
+    parser.add_argument("--tokens", type=int, default=50000)
+    parser.add_argument("--token", default=" palabra")
+    parser.add_argument("--coalesce-ms", type=float, default=20)
+    parser.add_argument("--coalesce-bytes", type=int, default=256)
+
+    asyncio.run(main(parser.parse_args()))
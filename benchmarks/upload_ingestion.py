@@ -0,0 +1,66 @@
+import os
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+from typing import Awaitable, Callable, List
+
+from starlette.datastructures import UploadFile
+
+from app.infrastructure.repository.document_manager import DocumentManagerRepository
+
+async def legacy_save(file: UploadFile, upload_folder: str) -> None:
+    local_file_path = f"{upload_folder}/{file.filename}"
+    try:
+        with open(local_file_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+    finally:
+        await file.close()
+
+async def chunked_save(file: UploadFile, upload_folder: str) -> None:
+    await DocumentManagerRepository().save_document_locally(file, upload_folder)
+
+def build_upload(size_mb: int) -> UploadFile:
+    spooled_file = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    block = os.urandom(1024 * 1024)
+    for _ in range(size_mb):
+        spooled_file.write(block)
+    spooled_file.seek(0)
+    return UploadFile(spooled_file, filename="bench.bin", size=size_mb * 1024 * 1024)
+
+async def measure_loop_lag(stopped: asyncio.Event, interval: float, lags: List[float]) -> None:
+    while not stopped.is_set():
+        start_time = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start_time - interval) * 1000)
+
+async def measure(save: Callable[[UploadFile, str], Awaitable[None]], size_mb: int, upload_folder: str) -> str:
+    upload = build_upload(size_mb)
+    stopped = asyncio.Event()
+    lags: List[float] = []
+    ticker = asyncio.create_task(measure_loop_lag(stopped, 0.005, lags))
+    await asyncio.sleep(0.05)
+
+    start_time = time.perf_counter()
+    await save(upload, upload_folder)
+    elapsed = time.perf_counter() - start_time
+
+    stopped.set()
+    await ticker
+    return f"elapsed={elapsed * 1000:8.1f}ms throughput={size_mb / elapsed:7.1f}MB/s max_loop_lag={max(lags):7.1f}ms"
+
+async def main(args: argparse.Namespace) -> None:
+    upload_folder = tempfile.mkdtemp(prefix="ingestion-bench-")
+    try:
+        for size_mb in args.sizes:
+            print(f"{size_mb:>5}MB legacy   {await measure(legacy_save, size_mb, upload_folder)}")
+            print(f"{size_mb:>5}MB chunked  {await measure(chunked_save, size_mb, upload_folder)}")
+    finally:
+        shutil.rmtree(upload_folder, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Blocking copyfileobj versus chunked, hashed ingestion")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+
+    asyncio.run(main(parser.parse_args()))
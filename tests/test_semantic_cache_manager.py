@@ -0,0 +1,85 @@
+from app.application.services.semantic_cache_manager import SemanticCacheManager
+from app.infrastructure.repository.hashing_embedding import HashingEmbeddingRepository
+from app.infrastructure.repository.memory_vector_index import MemoryVectorIndexRepository
+
+
+class VersionProvider:
+    def __init__(self, version: str = "v1") -> None:
+        self.version = version
+
+    async def __call__(self) -> str:
+        return self.version
+
+
+class AnswerFactory:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, answer: str):
+        async def factory() -> str:
+            self.calls.append(answer)
+            return answer
+        return factory
+
+
+async def replay(answer: str) -> str:
+    return f"replayed:{answer}"
+
+
+def build_cache(version_provider: VersionProvider, similarity_threshold: float = 0.9) -> SemanticCacheManager:
+    return SemanticCacheManager(
+        HashingEmbeddingRepository(256),
+        MemoryVectorIndexRepository(64),
+        version_provider,
+        similarity_threshold=similarity_threshold,
+        version_refresh_seconds=0.0
+    )
+
+
+async def test_similar_question_above_threshold_is_a_hit():
+    cache, factory = build_cache(VersionProvider()), AnswerFactory()
+
+    first = await cache.get_or_generate("¿Cuál es el horario de atención?", factory("horario"), replay)
+    second = await cache.get_or_generate("  ¿CUÁL es el horario  de atención? ", factory("otro"), replay)
+
+    assert first == "horario"
+    assert second == "replayed:horario"
+    assert factory.calls == ["horario"]
+
+
+async def test_question_below_threshold_is_a_miss():
+    cache, factory = build_cache(VersionProvider()), AnswerFactory()
+
+    await cache.get_or_generate("¿Cuál es el horario de atención?", factory("horario"), replay)
+    answer = await cache.get_or_generate("¿Cómo solicito una devolución de un pedido?", factory("devolucion"), replay)
+
+    assert answer == "devolucion"
+    assert factory.calls == ["horario", "devolucion"]
+
+
+async def test_closest_entry_wins_over_newer_entry():
+    cache, factory = build_cache(VersionProvider(), similarity_threshold=0.99), AnswerFactory()
+
+    await cache.get_or_generate("¿Cuál es el horario de atención de la tienda?", factory("exacta"), replay)
+    await cache.get_or_generate("¿Cuál es el horario de la tienda los domingos?", factory("parafrasis"), replay)
+    assert factory.calls == ["exacta", "parafrasis"]
+
+    cache.similarity_threshold = 0.5
+    answer = await cache.get_or_generate("¿Cuál es el horario de atención de la tienda?", factory("nueva"), replay)
+
+    assert answer == "replayed:exacta"
+
+
+async def test_vector_store_version_change_clears_cache():
+    version_provider = VersionProvider("v1")
+    cache, factory = build_cache(version_provider), AnswerFactory()
+
+    await cache.get_or_generate("¿Cuál es el horario de atención?", factory("horario"), replay)
+    assert len(cache.index) == 1
+
+    version_provider.version = "v2"
+    answer = await cache.get_or_generate("¿Cuál es el horario de atención?", factory("horario v2"), replay)
+
+    assert answer == "horario v2"
+    assert factory.calls == ["horario", "horario v2"]
+    assert len(cache.index) == 1